@@ -1,2 +1,2 @@
-from ._monitor import store
+from ._monitor import store, finalize
 from ._emulate import microphysics
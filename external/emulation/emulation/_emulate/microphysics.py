@@ -1,5 +1,6 @@
 import sys
-from typing import Mapping
+import time
+from typing import Callable, Iterator, Mapping, MutableMapping, Optional
 from .._typing import FortranState
 
 # Tensorflow looks at sys args which are not initialized
@@ -10,6 +11,7 @@ if not hasattr(sys, "argv"):
 
 import f90nml  # noqa: E402
 import logging  # noqa: E402
+import numpy as np  # noqa: E402
 import os  # noqa: E402
 import tensorflow as tf  # noqa: E402
 
@@ -78,6 +80,29 @@ def _load_tf_model(model_path: str) -> tf.keras.Model:
             )
 
 
+def _column_chunks(n_columns: int, chunk_size: Optional[int]) -> Iterator[slice]:
+    chunk_size = chunk_size or n_columns
+    for start in range(0, n_columns, chunk_size):
+        yield slice(start, start + chunk_size)
+
+
+def _predict_function(
+    model: tf.keras.Model, inputs: Mapping[str, np.ndarray]
+) -> Callable[[Mapping[str, np.ndarray]], Mapping[str, tf.Tensor]]:
+    """Trace model once for [sample, feature] inputs of any number of samples
+    with the feature shapes and dtypes of inputs"""
+    signature = {
+        name: tf.TensorSpec((None,) + array.shape[1:], tf.as_dtype(array.dtype))
+        for name, array in inputs.items()
+    }
+
+    @tf.function(input_signature=[signature])
+    def predict(x):
+        return model(x, training=False)
+
+    return predict
+
+
 class MicrophysicsHook:
     """
     Singleton class for configuring from the environment for
@@ -87,13 +112,16 @@ class MicrophysicsHook:
     Instanced at the top level of `_emulate`
     """
 
-    def __init__(self, model_path: str) -> None:
+    def __init__(self, model_path: str, chunk_size: Optional[int] = None) -> None:
 
         self.name = "microphysics emulator"
         self.model = _load_tf_model(model_path)
         self.namelist = _load_nml()
         self.dt_sec = _get_timestep(self.namelist)
         self.orig_outputs = None
+        self.chunk_size = chunk_size
+        self._predict = None
+        self.last_inference_seconds: Optional[float] = None
 
     @classmethod
     def from_environ(cls, d: Mapping):
@@ -103,12 +131,42 @@ class MicrophysicsHook:
 
         Args:
             d: Mapping with key "TF_MODEL_PATH" pointing to a loadable
-                keras model.  Can be local or remote.
+                keras model.  Can be local or remote.  The optional key
+                "TF_CHUNK_SIZE" sets the number of columns predicted
+                at once, which defaults to all columns of the rank.
         """
 
         model_path = d["TF_MODEL_PATH"]
-
-        return cls(model_path)
+        chunk_size = d.get("TF_CHUNK_SIZE")
+
+        return cls(model_path, chunk_size=int(chunk_size) if chunk_size else None)
+
+    def _predict_columns(
+        self, inputs: Mapping[str, np.ndarray]
+    ) -> Mapping[str, np.ndarray]:
+        """Predict [sample, feature] inputs chunk by chunk, writing outputs
+        to arrays allocated in [feature, sample] Fortran order"""
+        if not inputs:
+            return {}
+
+        if self._predict is None:
+            self._predict = _predict_function(self.model, inputs)
+
+        n_columns = len(next(iter(inputs.values())))
+        outputs: MutableMapping[str, np.ndarray] = {}
+        for chunk in _column_chunks(n_columns, self.chunk_size):
+            predictions = self._predict(
+                {name: array[chunk] for name, array in inputs.items()}
+            )
+            for name, tensor in predictions.items():
+                if name not in outputs:
+                    outputs[name] = np.empty(
+                        tensor.shape[1:][::-1] + (n_columns,),
+                        dtype=tensor.dtype.as_numpy_dtype,
+                        order="F",
+                    )
+                outputs[name].T[chunk] = tensor.numpy()
+        return outputs
 
     def microphysics(self, state: FortranState) -> None:
         """
@@ -126,9 +184,10 @@ class MicrophysicsHook:
         # switch state to model-expected [sample, feature]
         inputs = {name: state[name].T for name in self.model.input_names}
 
-        predictions = self.model.predict(inputs)
-        # tranpose back to FV3 conventions
-        model_outputs = {name: tensor.T for name, tensor in predictions.items()}
+        start = time.perf_counter()
+        model_outputs = self._predict_columns(inputs)
+        self.last_inference_seconds = time.perf_counter() - start
+        logger.debug(f"{self.name} inference took {self.last_inference_seconds:.4f} s")
 
         # fields stay in global state so check overwrites on first step
         if self.orig_outputs is None:
@@ -6,6 +6,7 @@ from .monitor import StorageHook
 try:
     _config = StorageHook.from_environ(os.environ)
     store = _config.store
+    finalize = _config.finalize
 except (KeyError, FileNotFoundError) as e:
     _config = None
 
@@ -13,3 +14,6 @@ except (KeyError, FileNotFoundError) as e:
 
     def store(state):
         raise ImportError(error)
+
+    def finalize(state=None):
+        raise ImportError(error)
@@ -1,7 +1,12 @@
+import atexit
 import logging
 import os
 import json
-from typing import Mapping
+import queue
+import threading
+import time
+import traceback
+from typing import Any, Callable, Mapping, Optional
 import cftime
 import f90nml
 import yaml
@@ -61,12 +66,12 @@ def _load_metadata(path: str):
 
 
 @print_errors
-def _load_monitor(namelist):
+def _load_monitor(namelist, comm):
 
     partitioner = CubedSpherePartitioner.from_namelist(namelist)
 
     output_zarr = os.path.join(os.getcwd(), "state_output.zarr")
-    output_monitor = ZarrMonitor(output_zarr, partitioner, mpi_comm=MPI.COMM_WORLD)
+    output_monitor = ZarrMonitor(output_zarr, partitioner, mpi_comm=comm)
     logger.info(f"Initialized zarr monitor at: {output_zarr}")
     return output_monitor
 
@@ -154,12 +159,11 @@ def _create_nc_path():
     return nc_dump_path
 
 
-def _store_netcdf(state, time, nc_dump_path, metadata):
+def _store_netcdf(state, time, nc_dump_path, metadata, rank):
 
     logger.debug(f"Model fields: {list(state.keys())}")
-    logger.info(f"Storing state to netcdf on rank {MPI.COMM_WORLD.Get_rank()}")
+    logger.info(f"Storing state to netcdf on rank {rank}")
     ds = _convert_to_xr_dataset(state, metadata)
-    rank = MPI.COMM_WORLD.Get_rank()
     coords = {"time": time, "tile": rank}
     ds = ds.assign_coords(coords)
     filename = f"state_{time.strftime(TIME_FMT)}_{rank}.nc"
@@ -176,6 +180,72 @@ def _store_zarr(state, time, monitor, metadata):
     monitor.store(state)
 
 
+def _convert_for_zarr(state, time, metadata, converted: queue.Queue):
+    """Put the quantities to store for state, or the error raised converting
+    them, on the converted queue"""
+    try:
+        quantities = _convert_to_quantities(state, metadata)
+        quantities["time"] = time
+        converted.put(quantities)
+    except Exception as e:
+        converted.put(e)
+
+
+class _BackgroundWriter:
+    """
+    Call storage functions in submission order on a daemon thread
+
+    At most ``maxsize`` calls wait in the queue, beyond which ``submit``
+    blocks.  An exception raised by a call is re-raised by the next
+    ``submit`` or ``flush``.
+    """
+
+    def __init__(self, maxsize: int):
+        self._queue: queue.Queue = queue.Queue(maxsize)
+        self._error: Optional[Exception] = None
+        self.last_write_seconds: Optional[float] = None
+        self._thread = threading.Thread(
+            target=self._run, name="emulation-storage", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def _run(self):
+        while True:
+            func, args = self._queue.get()
+            try:
+                start = time.perf_counter()
+                func(*args)
+                self.last_write_seconds = time.perf_counter() - start
+                logger.info(
+                    f"{func.__name__} took {self.last_write_seconds:.3f} s, "
+                    f"{self.queue_depth} writes pending"
+                )
+            except Exception as e:
+                logger.error(traceback.format_exc())
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+    def _raise_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def submit(self, func: Callable[..., Any], *args):
+        self._raise_error()
+        self._queue.put((func, args))
+        logger.debug(f"Storage queue depth: {self.queue_depth}")
+
+    def flush(self):
+        """Wait for all submitted writes to finish"""
+        self._queue.join()
+        self._raise_error()
+
+
 class StorageHook:
     """
     Singleton class for configuring from the environment for
@@ -190,12 +260,30 @@ class StorageHook:
         output_freq_sec: int,
         save_nc: bool = True,
         save_zarr: bool = True,
+        queue_size: int = 2,
     ):
         self.name = "emulation storage monitor"
         self.var_meta_path = var_meta_path
         self.output_freq_sec = output_freq_sec
         self.save_nc = save_nc
         self.save_zarr = save_zarr
+        # the monitor's collectives may run on the background thread, so they
+        # get their own communicator to not interleave with the model's
+        self.comm = MPI.COMM_WORLD.Dup()
+        self.rank = self.comm.Get_rank()
+
+        self.writer = _BackgroundWriter(queue_size)
+        self._finalized = False
+        # finalize should be called by the model before MPI_Finalize, this is
+        # a fallback for when it is not
+        atexit.register(self._flush_at_exit)
+        # ZarrMonitor communicates over MPI, which only another thread than
+        # the model's may do if MPI was initialized with full thread support.
+        # Otherwise states are converted in the background, and stored by the
+        # model's thread on the next call to store or flush
+        self.zarr_in_background = MPI.Query_thread() == MPI.THREAD_MULTIPLE
+        self._zarr_converted: queue.Queue = queue.Queue()
+        self._zarr_pending = 0
 
         self.namelist = _load_nml()
 
@@ -204,7 +292,12 @@ class StorageHook:
         self.metadata = _load_metadata(self.var_meta_path)
 
         if self.save_zarr:
-            self.monitor = _load_monitor(self.namelist)
+            self.monitor = _load_monitor(self.namelist, self.comm)
+            if not self.zarr_in_background:
+                logger.warning(
+                    "MPI does not support MPI_THREAD_MULTIPLE, so zarr output is "
+                    "written by the model's thread at the following store call."
+                )
         else:
             self.monitor = None
 
@@ -228,6 +321,9 @@ class StorageHook:
                     is true
                 SAVE_ZARR (optional) - save all statefields to zarr, default
                     is true
+                STORE_QUEUE_SIZE (optional) - number of stored states waiting
+                    to be written before storage blocks the model, default
+                    is 2
                 
         """
 
@@ -238,8 +334,15 @@ class StorageHook:
         var_meta_path = str(d.get("VAR_META_PATH", None))
         save_nc = _bool_from_str(d.get("SAVE_NC", "True"))
         save_zarr = _bool_from_str(d.get("SAVE_ZARR", "True"))
-
-        return cls(var_meta_path, output_freq_sec, save_nc=save_nc, save_zarr=save_zarr)
+        queue_size = int(d.get("STORE_QUEUE_SIZE", 2))
+
+        return cls(
+            var_meta_path,
+            output_freq_sec,
+            save_nc=save_nc,
+            save_zarr=save_zarr,
+            queue_size=queue_size,
+        )
 
     def _store_interval_check(self, time):
 
@@ -263,6 +366,11 @@ class StorageHook:
         for each storage call.  All other variables are expected to
         correspond to DIMS_MAP after a transpose.
 
+        The state is copied and written by a background thread, see
+        ``flush``. Without MPI_THREAD_MULTIPLE support, the zarr output of a
+        state is converted in the background but stored collectively by the
+        next call to ``store`` or ``flush``.
+
         Args:
             state: Fortran state fields
         """
@@ -270,6 +378,9 @@ class StorageHook:
         state = dict(**state)
         time = _translate_time(state.pop("model_time"))
 
+        # every rank stores the same states in order, as ZarrMonitor requires
+        self._store_converted_zarr()
+
         if self.initial_time is None:
             self.initial_time = time
 
@@ -279,8 +390,65 @@ class StorageHook:
                 f"Store flags: save_zarr={self.save_zarr}, save_nc={self.save_nc}"
             )
 
+            # Fortran reuses the state arrays after this call returns, so the
+            # snapshot cannot wait for the background thread. Both outputs are
+            # float32, so copy to that directly.
+            state = {
+                key: np.array(value, dtype=np.float32) for key, value in state.items()
+            }
+
             if self.save_zarr:
-                _store_zarr(state, time, self.monitor, self.metadata)
+                if self.zarr_in_background:
+                    self.writer.submit(
+                        _store_zarr, state, time, self.monitor, self.metadata
+                    )
+                else:
+                    self.writer.submit(
+                        _convert_for_zarr,
+                        state,
+                        time,
+                        self.metadata,
+                        self._zarr_converted,
+                    )
+                    self._zarr_pending += 1
 
             if self.save_nc:
-                _store_netcdf(state, time, self.nc_dump_path, self.metadata)
+                self.writer.submit(
+                    _store_netcdf,
+                    state,
+                    time,
+                    self.nc_dump_path,
+                    self.metadata,
+                    self.rank,
+                )
+
+    def _store_converted_zarr(self):
+        while self._zarr_pending > 0:
+            quantities = self._zarr_converted.get()
+            self._zarr_pending -= 1
+            if isinstance(quantities, Exception):
+                raise quantities
+            logger.info(f"Storing zarr model state on rank {self.rank}")
+            self.monitor.store(quantities)
+
+    def flush(self) -> None:
+        """Wait for all stored states to be written"""
+        self._store_converted_zarr()
+        self.writer.flush()
+
+    def finalize(self, state: Optional[FortranState] = None) -> None:
+        """
+        Hook function for writing all stored states at the end of a run, to
+        be called by call_py_fort before MPI is finalized. The state is
+        unused.
+        """
+        self.flush()
+        self._finalized = True
+
+    def _flush_at_exit(self):
+        if not self._finalized:
+            logger.warning(
+                "The storage hook was not finalized by the model, flushing at "
+                "interpreter exit."
+            )
+            self.finalize()
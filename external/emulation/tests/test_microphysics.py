@@ -67,3 +67,18 @@ def test_microphysics_NoModel(dummy_rundir):
     hook.microphysics(state)
 
     assert state == {"empty_state": 1}
+
+
+@pytest.mark.parametrize("chunk_size", [None, 7, 100, 1000])
+def test_microphysics_column_chunks(saved_model_path, dummy_rundir, chunk_size):
+
+    hook = MicrophysicsHook(saved_model_path, chunk_size=chunk_size)
+    input = np.asfortranarray(np.random.uniform(size=(63, 100)))
+    state = {"air_temperature_input": input}
+
+    hook.microphysics(state)
+
+    output = state["air_temperature_dummy"]
+    assert np.isfortran(output)
+    np.testing.assert_array_almost_equal(output, input + 1)
+    assert hook.last_inference_seconds > 0
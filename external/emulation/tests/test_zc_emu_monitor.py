@@ -1,4 +1,5 @@
 import os
+import threading
 import pytest
 import numpy as np
 from xarray import DataArray
@@ -8,6 +9,7 @@ from fv3gfs.util import Quantity
 
 from emulation._monitor.monitor import (
     StorageHook,
+    _BackgroundWriter,
     _bool_from_str,
     _load_nml,
     _get_timestep,
@@ -162,12 +164,100 @@ def test_Config_integration(dummy_rundir, save_nc, save_zarr):
     }
 
     config.store(state)
+    config.flush()
 
     assert (dummy_rundir / "state_output.zarr").exists() == save_zarr
     nc_files = list((dummy_rundir / "netcdf_output").glob("*.nc"))
     assert len(nc_files) == save_nc
 
 
+def test_StorageHook_finalize(dummy_rundir, caplog):
+
+    meta_path = dummy_rundir / "var_metadata.yaml"
+    save_var_metadata(meta_path)
+    config = StorageHook(meta_path, 900, save_nc=True, save_zarr=True)
+
+    state = {
+        "model_time": [2016, 10, 8, None, 0, 0],
+        "air_temperature": np.arange(790).reshape(10, 79),
+    }
+
+    config.store(state)
+    config.finalize({})
+
+    assert (dummy_rundir / "state_output.zarr").exists()
+    assert len(list((dummy_rundir / "netcdf_output").glob("*.nc"))) == 1
+
+    # the exit fallback does nothing once finalized
+    config._flush_at_exit()
+    assert "not finalized" not in caplog.text
+
+
+def test__BackgroundWriter_calls_in_submission_order():
+
+    writer = _BackgroundWriter(maxsize=2)
+    calls = []
+    for i in range(5):
+        writer.submit(calls.append, i)
+    writer.flush()
+
+    assert calls == list(range(5))
+    assert writer.queue_depth == 0
+    assert writer.last_write_seconds is not None
+
+
+def test__BackgroundWriter_queue_is_bounded():
+
+    writer = _BackgroundWriter(maxsize=1)
+    started, release = threading.Event(), threading.Event()
+
+    def block():
+        started.set()
+        release.wait()
+
+    writer.submit(block)
+    started.wait()
+    writer.submit(lambda: None)
+    assert writer.queue_depth == 1
+
+    submitted = threading.Event()
+
+    def submit():
+        writer.submit(lambda: None)
+        submitted.set()
+
+    thread = threading.Thread(target=submit)
+    thread.start()
+    # the queue is full, so submitting waits for the blocked write
+    assert not submitted.wait(timeout=0.1)
+
+    release.set()
+    thread.join()
+    writer.flush()
+    assert writer.queue_depth == 0
+
+
+@pytest.mark.parametrize("reraised_by", ["submit", "flush"])
+def test__BackgroundWriter_reraises_error(reraised_by):
+
+    writer = _BackgroundWriter(maxsize=2)
+
+    def fail():
+        raise ValueError("write failed")
+
+    writer.submit(fail)
+    writer._queue.join()
+
+    with pytest.raises(ValueError, match="write failed"):
+        if reraised_by == "submit":
+            writer.submit(lambda: None)
+        else:
+            writer.flush()
+
+    # the error is only raised once
+    writer.flush()
+
+
 def test_error_on_call():
 
     with pytest.raises(ImportError):
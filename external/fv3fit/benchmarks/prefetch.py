@@ -0,0 +1,109 @@
+"""
+Benchmark the training throughput of a dense keras model on CPU when batches
+are loaded with the threaded and the process-based pre-loaders.
+
+Synthetic unstacked batches are stacked, shuffled and packed into arrays by the
+same sequences used by fv3fit.keras.DenseModel.
+
+Usage::
+
+    python benchmarks/prefetch.py --n-batches 32 --workers 8
+
+Pass --no-fit to measure the loading throughput alone.
+"""
+import argparse
+import time
+
+import numpy as np
+import tensorflow as tf
+import xarray as xr
+
+from fv3fit._shared import ArrayPacker, StackedBatches, SAMPLE_DIM_NAME
+from fv3fit.keras._models.shared import (
+    ThreadedSequencePreLoader,
+    ProcessSequencePreLoader,
+    XyArraySequence,
+)
+
+
+INPUTS = ["air_temperature", "specific_humidity"]
+OUTPUTS = ["dQ1", "dQ2"]
+
+
+class SyntheticBatches:
+    def __init__(self, n_batches: int, n_times: int, resolution: int, n_z: int):
+        self._n_batches = n_batches
+        self._shape = (n_times, 6, n_z, resolution, resolution)
+
+    def __len__(self):
+        return self._n_batches
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        rng = np.random.default_rng(idx)
+        dims = ["time", "tile", "z", "y", "x"]
+        return xr.Dataset(
+            {
+                name: (dims, rng.normal(size=self._shape).astype(np.float32))
+                for name in INPUTS + OUTPUTS
+            }
+        )
+
+
+def _model(n_features_in: int, n_features_out: int) -> tf.keras.Model:
+    inputs = tf.keras.Input(n_features_in)
+    x = tf.keras.layers.Dense(128, activation="relu")(inputs)
+    x = tf.keras.layers.Dense(128, activation="relu")(x)
+    outputs = tf.keras.layers.Dense(n_features_out)(x)
+    model = tf.keras.Model(inputs=inputs, outputs=outputs)
+    model.compile(optimizer="adam", loss="mse")
+    return model
+
+
+def _run(loader, model, batch_size):
+    start = time.perf_counter()
+    n_batches = 0
+    for X, y in loader:
+        if model is not None:
+            model.fit(X, y, batch_size=batch_size, verbose=0)
+        n_batches += 1
+    return n_batches / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-batches", type=int, default=32)
+    parser.add_argument("--n-times", type=int, default=2)
+    parser.add_argument("--resolution", type=int, default=48)
+    parser.add_argument("--n-z", type=int, default=79)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--max-queue-size", type=int, default=8)
+    parser.add_argument("--batch-size", type=int, default=512)
+    parser.add_argument("--no-fit", action="store_true")
+    args = parser.parse_args()
+
+    batches = SyntheticBatches(args.n_batches, args.n_times, args.resolution, args.n_z)
+    stacked = StackedBatches(batches, np.random.RandomState(0))
+    X_packer = ArrayPacker(SAMPLE_DIM_NAME, INPUTS)
+    y_packer = ArrayPacker(SAMPLE_DIM_NAME, OUTPUTS)
+    Xy = XyArraySequence(X_packer, y_packer, stacked)
+    X, y = Xy[0]
+    model = None if args.no_fit else _model(X.shape[-1], y.shape[-1])
+
+    loaders = {
+        "serial": Xy,
+        "threads": ThreadedSequencePreLoader(
+            Xy, num_workers=args.workers, max_queue_size=args.max_queue_size
+        ),
+        "processes": ProcessSequencePreLoader(
+            Xy, num_workers=args.workers, max_queue_size=args.max_queue_size, seed=0
+        ),
+    }
+    print(f"{'loader':<12} {'batches/s':>10}")
+    for label, loader in loaders.items():
+        print(f"{label:<12} {_run(loader, model, args.batch_size):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
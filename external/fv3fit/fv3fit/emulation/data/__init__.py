@@ -3,3 +3,4 @@ from . import transforms
 from .load import nc_files_to_tf_dataset, nc_dir_to_tf_dataset, batches_to_tf_dataset
 from .io import get_nc_files
 from .dict_dataset import netcdf_url_to_dataset
+from .records import nc_dir_to_records, records_to_tf_dataset
@@ -3,7 +3,7 @@ import numpy as np
 import tensorflow as tf
 import xarray as xr
 from toolz.functoolz import compose_left
-from typing import Callable, Optional, Sequence
+from typing import Callable, Optional, Sequence, Union
 
 from .config import TransformConfig
 from .transforms import open_netcdf_dataset
@@ -13,7 +13,12 @@ from .io import get_nc_files
 logger = logging.getLogger(__name__)
 
 
-def _seq_to_tf_dataset(source: Sequence, transform: Callable,) -> tf.data.Dataset:
+def _seq_to_tf_dataset(
+    source: Sequence,
+    transform: Callable,
+    num_parallel: int = 1,
+    cache: Union[bool, str] = False,
+) -> tf.data.Dataset:
     """
     A general function to convert from a sequence into a tensorflow dataset
     to be used for ML model training.
@@ -23,24 +28,52 @@ def _seq_to_tf_dataset(source: Sequence, transform: Callable,) -> tf.data.Datase
             dataset.
         transform: function to process data items into a tensor-compatible
             result
+        num_parallel: Number of generators transforming interleaved shards
+            of source in parallel.  The samples of each shard are
+            interleaved one at a time in a deterministic order.
+        cache: Cache the transformed samples in memory if True, or in files
+            with this path prefix if a string, so only the first epoch
+            reads and transforms the source.
     """
 
-    def get_generator():
-        for batch in source:
-            output = transform(batch)
+    def get_generator(shard=0):
+        for i in range(shard, len(source), num_parallel):
+            output = transform(source[i])
             yield tf.data.Dataset.from_tensor_slices(output)
 
     peeked = next(get_generator())
     signature = tf.data.DatasetSpec.from_value(peeked)
-    tf_ds = tf.data.Dataset.from_generator(get_generator, output_signature=signature)
 
-    # Flat map goes from generating tf_dataset -> generating tensors
-    tf_ds = tf_ds.prefetch(tf.data.AUTOTUNE).flat_map(lambda x: x)
+    def shard_dataset(shard):
+        return tf.data.Dataset.from_generator(
+            get_generator, args=(shard,), output_signature=signature
+        )
+
+    if num_parallel > 1:
+        tf_ds = tf.data.Dataset.range(num_parallel).interleave(
+            lambda shard: shard_dataset(shard).flat_map(lambda x: x),
+            cycle_length=num_parallel,
+            num_parallel_calls=num_parallel,
+            deterministic=True,
+        )
+    else:
+        # Flat map goes from generating tf_dataset -> generating tensors
+        tf_ds = shard_dataset(0).prefetch(tf.data.AUTOTUNE).flat_map(lambda x: x)
+
+    if cache is True:
+        tf_ds = tf_ds.cache()
+    elif cache:
+        tf_ds = tf_ds.cache(cache)
 
     return tf_ds
 
 
-def nc_files_to_tf_dataset(files: Sequence[str], config: TransformConfig):
+def nc_files_to_tf_dataset(
+    files: Sequence[str],
+    config: TransformConfig,
+    num_parallel: int = 1,
+    cache: Union[bool, str] = False,
+):
 
     """
     Convert a list of netCDF paths into a tensorflow dataset.
@@ -50,11 +83,14 @@ def nc_files_to_tf_dataset(files: Sequence[str], config: TransformConfig):
             Expected to be 2D ([sample, feature]) or 1D ([sample]) dimensions.
         config: Data preprocessing options for going from xr.Dataset to
             X, y tensor tuples grouped by variable.
+        num_parallel: Number of files opened and transformed in parallel
+        cache: Cache transformed samples in memory if True, or in files
+            with this path prefix if a string
     """
 
     transform = compose_left(*[open_netcdf_dataset, config])
 
-    return _seq_to_tf_dataset(files, transform)
+    return _seq_to_tf_dataset(files, transform, num_parallel=num_parallel, cache=cache)
 
 
 def nc_dir_to_tf_dataset(
@@ -63,6 +99,8 @@ def nc_dir_to_tf_dataset(
     nfiles: Optional[int] = None,
     shuffle: bool = False,
     random_state: Optional[np.random.RandomState] = None,
+    num_parallel: int = 1,
+    cache: Union[bool, str] = False,
 ) -> tf.data.Dataset:
     """
     Convert a directory of netCDF files into a tensorflow dataset.
@@ -75,6 +113,9 @@ def nc_dir_to_tf_dataset(
         nfiles: Limit to number of files
         shuffle: Randomly order the file ingestion into the dataset
         random_state: numpy random number generator for seeded shuffle
+        num_parallel: Number of files opened and transformed in parallel
+        cache: Cache transformed samples in memory if True, or in files
+            with this path prefix if a string
     """
 
     files = get_nc_files(nc_dir)
@@ -88,10 +129,15 @@ def nc_dir_to_tf_dataset(
     if nfiles is not None:
         files = files[:nfiles]
 
-    return nc_files_to_tf_dataset(files, config)
+    return nc_files_to_tf_dataset(files, config, num_parallel=num_parallel, cache=cache)
 
 
-def batches_to_tf_dataset(batches: Sequence[xr.Dataset], config: TransformConfig):
+def batches_to_tf_dataset(
+    batches: Sequence[xr.Dataset],
+    config: TransformConfig,
+    num_parallel: int = 1,
+    cache: Union[bool, str] = False,
+):
 
     """
     Convert a batched data sequence of datasets into a tensorflow dataset
@@ -101,6 +147,9 @@ def batches_to_tf_dataset(batches: Sequence[xr.Dataset], config: TransformConfig
             dimensions 2D ([sample, feature]) or 1D ([sample]) dimensions.
         config: Data preprocessing options for going from xr.Dataset to
             X, y tensor tuples grouped by variable.
+        num_parallel: Number of batches loaded and transformed in parallel
+        cache: Cache transformed samples in memory if True, or in files
+            with this path prefix if a string
     """
 
-    return _seq_to_tf_dataset(batches, config)
+    return _seq_to_tf_dataset(batches, config, num_parallel=num_parallel, cache=cache)
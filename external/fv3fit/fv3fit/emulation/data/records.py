@@ -0,0 +1,176 @@
+"""
+Sharded TFRecord format for preprocessed emulation training data
+
+A directory of netCDFs is converted once with ``nc_dir_to_records``, which
+applies a ``TransformConfig`` to each file and writes the resulting float32
+[sample, feature] arrays as one record per netCDF, several records per
+shard.  ``records_to_tf_dataset`` then reads the shards in parallel with
+``tf.data`` without running python per element.
+
+Usage::
+
+    python -m fv3fit.emulation.data.records NC_DIR OUTPUT_DIR TRANSFORM_YAML
+"""
+import argparse
+import json
+import logging
+import os
+from typing import Mapping, Optional, Sequence
+
+import fsspec
+import numpy as np
+import tensorflow as tf
+import yaml
+
+from vcm import get_fs
+from .config import TransformConfig
+from .io import get_nc_files
+from .transforms import open_netcdf_dataset
+
+
+logger = logging.getLogger(__name__)
+
+SPEC_FILENAME = "spec.json"
+SHARD_SUFFIX = ".tfrecord"
+
+
+def _to_example(arrays: Mapping[str, np.ndarray]) -> tf.train.Example:
+    feature = {
+        name: tf.train.Feature(
+            bytes_list=tf.train.BytesList(value=[array.astype(np.float32).tobytes()])
+        )
+        for name, array in arrays.items()
+    }
+    return tf.train.Example(features=tf.train.Features(feature=feature))
+
+
+def _shard_path(output_dir: str, index: int, nshards: int) -> str:
+    return os.path.join(output_dir, f"shard-{index:05d}-of-{nshards:05d}{SHARD_SUFFIX}")
+
+
+def nc_dir_to_records(
+    nc_dir: str,
+    output_dir: str,
+    config: TransformConfig,
+    files_per_shard: int = 10,
+    nfiles: Optional[int] = None,
+):
+    """
+    Convert a directory of netCDF files into sharded TFRecords of the
+    variables produced by config.
+
+    Args:
+        nc_dir: Path to a directory of netCDFs to convert.
+            Expected to be 2D ([sample, feature]) or 1D ([sample]) dimensions.
+        output_dir: Local or remote directory to write the shards and their
+            spec to.
+        config: Data preprocessing options applied to each netCDF before it
+            is written. Tensors are written as float32.
+        files_per_shard: Number of netCDFs written to each shard
+        nfiles: Limit to number of files
+    """
+
+    files = sorted(get_nc_files(nc_dir))[:nfiles]
+    shards = [
+        files[start : start + files_per_shard]
+        for start in range(0, len(files), files_per_shard)
+    ]
+
+    get_fs(output_dir).makedirs(output_dir, exist_ok=True)
+    spec = None
+    for index, shard_files in enumerate(shards):
+        path = _shard_path(output_dir, index, len(shards))
+        logger.info(f"Writing {len(shard_files)} files to {path}")
+        with tf.io.TFRecordWriter(path) as writer:
+            for nc_file in shard_files:
+                arrays = {
+                    name: np.asarray(data)
+                    for name, data in config(open_netcdf_dataset(nc_file)).items()
+                }
+                if spec is None:
+                    spec = {name: list(a.shape[1:]) for name, a in arrays.items()}
+                writer.write(_to_example(arrays).SerializeToString())
+
+    with fsspec.open(os.path.join(output_dir, SPEC_FILENAME), "w") as f:
+        json.dump(spec, f)
+
+
+def _parse_function(spec: Mapping[str, Sequence[int]]):
+    features = {name: tf.io.FixedLenFeature([], tf.string) for name in spec}
+
+    def parse(record):
+        example = tf.io.parse_single_example(record, features)
+        return {
+            name: tf.reshape(tf.io.decode_raw(example[name], tf.float32), [-1, *shape])
+            for name, shape in spec.items()
+        }
+
+    return parse
+
+
+def records_to_tf_dataset(
+    url: str, shuffle: bool = False, nfiles: Optional[int] = None
+) -> tf.data.Dataset:
+    """
+    Open a directory of records written by ``nc_dir_to_records`` as a
+    tensorflow dataset of per-sample dicts.
+
+    Args:
+        url: Local or remote directory of shards
+        shuffle: Randomly order the shards and interleave their records
+            non-deterministically. Does not shuffle samples within a record.
+        nfiles: Limit to number of records, i.e. of converted netCDFs
+    """
+
+    fs = get_fs(url)
+    with fs.open(os.path.join(url, SPEC_FILENAME)) as f:
+        spec = json.load(f)
+
+    shards = sorted(fs.glob(os.path.join(url, f"*{SHARD_SUFFIX}")))
+    if "gs" in fs.protocol:
+        shards = ["gs://" + shard for shard in shards]
+
+    tf_ds = tf.data.Dataset.from_tensor_slices(shards)
+    if shuffle:
+        tf_ds = tf_ds.shuffle(len(shards))
+
+    tf_ds = tf_ds.interleave(
+        tf.data.TFRecordDataset,
+        num_parallel_calls=tf.data.AUTOTUNE,
+        deterministic=not shuffle,
+    )
+    if nfiles is not None:
+        tf_ds = tf_ds.take(nfiles)
+
+    tf_ds = tf_ds.map(
+        _parse_function(spec),
+        num_parallel_calls=tf.data.AUTOTUNE,
+        deterministic=not shuffle,
+    )
+    return tf_ds.unbatch().prefetch(tf.data.AUTOTUNE)
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Convert a directory of netCDFs to sharded TFRecords"
+    )
+    parser.add_argument("nc_dir", help="Directory of netCDFs to convert")
+    parser.add_argument("output_dir", help="Directory to write shards to")
+    parser.add_argument("transform_config", help="Path to a TransformConfig yaml")
+    parser.add_argument("--files-per-shard", type=int, default=10)
+    parser.add_argument("--nfiles", type=int, default=None)
+    return parser
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    args = _get_parser().parse_args()
+    with fsspec.open(args.transform_config) as f:
+        transform = TransformConfig.from_dict(yaml.safe_load(f))
+    nc_dir_to_records(
+        args.nc_dir,
+        args.output_dir,
+        transform,
+        files_per_shard=args.files_per_shard,
+        nfiles=args.nfiles,
+    )
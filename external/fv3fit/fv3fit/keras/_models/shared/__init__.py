@@ -10,6 +10,12 @@ from .pure_keras import PureKerasModel
 from .training_loop import TrainingLoopConfig, EpochResult, EpochLossHistory, History
 from .loss import LossConfig
 from .utils import get_input_vector, standard_denormalize, standard_normalize
-from .sequences import XyArraySequence, XyMultiArraySequence, ThreadedSequencePreLoader
+from .sequences import (
+    XyArraySequence,
+    XyMultiArraySequence,
+    ThreadedSequencePreLoader,
+    ProcessSequencePreLoader,
+    PreLoaderMetrics,
+)
 from .halos import append_halos
 from .clip import ClipConfig
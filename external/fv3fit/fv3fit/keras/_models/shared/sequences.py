@@ -1,12 +1,17 @@
+import dataclasses
 import logging
+import multiprocessing
+import multiprocessing.shared_memory
 import threading
+import time
 import queue
+import traceback
 
 from .clip import ClipConfig
 import xarray as xr
 import numpy as np
 import tensorflow as tf
-from typing import Sequence, Tuple, List, Any, Optional
+from typing import Sequence, Tuple, List, Any, Optional, Union, Dict
 from .halos import append_halos
 import fv3gfs.util
 import vcm.safe
@@ -129,15 +134,32 @@ class XyMultiArraySequence(tf.keras.utils.Sequence):
         return X, y
 
 
+@dataclasses.dataclass
+class PreLoaderMetrics:
+    """
+    Attributes:
+        load_seconds: time taken to load each batch, in order of completion
+        starved_batches: number of batches which were not loaded yet when
+            requested, a large fraction indicates training is bound by loading
+        starved_seconds: total time spent waiting for batches to load
+    """
+
+    load_seconds: List[float] = dataclasses.field(default_factory=list)
+    starved_batches: int = 0
+    starved_seconds: float = 0.0
+
+
 class ThreadedSequencePreLoader(tf.keras.utils.Sequence):
     """
     Wrapper object for using a threaded pre-load to provide
     items for a generator.
 
-    Note: This might not preserve strict sequence ordering
-        ... but its faster.  Beware that it can load up to
-        max_queue_size + num_workers into memory at the
-        same time.
+    Loads up to max_queue_size items ahead of the item being consumed.
+    Unless preserve_order is True, the first loaded item is yielded next,
+    which might not be the next item in the sequence.
+
+    Metrics of the most recent iteration are stored in the ``metrics``
+    attribute.
     """
 
     def __init__(
@@ -145,6 +167,7 @@ class ThreadedSequencePreLoader(tf.keras.utils.Sequence):
         seq: tf.keras.utils.Sequence,
         num_workers: int = 4,
         max_queue_size: int = 6,
+        preserve_order: bool = False,
     ):
         logger.debug(
             f"Initializing threaded batch loader with {num_workers} workers"
@@ -153,6 +176,8 @@ class ThreadedSequencePreLoader(tf.keras.utils.Sequence):
         self._seq = seq
         self.num_workers = num_workers
         self.max_queue_size = max_queue_size
+        self.preserve_order = preserve_order
+        self.metrics = PreLoaderMetrics()
 
     def __len__(self):
         return len(self._seq)
@@ -161,17 +186,23 @@ class ThreadedSequencePreLoader(tf.keras.utils.Sequence):
         return self._seq[index]
 
     def __iter__(self):
+        self.metrics = PreLoaderMetrics()
 
         init_q = queue.Queue()
         for idx in list(range(len(self))):
             init_q.put(idx)
 
         event = threading.Event()
-        preloaded = queue.Queue(maxsize=self.max_queue_size)
+        preloaded: queue.Queue = queue.Queue()
+        # bounds the number of items loading or loaded but not yet consumed
+        slots = threading.Semaphore(
+            self.max_queue_size if self.max_queue_size > 0 else max(len(self), 1)
+        )
 
         producers: List[threading.Thread] = [
             threading.Thread(
-                target=self._produce_loaded_batches, args=(init_q, preloaded, event)
+                target=self._produce_loaded_batches,
+                args=(init_q, preloaded, event, slots),
             )
             for i in range(self.num_workers)
         ]
@@ -181,24 +212,215 @@ class ThreadedSequencePreLoader(tf.keras.utils.Sequence):
             thread.start()
             logger.debug(f"Started worker thread {thread.ident}")
 
-        # Generator on preloaded batches
-        for i in range(len(self)):
-            yield preloaded.get()
-
-        # stop threads
-        event.set()
-        for thread in producers:
-            logger.debug(f"Joining worker thread {thread.ident}")
-            thread.join()
+        # Generator on preloaded batches, reordered if preserving order
+        loaded: Dict[int, Any] = {}
+        try:
+            for i in range(len(self)):
+                start = time.perf_counter()
+                starved = False
+                while (i not in loaded) if self.preserve_order else not loaded:
+                    try:
+                        idx, item, load_seconds = preloaded.get_nowait()
+                    except queue.Empty:
+                        starved = True
+                        idx, item, load_seconds = preloaded.get()
+                    self.metrics.load_seconds.append(load_seconds)
+                    loaded[idx] = item
+                if starved:
+                    self.metrics.starved_batches += 1
+                    self.metrics.starved_seconds += time.perf_counter() - start
+                item = loaded.pop(i if self.preserve_order else min(loaded))
+                slots.release()
+                yield item
+        finally:
+            # stop threads
+            event.set()
+            for thread in producers:
+                logger.debug(f"Joining worker thread {thread.ident}")
+                thread.join()
+        logger.info(
+            f"Loaded {len(self)} batches, waited for {self.metrics.starved_batches} "
+            f"batches for a total of {self.metrics.starved_seconds:.2f}s"
+        )
 
-    def _produce_loaded_batches(self, src_q, dst_q, event):
+    def _produce_loaded_batches(self, src_q, dst_q, event, slots):
         while not event.is_set():
 
+            if not slots.acquire(timeout=5):
+                continue
+
             try:
                 item = src_q.get(timeout=5)
             except queue.Empty:
+                slots.release()
                 continue
 
-            dst_q.put(self[item])
+            start = time.perf_counter()
+            dst_q.put((item, self[item], time.perf_counter() - start))
             src_q.task_done()
             logger.debug(f"Loadded batch #{item}")
+
+
+# nested (offset, shape, dtype) description of arrays packed into shared memory
+ArraySpec = Union[Tuple[int, Tuple[int, ...], str], Tuple["ArraySpec", ...]]
+
+
+def _array_spec(item, offset: int = 0) -> Tuple[ArraySpec, int]:
+    if isinstance(item, (tuple, list)):
+        specs = []
+        for value in item:
+            spec, offset = _array_spec(value, offset)
+            specs.append(spec)
+        return tuple(specs), offset
+    else:
+        array = np.asarray(item)
+        return (offset, array.shape, array.dtype.str), offset + array.nbytes
+
+
+def _is_array_spec(spec: ArraySpec) -> bool:
+    return isinstance(spec[0], int)
+
+
+def _pack_arrays(item, spec: ArraySpec, buffer):
+    if _is_array_spec(spec):
+        offset, shape, dtype = spec
+        np.ndarray(shape, dtype=dtype, buffer=buffer, offset=offset)[...] = item
+    else:
+        for value, value_spec in zip(item, spec):
+            _pack_arrays(value, value_spec, buffer)
+
+
+def _unpack_arrays(spec: ArraySpec, buffer):
+    if _is_array_spec(spec):
+        offset, shape, dtype = spec
+        return np.ndarray(shape, dtype=dtype, buffer=buffer, offset=offset).copy()
+    else:
+        return tuple(_unpack_arrays(value_spec, buffer) for value_spec in spec)
+
+
+def _to_shared_memory(item) -> Tuple[str, ArraySpec]:
+    spec, nbytes = _array_spec(item)
+    # spawned workers share the resource tracker of the training process, so
+    # the block stays tracked until the consuming process unlinks it
+    shm = multiprocessing.shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+    _pack_arrays(item, spec, shm.buf)
+    shm.close()
+    return shm.name, spec
+
+
+def _from_shared_memory(name: str, spec: ArraySpec):
+    shm = multiprocessing.shared_memory.SharedMemory(name=name)
+    try:
+        return _unpack_arrays(spec, shm.buf)
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _unlink_shared_memory(name: str):
+    shm = multiprocessing.shared_memory.SharedMemory(name=name)
+    shm.close()
+    shm.unlink()
+
+
+class ProcessSequencePreLoader(tf.keras.utils.Sequence):
+    """
+    Wrapper object pre-loading items of a sequence of numpy arrays
+    (or nested tuples of numpy arrays) in worker processes.
+
+    Unlike ThreadedSequencePreLoader, items are computed without holding the
+    GIL of the training process, and are yielded in sequence order. Items
+    are passed back through shared memory. Worker i loads the items at
+    positions i, i + num_workers, ..., holding at most
+    ceil(max_queue_size / num_workers) loaded items in memory at a time.
+
+    Workers are spawned rather than forked, since forking a process which
+    has started tensorflow or I/O threads may deadlock, so the sequence must
+    be picklable. Each worker gets a copy of any random state held by the
+    sequence when iteration starts. Before loading each item the global numpy
+    random state of the worker is seeded from ``seed`` and the item index, so
+    iteration is reproducible given the same seed.
+    """
+
+    def __init__(
+        self,
+        seq: Sequence[Any],
+        num_workers: int = 4,
+        max_queue_size: int = 6,
+        seed: Optional[int] = None,
+    ):
+        """
+        Args:
+            seq: picklable sequence of numpy arrays or nested tuples of numpy
+                arrays
+            num_workers: number of worker processes
+            max_queue_size: max number of loaded items held in memory
+            seed: seed for the random state of the workers, by default
+                drawn from the global numpy random state on each iteration
+        """
+        logger.debug(
+            f"Initializing process batch loader with {num_workers} workers"
+            f" and max queue size of {max_queue_size}"
+        )
+        self._seq = seq
+        self.num_workers = num_workers
+        self.max_queue_size = max_queue_size
+        self.seed = seed
+
+    def __len__(self):
+        return len(self._seq)
+
+    def __getitem__(self, index) -> Any:
+        return self._seq[index]
+
+    def __iter__(self):
+        seed = np.random.randint(2 ** 31) if self.seed is None else self.seed
+        num_workers = max(min(self.num_workers, len(self)), 1)
+        queue_size = max(-(-self.max_queue_size // num_workers), 1)
+        context = multiprocessing.get_context("spawn")
+        event = context.Event()
+        queues = [context.Queue(maxsize=queue_size) for _ in range(num_workers)]
+        workers = [
+            context.Process(
+                target=_produce_loaded_batches,
+                args=(self._seq, range(i, len(self), num_workers), seed, dst_q, event),
+                daemon=True,
+            )
+            for i, dst_q in enumerate(queues)
+        ]
+        for process in workers:
+            process.start()
+            logger.debug(f"Started worker process {process.pid}")
+
+        try:
+            for i in range(len(self)):
+                status, value = queues[i % num_workers].get()
+                if status == "error":
+                    raise RuntimeError(f"Error loading batch #{i}:\n{value}")
+                yield _from_shared_memory(*value)
+        finally:
+            # stop workers, releasing any batches loaded but not consumed
+            event.set()
+            for process, dst_q in zip(workers, queues):
+                logger.debug(f"Joining worker process {process.pid}")
+                while process.is_alive() or not dst_q.empty():
+                    try:
+                        status, value = dst_q.get(timeout=0.1)
+                    except queue.Empty:
+                        continue
+                    if status == "ok":
+                        _unlink_shared_memory(value[0])
+                process.join()
+
+
+def _produce_loaded_batches(seq, indices, seed, dst_q, event):
+    for item in indices:
+        if event.is_set():
+            break
+        try:
+            np.random.seed([seed, item])
+            dst_q.put(("ok", _to_shared_memory(seq[item])))
+        except Exception:
+            dst_q.put(("error", traceback.format_exc()))
+            return
+        logger.debug(f"Loaded batch #{item}")
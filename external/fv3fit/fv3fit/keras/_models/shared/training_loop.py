@@ -2,7 +2,7 @@ import tensorflow as tf
 from typing import Iterable, Optional, Sequence, Union, Mapping, Tuple, Callable
 import dataclasses
 import numpy as np
-from .sequences import ThreadedSequencePreLoader
+from .sequences import ThreadedSequencePreLoader, ProcessSequencePreLoader
 from loaders.batches import shuffle
 import logging
 
@@ -35,6 +35,14 @@ class TrainingLoopConfig:
         workers: number of workers for parallelized loading of batches fed into
             training, if 1 uses serial loading instead
         max_queue_size: max number of batches to hold in the parallel loading queue
+        use_processes: if True, parallelized loading uses worker processes
+            instead of threads, yielding batches in a reproducible order
+        preserve_batch_order: if True, parallelized loading with threads yields
+            batches in the order of the shuffled sequence, so that training is
+            reproducible
+        seed: seed for the random state of the worker processes if use_processes
+            is True, epoch i uses seed + i. By default drawn from the global numpy
+            random state, which also sets the order of batches
         batch_size: actual batch_size to pass to keras model.fit,
             independent of number of samples in each data batch in batches
     """
@@ -43,6 +51,9 @@ class TrainingLoopConfig:
     workers: int = 1
     max_queue_size: int = 8
     batch_size: int = 16
+    use_processes: bool = False
+    preserve_batch_order: bool = False
+    seed: Optional[int] = None
 
     def fit_loop(
         self,
@@ -60,9 +71,19 @@ class TrainingLoopConfig:
         """
         for i_epoch in range(self.epochs):
             Xy = shuffle(Xy)
-            if self.workers > 1:
+            if self.workers > 1 and self.use_processes:
+                Xy = ProcessSequencePreLoader(
+                    Xy,
+                    num_workers=self.workers,
+                    max_queue_size=self.max_queue_size,
+                    seed=None if self.seed is None else self.seed + i_epoch,
+                )
+            elif self.workers > 1:
                 Xy = ThreadedSequencePreLoader(
-                    Xy, num_workers=self.workers, max_queue_size=self.max_queue_size
+                    Xy,
+                    num_workers=self.workers,
+                    max_queue_size=self.max_queue_size,
+                    preserve_order=self.preserve_batch_order,
                 )
             history = []
             for i_batch, (X, y) in enumerate(Xy):
@@ -62,6 +62,39 @@ def test__seq_to_tf_dataset():
     np.testing.assert_equal(result, batches[0] * 2)
 
 
+@pytest.mark.parametrize("num_parallel", [2, 3])
+def test__seq_to_tf_dataset_num_parallel(num_parallel):
+
+    batches = [np.arange(30).reshape(10, 3) + 30 * i for i in range(5)]
+    tf_ds = load._seq_to_tf_dataset(batches, lambda x: x, num_parallel=num_parallel)
+
+    first = np.stack(list(tf_ds.as_numpy_iterator()))
+    second = np.stack(list(tf_ds.as_numpy_iterator()))
+    np.testing.assert_equal(first, second)
+    np.testing.assert_equal(np.sort(first, axis=0), np.concatenate(batches))
+
+
+@pytest.mark.parametrize("cache", [True, "file"])
+def test__seq_to_tf_dataset_cache(tmpdir, cache):
+
+    batches = [np.arange(30).reshape(10, 3)] * 3
+    transformed = []
+
+    def transform(batch):
+        transformed.append(batch)
+        return batch * 2
+
+    if cache == "file":
+        cache = str(tmpdir.join("cache"))
+    tf_ds = load._seq_to_tf_dataset(batches, transform, cache=cache)
+    for _ in range(2):
+        result = np.stack(list(tf_ds.as_numpy_iterator()))
+        np.testing.assert_equal(result, np.concatenate(batches) * 2)
+
+    # one peek at the first batch plus a single epoch
+    assert len(transformed) == len(batches) + 1
+
+
 def _assert_batch_valid(batch, expected_size):
 
     assert batch
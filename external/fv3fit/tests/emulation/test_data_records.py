@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+import xarray as xr
+
+from fv3fit.emulation.data import (
+    TransformConfig,
+    nc_dir_to_records,
+    nc_dir_to_tf_dataset,
+    records_to_tf_dataset,
+)
+
+
+@pytest.fixture(scope="module")
+def nc_dir(tmp_path_factory):
+
+    netcdf_dir = tmp_path_factory.mktemp("netcdf_files")
+    for i in range(5):
+        ds = xr.Dataset(
+            {
+                "air_temperature": (["sample", "z"], np.random.rand(10, 3)),
+                "surface_pressure": (["sample"], np.random.rand(10)),
+            }
+        )
+        ds.to_netcdf(str(netcdf_dir / f"file{i:02d}.nc"))
+
+    return netcdf_dir
+
+
+def _as_sorted_array(tf_ds):
+    batch = next(iter(tf_ds.batch(1000)))
+    values = np.concatenate([batch[key].numpy() for key in sorted(batch)], axis=1)
+    return values[np.lexsort(values.T)]
+
+
+@pytest.mark.parametrize("files_per_shard", [1, 2, 10])
+@pytest.mark.parametrize("shuffle", [True, False])
+def test_records_to_tf_dataset_matches_netcdfs(
+    tmp_path, nc_dir, files_per_shard, shuffle
+):
+    config = TransformConfig(variables=["air_temperature", "surface_pressure"])
+    records_dir = str(tmp_path / "records")
+
+    nc_dir_to_records(str(nc_dir), records_dir, config, files_per_shard)
+    records = records_to_tf_dataset(records_dir, shuffle=shuffle)
+    netcdfs = nc_dir_to_tf_dataset(str(nc_dir), config)
+
+    assert records.element_spec["air_temperature"].shape == [3]
+    np.testing.assert_array_equal(_as_sorted_array(records), _as_sorted_array(netcdfs))
+
+
+def test_records_to_tf_dataset_nfiles(tmp_path, nc_dir):
+    config = TransformConfig(variables=["air_temperature"])
+    records_dir = str(tmp_path / "records")
+
+    nc_dir_to_records(str(nc_dir), records_dir, config, files_per_shard=2)
+    batch = next(iter(records_to_tf_dataset(records_dir, nfiles=3).batch(1000)))
+
+    assert len(batch["air_temperature"]) == 30
@@ -4,7 +4,10 @@ import numpy as np
 
 import pytest
 
-from fv3fit.keras._models.shared.sequences import ThreadedSequencePreLoader
+from fv3fit.keras._models.shared.sequences import (
+    ThreadedSequencePreLoader,
+    ProcessSequencePreLoader,
+)
 from fv3fit.keras._models.models import DenseModel
 from fv3fit._shared import PackerConfig, SliceConfig
 from fv3fit.keras._models.shared import ClipConfig
@@ -22,6 +25,62 @@ def test__ThreadedSequencePreLoader():
         assert item in sequence
 
 
+def test__ThreadedSequencePreLoader_preserve_order():
+    sequence = list(range(20))
+    loader = ThreadedSequencePreLoader(
+        sequence, num_workers=4, max_queue_size=3, preserve_order=True
+    )
+    assert list(loader) == sequence
+    assert len(loader.metrics.load_seconds) == len(sequence)
+    assert 0 <= loader.metrics.starved_batches <= len(sequence)
+
+
+def test__ProcessSequencePreLoader():
+    """ Check correctness and ordering of the pre-loaded sequence"""
+    sequence = [
+        (np.full((i, 2), i, dtype=np.float32), (np.arange(i), np.ones(3)))
+        for i in range(10)
+    ]
+    loader = ProcessSequencePreLoader(sequence, num_workers=4, max_queue_size=4)
+    result = [item for item in loader]
+    assert len(result) == len(sequence)
+    for (X, (y0, y1)), (X_expected, (y0_expected, y1_expected)) in zip(
+        result, sequence
+    ):
+        np.testing.assert_array_equal(X, X_expected)
+        assert X.dtype == X_expected.dtype
+        np.testing.assert_array_equal(y0, y0_expected)
+        np.testing.assert_array_equal(y1, y1_expected)
+
+
+# sequences loaded by worker processes must be picklable, so not local classes
+class RandomSequence:
+    def __len__(self):
+        return 6
+
+    def __getitem__(self, idx):
+        return np.random.uniform(size=3)
+
+
+class BadSequence:
+    def __len__(self):
+        return 2
+
+    def __getitem__(self, idx):
+        raise ValueError("bad batch")
+
+
+def test__ProcessSequencePreLoader_reproducible():
+    first = list(ProcessSequencePreLoader(RandomSequence(), num_workers=2, seed=0))
+    second = list(ProcessSequencePreLoader(RandomSequence(), num_workers=3, seed=0))
+    np.testing.assert_array_equal(first, second)
+
+
+def test__ProcessSequencePreLoader_raises_worker_error():
+    with pytest.raises(RuntimeError, match="bad batch"):
+        list(ProcessSequencePreLoader(BadSequence(), num_workers=2))
+
+
 @pytest.mark.parametrize("base_state", ["manual", "default"])
 def test_DenseModel_jacobian(base_state):
     class IdentityModel(DenseModel):
@@ -143,3 +143,36 @@ def test_fit_loop_calls_in_reproducible_order():
     fv3fit.set_random_seed(0)
     config.fit_loop(second_mock_model, mock_Xy, validation_data)
     assert first_mock_model.fit.call_args_list == second_mock_model.fit.call_args_list
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_fit_loop_parallel_loading(use_processes):
+    n_batches = 5
+    config = fv3fit.TrainingLoopConfig(epochs=1, workers=2, use_processes=use_processes)
+    mock_model = mock.MagicMock(spec=tf.keras.Model)
+    Xy = [(np.full((3, 2), i), np.full((3, 1), i)) for i in range(n_batches)]
+    config.fit_loop(mock_model, Xy)
+    assert mock_model.fit.call_count == n_batches
+    fit_values = sorted(call[0][0][0, 0] for call in mock_model.fit.call_args_list)
+    assert fit_values == list(range(n_batches))
+
+
+class RandomBatches:
+    def __len__(self):
+        return 4
+
+    def __getitem__(self, idx):
+        return np.random.uniform(size=(3, 2)), np.full((3, 1), idx)
+
+
+def test_fit_loop_process_loading_is_reproducible_with_seed():
+    config = fv3fit.TrainingLoopConfig(epochs=2, workers=2, use_processes=True, seed=0)
+    fit_values = []
+    for _ in range(2):
+        mock_model = mock.MagicMock(spec=tf.keras.Model)
+        fv3fit.set_random_seed(0)
+        config.fit_loop(mock_model, RandomBatches())
+        fit_values.append([call[0][:2] for call in mock_model.fit.call_args_list])
+    for (X, y), (X_other, y_other) in zip(*fit_values):
+        np.testing.assert_array_equal(X, X_other)
+        np.testing.assert_array_equal(y, y_other)
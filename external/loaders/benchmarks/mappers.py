@@ -0,0 +1,62 @@
+"""
+Microbenchmark of key lookups and item access of time-indexed mappers.
+
+Usage::
+
+    python benchmarks/mappers.py --n-times 10000
+"""
+import argparse
+import timeit
+
+import numpy as np
+import pandas as pd
+import xarray as xr
+
+from loaders.mappers import LongRunMapper, MultiDatasetMapper, XarrayMapper
+
+
+def _dataset(n_times: int) -> xr.Dataset:
+    times = pd.date_range("2016-08-01", periods=n_times, freq="15min")
+    return xr.Dataset(
+        {"a": (["time", "x"], np.ones((n_times, 8)))}, coords={"time": times}
+    )
+
+
+def _report(label: str, statement, number: int):
+    seconds = min(timeit.repeat(statement, number=number, repeat=3)) / number
+    print(f"{label:<40} {seconds * 1e6:>12.1f} us")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-times", type=int, default=10000)
+    parser.add_argument("--n-datasets", type=int, default=3)
+    parser.add_argument("--batch-size", type=int, default=10)
+    args = parser.parse_args()
+
+    ds = _dataset(args.n_times)
+    long_run = LongRunMapper(ds)
+    xarray_mapper = XarrayMapper(ds.convert_calendar("julian", use_cftime=True))
+    multi = MultiDatasetMapper(
+        [LongRunMapper(ds) for _ in range(args.n_datasets)],
+        names=list(range(args.n_datasets)),
+    )
+    keys = sorted(long_run.keys())
+    batch = keys[: args.batch_size]
+
+    print(f"{'operation':<40} {'time per call':>15}")
+    _report("LongRunMapper()", lambda: LongRunMapper(ds), 3)
+    _report("LongRunMapper.keys()", lambda: long_run.keys(), 100)
+    _report("LongRunMapper[key]", lambda: long_run[keys[-1]], 100)
+    _report("XarrayMapper[key]", lambda: xarray_mapper[keys[-1]], 100)
+    _report("MultiDatasetMapper.keys()", lambda: multi.keys(), 100)
+    _report("MultiDatasetMapper[key]", lambda: multi[keys[-1]], 20)
+    _report(
+        f"MultiDatasetMapper batch of {args.batch_size}",
+        lambda: [multi[key] for key in batch],
+        3,
+    )
+
+
+if __name__ == "__main__":
+    main()
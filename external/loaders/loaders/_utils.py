@@ -1,5 +1,6 @@
+import os
 import numpy as np
-from typing import Any, Hashable, Mapping, Tuple, Sequence
+from typing import Any, Callable, Dict, Hashable, Mapping, Optional, Tuple, Sequence
 from toolz.functoolz import curry
 import xarray as xr
 import vcm
@@ -26,6 +27,9 @@ WIND_ROTATION_COEFFICIENTS = [
     "northward_wind_v_coeff",
 ]
 
+# directory of on-disk copies of static grid data, shared between processes
+STATIC_CACHE_DIR_ENV = "LOADERS_STATIC_CACHE_DIR"
+
 Time = str
 Tile = int
 K = Tuple[Time, Tile]
@@ -85,7 +89,52 @@ def add_wind_rotation_info(res: str, ds: xr.Dataset) -> xr.Dataset:
     return ds.merge(rotation, compat="override")
 
 
+_STATIC_CACHE: Dict[Tuple[str, str], xr.Dataset] = {}
+
+
+def clear_static_cache():
+    """Clear the process-wide cache of static grid data"""
+    _STATIC_CACHE.clear()
+
+
+def _static_cache_dir() -> Optional[str]:
+    return os.environ.get(STATIC_CACHE_DIR_ENV) or None
+
+
+def _load_static(name: str, res: str, load: Callable[[str], xr.Dataset]) -> xr.Dataset:
+    """Load a static per-resolution dataset into memory once per process
+
+    If the environment variable LOADERS_STATIC_CACHE_DIR is set, a netCDF copy of
+    the dataset is read from (or written to) that directory, so other processes
+    do not need to access the catalog.
+    """
+    key = (name, res)
+    if key not in _STATIC_CACHE:
+        cache_dir = _static_cache_dir()
+        path = os.path.join(cache_dir, f"{name}_{res}.nc") if cache_dir else None
+        if path is not None and os.path.exists(path):
+            with xr.open_dataset(path) as ds:
+                loaded = ds.load()
+        else:
+            loaded = load(res).load()
+            if path is not None:
+                os.makedirs(cache_dir, exist_ok=True)
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                loaded.to_netcdf(tmp_path)
+                os.replace(tmp_path, path)
+        _STATIC_CACHE[key] = loaded
+    return _STATIC_CACHE[key]
+
+
 def _load_grid(res: str) -> xr.Dataset:
+    return _load_static("grid", res, _open_grid)
+
+
+def _load_wind_rotation_matrix(res: str) -> xr.Dataset:
+    return _load_static("wind_rotation", res, _open_wind_rotation_matrix)
+
+
+def _open_grid(res: str) -> xr.Dataset:
     grid = catalog[f"grid/{res}"].to_dask()
     land_sea_mask = catalog[f"landseamask/{res}"].to_dask()
     grid = grid.assign({"land_sea_mask": land_sea_mask["land_sea_mask"]})
@@ -93,7 +142,7 @@ def _load_grid(res: str) -> xr.Dataset:
     return safe.get_variables(grid, ["lat", "lon", "land_sea_mask"]).drop("tile")
 
 
-def _load_wind_rotation_matrix(res: str) -> xr.Dataset:
+def _open_wind_rotation_matrix(res: str) -> xr.Dataset:
     rotation = catalog[f"wind_rotation/{res}"].to_dask()
     return safe.get_variables(rotation, WIND_ROTATION_COEFFICIENTS)
 
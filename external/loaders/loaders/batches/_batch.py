@@ -1,7 +1,6 @@
 import logging
 from loaders.typing import Batches
 from numpy.random import RandomState
-import pandas as pd
 from typing import (
     Iterable,
     Sequence,
@@ -15,6 +14,7 @@ import xarray as xr
 from vcm import safe, parse_datetime_from_str
 from toolz import partition_all, curry, compose_left
 from ._sequences import Map
+from ..mappers import get_many
 from .._utils import (
     add_grid_info,
     add_derived_data,
@@ -225,8 +225,9 @@ def _get_batch(
     (i.e., not added in derived step), converts time strings to time, and combines
     into a single dataset.
     """
+    keys = list(keys)
     time_coords = [parse_datetime_from_str(key) for key in keys]
-    ds = xr.concat([mapper[key] for key in keys], pd.Index(time_coords, name=TIME_NAME))
+    ds = get_many(mapper, keys).assign_coords({TIME_NAME: time_coords})
     nonderived_vars = nonderived_variables(data_vars, tuple(ds.data_vars))
     ds = safe.get_variables(ds, nonderived_vars)
     return ds
@@ -1,10 +1,13 @@
 import os
 import glob
+import shutil
 import joblib
 import collections.abc
 from copy import deepcopy
 from functools import partial
 import numpy as np
+import pandas as pd
+import xarray as xr
 from typing import (
     Callable,
     Sequence,
@@ -29,9 +32,7 @@ class BaseSequence(Sequence[T]):
         return to_local(self, path=path, n_jobs=n_jobs)
 
     def _save_item(self, path: str, i: int):
-        item = self[i]
-        path = os.path.join(path, "%05d.pkl" % i)
-        Local.dump(item, path)
+        Local.save_item(self[i], path, i)
 
     def take(self, n: int) -> "Take":
         """Return a sequence consisting of the first n elements
@@ -60,28 +61,93 @@ class Take(BaseSequence[T]):
 
 
 class Local(BaseSequence[T]):
+    """A sequence saved to a local directory by ``to_local``
+
+    Datasets are saved as a directory of npy files, one per variable,
+    which are memory-mapped when an item is read. Other items, including
+    datasets with multi-indexed coordinates, are pickled.
+    """
+
     def __init__(self, path: str):
         self.path = path
 
     @property
     def files(self):
-        return sorted(glob.glob(os.path.join(self.path, "*.pkl")))
+        files = glob.glob(os.path.join(self.path, "*.pkl")) + glob.glob(
+            os.path.join(self.path, "*.arrays")
+        )
+        return sorted(files, key=os.path.basename)
 
     @classmethod
     def dump(cls, dataset, path):
         joblib.dump(dataset, path)
 
+    @classmethod
+    def save_item(cls, item, path: str, i: int):
+        """Save the i-th item of a sequence to the local directory path"""
+        if isinstance(item, xr.Dataset) and not _has_multiindex(item):
+            _dump_arrays(item, os.path.join(path, "%05d.arrays" % i))
+        else:
+            cls.dump(item, os.path.join(path, "%05d.pkl" % i))
+
     def __len__(self):
         return len(self.files)
 
     def __getitem__(self, i):
-        return joblib.load(self.files[i])
+        path = self.files[i]
+        if path.endswith(".arrays"):
+            return _load_arrays(path)
+        else:
+            return joblib.load(path)
+
+
+_SCHEMA = "schema.pkl"
+
+
+def _has_multiindex(ds: xr.Dataset) -> bool:
+    return any(isinstance(index, pd.MultiIndex) for index in ds.indexes.values())
+
+
+def _dump_arrays(ds: xr.Dataset, path: str):
+    # write to a temporary directory so partially written items are not listed
+    tmp_path = f"{path}.tmp"
+    for existing in [path, tmp_path]:
+        if os.path.exists(existing):
+            shutil.rmtree(existing)
+    os.makedirs(tmp_path)
+    variables = {}
+    for i, (name, variable) in enumerate(ds.variables.items()):
+        values = variable.values
+        if values.dtype.hasobject or values.size == 0:
+            # cannot be memory-mapped, e.g. cftime coordinates
+            data = values
+        else:
+            data = f"{i}.npy"
+            np.save(os.path.join(tmp_path, data), values)
+        variables[name] = (variable.dims, data, variable.attrs, variable.encoding)
+    schema = {"variables": variables, "coords": list(ds.coords), "attrs": ds.attrs}
+    joblib.dump(schema, os.path.join(tmp_path, _SCHEMA))
+    os.rename(tmp_path, path)
+
+
+def _load_arrays(path: str) -> xr.Dataset:
+    schema = joblib.load(os.path.join(path, _SCHEMA))
+    variables = {}
+    for name, (dims, data, attrs, encoding) in schema["variables"].items():
+        if isinstance(data, str):
+            data = np.load(os.path.join(path, data), mmap_mode="r")
+        variables[name] = xr.Variable(dims, data, attrs=attrs, encoding=encoding)
+    coords = {name: variables.pop(name) for name in schema["coords"]}
+    return xr.Dataset(variables, coords=coords, attrs=schema["attrs"])
 
 
 def to_local(sequence: Sequence[T], path: str, n_jobs: int = 4) -> Local[T]:
     """
     Download a sequence of pickleable objects to a local path.
 
+    Datasets are saved in a format which is memory-mapped when read back,
+    see ``Local``.
+
     Args:
         sequence: pickleable objects to dump locally
         path: local directory, will be created if not existing
@@ -93,9 +159,7 @@ def to_local(sequence: Sequence[T], path: str, n_jobs: int = 4) -> Local[T]:
     os.makedirs(path, exist_ok=True)
 
     def save_item(path: str, i: int):
-        item = sequence[i]
-        path = os.path.join(path, "%05d.pkl" % i)
-        Local.dump(item, path)
+        Local.save_item(sequence[i], path, i)
 
     joblib.Parallel(n_jobs=n_jobs)(
         joblib.delayed(save_item)(path, i) for i in range(len(sequence))
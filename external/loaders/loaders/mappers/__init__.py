@@ -17,6 +17,6 @@ from ._fine_res import open_fine_resolution, open_precomputed_fine_resolution
 from ._high_res_diags import open_high_res_diags
 
 # mapper classes used externally
-from ._base import GeoMapper, LongRunMapper, MultiDatasetMapper
+from ._base import GeoMapper, LongRunMapper, MultiDatasetMapper, get_many
 from ._merged import MergeOverlappingData
 from ._xarray import XarrayMapper, open_zarr
@@ -1,8 +1,6 @@
 import pandas as pd
-import numpy as np
 import xarray as xr
-import vcm
-from typing import Hashable, Optional, Sequence
+from typing import Hashable, Iterable, Mapping, Optional, Sequence
 
 
 from ..constants import DATASET_DIM_NAME, TIME_NAME, TIME_FMT
@@ -10,6 +8,38 @@ from .._utils import standardize_zarr_time_coord
 from loaders.typing import Mapper
 
 
+def position_index(keys: Iterable[str]) -> Mapping[str, int]:
+    """Map each key to its position in keys, ordered by key.
+
+    Mapper keys are fixed once a mapper is created, so this index is built once
+    and used for membership tests and positional (``isel``) access.
+    """
+    return dict(sorted((key, position) for position, key in enumerate(keys)))
+
+
+def get_many(mapper: Mapper, keys: Sequence[str]) -> xr.Dataset:
+    """Get the items of several keys stacked along a new time dimension.
+
+    Uses the ``get_many`` bulk accessor of the mapper if it has one, which reads
+    all keys with a single selection of the underlying data, and otherwise
+    concatenates the items of each key. Either way the output has the same
+    dimension order as ``xr.concat([mapper[key] for key in keys], dim="time")``.
+    The time coordinate of the output is left to the mapper and should be
+    assigned by the caller.
+
+    Args:
+        mapper: mapper to get items from
+        keys: keys to get, in order along the output time dimension
+
+    Returns:
+        dataset with a leading time dimension of length len(keys)
+    """
+    if hasattr(mapper, "get_many"):
+        return mapper.get_many(keys).transpose(TIME_NAME, ...)  # type: ignore
+    else:
+        return xr.concat([mapper[key] for key in keys], dim=TIME_NAME)
+
+
 class GeoMapper(Mapper):
     def __len__(self):
         return len(self.keys())
@@ -32,18 +62,19 @@ class LongRunMapper(GeoMapper):
 
     def __init__(self, ds):
         self.ds = standardize_zarr_time_coord(ds)
+        times = pd.to_datetime(self.ds[TIME_NAME].values)
+        self._positions = position_index(times.strftime(TIME_FMT))
 
     def __getitem__(self, key: str) -> xr.Dataset:
-        dt64 = np.datetime64(vcm.parse_datetime_from_str(key))
-        return self.ds.sel({TIME_NAME: dt64}).drop_vars(names=TIME_NAME)
+        position = self._positions[key]
+        return self.ds.isel({TIME_NAME: position}).drop_vars(names=TIME_NAME)
+
+    def get_many(self, keys: Sequence[str]) -> xr.Dataset:
+        positions = [self._positions[key] for key in keys]
+        return self.ds.isel({TIME_NAME: positions}).drop_vars(names=TIME_NAME)
 
     def keys(self):
-        return set(
-            [
-                time.strftime(TIME_FMT)
-                for time in pd.to_datetime(self.ds[TIME_NAME].values)
-            ]
-        )
+        return self._positions.keys()
 
 
 class MultiDatasetMapper(GeoMapper):
@@ -58,17 +89,30 @@ class MultiDatasetMapper(GeoMapper):
         """
         self.mappers = mappers
         self.names = names
+        self._keys = position_index(
+            sorted(set.intersection(*[set(mapper.keys()) for mapper in self.mappers]))
+        )
 
     def keys(self):
-        return set.intersection(*[set(mapper.keys()) for mapper in self.mappers])
+        return self._keys.keys()
 
     def __getitem__(self, time):
-        if time not in self.keys():
+        if time not in self._keys:
             raise KeyError(f"Time {time} could not be found in all datasets.")
         else:
-            datasets = [mapper[time] for mapper in self.mappers]
-            if self.names is not None:
-                dim = pd.Index(self.names, name=DATASET_DIM_NAME)
-            else:
-                dim = DATASET_DIM_NAME
-            return xr.concat(datasets, dim=dim)
+            return self._concat_datasets([mapper[time] for mapper in self.mappers])
+
+    def get_many(self, times: Sequence[str]) -> xr.Dataset:
+        missing = [time for time in times if time not in self._keys]
+        if len(missing) > 0:
+            raise KeyError(f"Times {missing} could not be found in all datasets.")
+        return self._concat_datasets(
+            [get_many(mapper, times) for mapper in self.mappers]
+        )
+
+    def _concat_datasets(self, datasets: Sequence[xr.Dataset]) -> xr.Dataset:
+        if self.names is not None:
+            dim = pd.Index(self.names, name=DATASET_DIM_NAME)
+        else:
+            dim = DATASET_DIM_NAME
+        return xr.concat(datasets, dim=dim)
@@ -2,7 +2,7 @@ from typing import Sequence
 import xarray as xr
 from vcm import safe
 
-from ._base import GeoMapper
+from ._base import GeoMapper, get_many
 from ..constants import DERIVATION_DIM
 from .._utils import get_sample_dataset
 from loaders.typing import Mapper
@@ -50,6 +50,10 @@ class MergeOverlappingData(GeoMapper):
         datasets_to_merge = [mapper[key] for mapper in self._mappers]
         return self._merge_with_overlap(datasets_to_merge)
 
+    def get_many(self, keys: Sequence[str]) -> xr.Dataset:
+        datasets_to_merge = [get_many(mapper, keys) for mapper in self._mappers]
+        return self._merge_with_overlap(datasets_to_merge)
+
     def _merge_with_overlap(self, datasets: Sequence[xr.Dataset]) -> xr.Dataset:
         ds_nonoverlap = xr.merge(
             [ds.drop_vars(list(self._var_overlap)) for ds in datasets]
@@ -1,8 +1,11 @@
+from typing import Sequence
+
 import xarray as xr
 import fsspec
 import zarr
 import vcm
 from ._base import GeoMapper
+from ..constants import TIME_NAME
 from loaders._config import mapper_functions
 
 
@@ -44,9 +47,17 @@ class XarrayMapper(GeoMapper):
         time_strings = [vcm.encode_time(time) for time in times]
         self.time_lookup = dict(zip(time_strings, times))
         self.time_string_lookup = dict(zip(times, time_strings))
+        self._positions = dict(zip(time_strings, range(len(time_strings))))
 
     def __getitem__(self, time_string):
-        return self.data.sel({self._time_name: self.time_lookup[time_string]})
+        return self.data.isel({self._time_name: self._positions[time_string]})
+
+    def get_many(self, time_strings: Sequence[str]) -> xr.Dataset:
+        positions = [self._positions[time_string] for time_string in time_strings]
+        ds = self.data.isel({self._time_name: positions})
+        if self._time_name != TIME_NAME:
+            ds = ds.rename({self._time_name: TIME_NAME})
+        return ds
 
     def keys(self):
         return self.time_lookup.keys()
@@ -4,7 +4,7 @@ import pandas as pd
 import pytest
 import xarray as xr
 from loaders import DATASET_DIM_NAME, TIME_NAME, TIME_FMT
-from loaders.mappers import LongRunMapper, MultiDatasetMapper
+from loaders.mappers import LongRunMapper, MultiDatasetMapper, get_many
 
 
 def construct_dataset(num_tsteps):
@@ -39,6 +39,23 @@ def test_LongRunMapper(ds):
     xr.testing.assert_equal(item, mapper[time_key])
 
 
+def test_LongRunMapper_unsorted_times():
+    ds = construct_dataset(3).isel({TIME_NAME: [2, 0, 1]})
+    mapper = LongRunMapper(ds)
+    keys = list(mapper.keys())
+    assert keys == sorted(keys)
+    for key in keys:
+        time = pd.to_datetime(key, format=TIME_FMT)
+        expected = ds.sel({TIME_NAME: time}).drop_vars(names=TIME_NAME)
+        xr.testing.assert_identical(mapper[key], expected)
+
+
+def test_LongRunMapper_key_error():
+    mapper = LongRunMapper(construct_dataset(1))
+    with pytest.raises(KeyError):
+        mapper["20000103.000000"]
+
+
 @pytest.fixture(
     params=[(1, 1), (1, 2), (3, 2), (2, 3, 5), (1, 1, 3)], ids=lambda x: f"sizes={x}"
 )
@@ -104,3 +121,19 @@ def test_multidataset_mapper_with_names(datasets, multi_dataset_mapper_with_name
     single_time = datasets[0][TIME_NAME].isel({TIME_NAME: 0}).item()
     time_key = pd.to_datetime(single_time).strftime(TIME_FMT)
     assert "a" in multi_dataset_mapper_with_names[time_key][DATASET_DIM_NAME]
+
+
+def test_LongRunMapper_get_many():
+    ds = construct_dataset(5)
+    mapper = LongRunMapper(ds)
+    keys = sorted(mapper.keys())[::-2]
+    expected = xr.concat([mapper[key] for key in keys], dim=TIME_NAME)
+    xr.testing.assert_identical(mapper.get_many(keys), expected)
+
+
+def test_MultiDatasetMapper_get_many(multi_dataset_mapper):
+    keys = list(multi_dataset_mapper.keys())
+    expected = xr.concat([multi_dataset_mapper[key] for key in keys], dim=TIME_NAME)
+    output = get_many(multi_dataset_mapper, keys)
+    xr.testing.assert_identical(output, expected)
+    assert output["var"].dims == expected["var"].dims
@@ -139,3 +139,12 @@ def test_batches_from_mappper_different_indexing_conventions(tiles):
     seq = batches_from_mapper(mapper, ["a", "lon"], res=f"c{n}")
     assert len(seq) == 1
     assert ds.a[0].size == seq[0].a.size
+
+
+@pytest.mark.parametrize("mapper", ["MultiDatasetMapper"], indirect=True)
+def test__get_batch_uses_get_many(mapper):
+    keys = list(mapper.keys())[:2]
+    ds = _get_batch(mapper=mapper, data_vars=DATA_VARS, keys=keys)
+    expected = xr.concat([mapper[key] for key in keys], dim="time")
+    assert ds.air_temperature.dims == expected.air_temperature.dims
+    xr.testing.assert_equal(ds.drop_vars("time"), expected[DATA_VARS])
@@ -1,6 +1,6 @@
 import pytest
 import xarray as xr
-from loaders.mappers import GeoMapper, MergeOverlappingData
+from loaders.mappers import GeoMapper, MergeOverlappingData, get_many
 
 OVERLAP_DIM = "derivation"
 
@@ -99,3 +99,14 @@ def test__check_overlap_vars_dims():
         MergeOverlappingData._check_overlap_vars_dims(
             [invalid_dataset, ds], overlap_vars, overlap_dim=OVERLAP_DIM
         )
+
+
+def test_MergeOverlappingData_get_many():
+    left_mapper = MockBaseMapper(dataset(["var0", "var1"]))
+    right_mapper = MockBaseMapper(dataset(["var1", "var2"]))
+    merged = MergeOverlappingData(left_mapper, right_mapper, "left", "right")
+    keys = sorted(merged.keys())[:2]
+    output = get_many(merged, keys)
+    assert output.sizes["time"] == 2
+    assert set(output.data_vars) == {"var0", "var1", "var2"}
+    assert output.var1.dims[:2] == ("time", OVERLAP_DIM)
@@ -75,3 +75,26 @@ def test__sequence_local(tmpdir):
 
     local = Local(str(tmpdir))
     xr.testing.assert_equal(local[0], ds)
+
+
+def test__sequence_local_memory_maps_datasets(tmpdir):
+    times = xr.cftime_range("2016-08-01", periods=2, calendar="julian")
+    ds = xr.Dataset(
+        {"a": (["time", "x"], np.ones((2, 3)), {"units": "m"})},
+        coords={"time": times, "x": [1, 2, 3]},
+        attrs={"source": "test"},
+    )
+    local = Map(identity, [ds, ds.isel(time=slice(1))]).local(str(tmpdir))
+
+    assert len(local) == 2
+    xr.testing.assert_identical(local[0], ds)
+    xr.testing.assert_identical(local[1], ds.isel(time=slice(1)))
+    assert isinstance(local[0]["a"].values.base, np.memmap)
+
+
+def test__sequence_local_pickles_other_items(tmpdir):
+    ds = xr.Dataset({"a": (["x", "y"], np.ones((2, 2)))}).stack(sample=["x", "y"])
+    local = Map(identity, [ds, {"b": 1}]).local(str(tmpdir))
+
+    xr.testing.assert_identical(local[0], ds)
+    assert local[1] == {"b": 1}
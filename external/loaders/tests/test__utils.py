@@ -1,4 +1,8 @@
+import numpy as np
 import pytest
+import xarray as xr
+
+import loaders._utils
 from loaders._utils import nonderived_variables
 
 
@@ -20,3 +24,38 @@ from loaders._utils import nonderived_variables
 )
 def test_nonderived_variable_names(requested, available, nonderived):
     assert set(nonderived_variables(requested, available)) == set(nonderived)
+
+
+@pytest.fixture
+def count_static_loads(monkeypatch):
+    calls = []
+
+    def _open(res):
+        calls.append(res)
+        return xr.Dataset({"lat": (["y", "x"], np.ones((2, 2)))}).chunk()
+
+    monkeypatch.setattr(loaders._utils, "_open_grid", _open)
+    loaders._utils.clear_static_cache()
+    yield calls
+    loaders._utils.clear_static_cache()
+
+
+def test__load_grid_is_cached_in_memory(count_static_loads, monkeypatch):
+    monkeypatch.delenv(loaders._utils.STATIC_CACHE_DIR_ENV, raising=False)
+    first = loaders._utils._load_grid("c8")
+    second = loaders._utils._load_grid("c8")
+    loaders._utils._load_grid("c12")
+    assert count_static_loads == ["c8", "c12"]
+    assert first is second
+    assert isinstance(first["lat"].data, np.ndarray)
+
+
+def test__load_grid_uses_cache_dir(count_static_loads, monkeypatch, tmpdir):
+    monkeypatch.setenv(loaders._utils.STATIC_CACHE_DIR_ENV, str(tmpdir))
+    expected = loaders._utils._load_grid("c8")
+    # a new process only has the on-disk copy
+    loaders._utils.clear_static_cache()
+    result = loaders._utils._load_grid("c8")
+    assert count_static_loads == ["c8"]
+    xr.testing.assert_identical(result, expected)
+    assert isinstance(result["lat"].data, np.ndarray)
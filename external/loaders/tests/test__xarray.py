@@ -28,3 +28,16 @@ def test_open_zarr(tmpdir, time_dim_name):
     mapper = open_zarr(str(tmpdir), dim=time_dim_name)
     assert isinstance(mapper, XarrayMapper)
     xr.testing.assert_equal(mapper[time_str], ds.isel({time_dim_name: 0}))
+
+
+@pytest.mark.parametrize("time_dim_name", ["another_name", "time"])
+def test_XarrayMapper_get_many(time_dim_name):
+    times = [cftime.DatetimeJulian(2020, 1, 1, hour) for hour in range(3)]
+    ds = xr.Dataset(
+        {"a": (["x", time_dim_name], np.arange(6).reshape((2, 3)))},
+        coords={time_dim_name: times},
+    )
+    mapper = XarrayMapper(ds, time=time_dim_name)
+    keys = ["20200101.020000", "20200101.000000"]
+    output = mapper.get_many(keys)
+    np.testing.assert_array_equal(output.a.transpose("time", "x"), [[2, 5], [0, 3]])
@@ -0,0 +1,133 @@
+"""
+Benchmark coarse-graining of a tile of synthetic fv_core restart data with
+weighted_block_average and edge_weighted_block_average, against the previous
+implementation using xarray's coarsen.
+
+Usage::
+
+    python benchmarks/coarsen.py --resolution 384 --target-resolution 48
+    python benchmarks/coarsen.py --resolution 3072 --target-resolution 384 --n-z 10
+
+A full C3072 tile with 79 levels needs about 3 GB of memory per variable.
+"""
+import argparse
+import time
+from unittest import mock
+
+import numpy as np
+import xarray as xr
+
+from vcm.cubedsphere import coarsen_restarts
+from vcm.cubedsphere.coarsen import (
+    _coarsen_downsample_coordinate,
+    _propagate_attrs,
+    coarsen_coords_coord_func,
+)
+from vcm.cubedsphere.constants import (
+    FV_CORE_X_CENTER,
+    FV_CORE_X_OUTER,
+    FV_CORE_Y_CENTER,
+    FV_CORE_Y_OUTER,
+    RESTART_Z_CENTER,
+)
+
+
+def _xarray_weighted_block_average(
+    obj,
+    weights,
+    coarsening_factor,
+    x_dim="xaxis_1",
+    y_dim="yaxis_2",
+    coord_func=coarsen_coords_coord_func,
+):
+    coarsen_kwargs = {x_dim: coarsening_factor, y_dim: coarsening_factor}
+    numerator = (obj * weights).coarsen(coarsen_kwargs, coord_func=coord_func).sum()
+    denominator = weights.coarsen(coarsen_kwargs, coord_func=coord_func).sum()
+    return _propagate_attrs(obj, numerator / denominator)
+
+
+def _xarray_edge_weighted_block_average(
+    obj,
+    spacing,
+    coarsening_factor,
+    x_dim="xaxis_1",
+    y_dim="yaxis_1",
+    edge="x",
+    coord_func=coarsen_coords_coord_func,
+):
+    coarsen_dim, downsample_dim = (x_dim, y_dim) if edge == "x" else (y_dim, x_dim)
+    coarsen_kwargs = {coarsen_dim: coarsening_factor}
+    numerator = (spacing * obj).coarsen(coarsen_kwargs, coord_func=coord_func).sum()
+    denominator = spacing.coarsen(coarsen_kwargs, coord_func=coord_func).sum()
+    downsample_kwargs = {downsample_dim: slice(None, None, coarsening_factor)}
+    result = (numerator / denominator).isel(downsample_kwargs)
+    result = _coarsen_downsample_coordinate(
+        obj, result, downsample_dim, coarsening_factor, coord_func
+    )
+    return _propagate_attrs(obj, result)
+
+
+def _synthetic_fv_core(resolution: int, n_z: int):
+    rng = np.random.default_rng(0)
+
+    def _array(dims, low=0.5, high=1.5):
+        sizes = {
+            RESTART_Z_CENTER: n_z,
+            FV_CORE_X_CENTER: resolution,
+            FV_CORE_Y_CENTER: resolution,
+            FV_CORE_X_OUTER: resolution + 1,
+            FV_CORE_Y_OUTER: resolution + 1,
+        }
+        shape = [sizes[dim] for dim in dims]
+        return (dims, rng.uniform(low, high, size=shape).astype(np.float32))
+
+    center = [RESTART_Z_CENTER, FV_CORE_Y_CENTER, FV_CORE_X_CENTER]
+    ds = xr.Dataset(
+        {
+            "phis": _array(center[1:]),
+            "delp": _array(center),
+            "DZ": _array(center),
+            "W": _array(center),
+            "T": _array(center),
+            "u": _array([RESTART_Z_CENTER, FV_CORE_Y_OUTER, FV_CORE_X_CENTER]),
+            "v": _array([RESTART_Z_CENTER, FV_CORE_Y_CENTER, FV_CORE_X_OUTER]),
+        }
+    )
+    area = xr.DataArray(xr.Variable(*_array(center[1:])))
+    dx = xr.DataArray(xr.Variable(*_array([FV_CORE_Y_OUTER, FV_CORE_X_CENTER])))
+    dy = xr.DataArray(xr.Variable(*_array([FV_CORE_Y_CENTER, FV_CORE_X_OUTER])))
+    return ds, area, dx, dy
+
+
+def _time_fv_core(ds, area, dx, dy, coarsening_factor):
+    start = time.perf_counter()
+    coarsen_restarts._coarse_grain_fv_core(
+        ds, ds.delp, area, dx, dy, coarsening_factor
+    ).compute()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--resolution", type=int, default=384)
+    parser.add_argument("--target-resolution", type=int, default=48)
+    parser.add_argument("--n-z", type=int, default=79)
+    args = parser.parse_args()
+
+    coarsening_factor = args.resolution // args.target_resolution
+    ds, area, dx, dy = _synthetic_fv_core(args.resolution, args.n_z)
+
+    print(f"{'implementation':<16} {'time (s)':>10}")
+    with mock.patch.multiple(
+        coarsen_restarts,
+        weighted_block_average=_xarray_weighted_block_average,
+        edge_weighted_block_average=_xarray_edge_weighted_block_average,
+    ):
+        elapsed = _time_fv_core(ds, area, dx, dy, coarsening_factor)
+    print(f"{'xarray coarsen':<16} {elapsed:>10.2f}")
+    elapsed = _time_fv_core(ds, area, dx, dy, coarsening_factor)
+    print(f"{'fused':<16} {elapsed:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark interpolation of a 3D field to the pressure levels of
+vcm.interpolate.PRESSURE_GRID with the vectorized numpy implementation against
+metpy.interpolate.interpolate_1d.
+
+Usage::
+
+    python benchmarks/interpolate.py --resolution 384 --n-tiles 6
+
+Also times vcm.interpolate_to_pressure_levels, including the computation of the
+pressure, on dask arrays chunked by tile.
+"""
+import argparse
+import time
+import warnings
+
+import numpy as np
+import xarray as xr
+
+import vcm
+from vcm.interpolate import (
+    PRESSURE_GRID,
+    _interpolate_columns,
+    _interpolate_columns_metpy,
+)
+
+
+def _synthetic_state(n_tiles: int, resolution: int, n_z: int) -> xr.Dataset:
+    rng = np.random.default_rng(0)
+    dims = ["tile", "y", "x", "z"]
+    shape = (n_tiles, resolution, resolution, n_z)
+    delp = 1e5 / n_z * rng.uniform(0.9, 1.1, size=shape)
+    return xr.Dataset(
+        {
+            "delp": (dims, delp),
+            "air_temperature": (dims, rng.uniform(200, 300, size=shape)),
+        }
+    )
+
+
+def _time(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--resolution", type=int, default=384)
+    parser.add_argument("--n-tiles", type=int, default=1)
+    parser.add_argument("--n-z", type=int, default=79)
+    args = parser.parse_args()
+    warnings.simplefilter("ignore")
+
+    ds = _synthetic_state(args.n_tiles, args.resolution, args.n_z)
+    pressure = vcm.pressure_at_midpoint_log(ds.delp, dim="z").values
+    field = ds.air_temperature.values
+    grid = PRESSURE_GRID.values
+
+    print(f"{'implementation':<24} {'time (s)':>10}")
+    for label, func in [
+        ("metpy", _interpolate_columns_metpy),
+        ("numpy", _interpolate_columns),
+    ]:
+        print(f"{label:<24} {_time(func, grid, pressure, field):>10.2f}")
+
+    chunked = ds.chunk({"tile": 1})
+    interpolated = vcm.interpolate_to_pressure_levels(
+        chunked.air_temperature, chunked.delp, dim="z"
+    )
+    print(f"{'dask by tile':<24} {_time(interpolated.compute):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
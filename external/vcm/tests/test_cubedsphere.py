@@ -1,8 +1,11 @@
+from functools import partial
 import numpy as np
 import pytest
+import scipy.stats
 import xarray as xr
 import xgcm
 import joblib
+import synth
 
 from vcm.cubedsphere.coarsen import (
     _block_mode,
@@ -26,9 +29,17 @@ from vcm.cubedsphere.constants import (
     COORD_Y_CENTER,
     COORD_X_OUTER,
     COORD_Y_OUTER,
+    FV_CORE_X_CENTER,
+    FV_CORE_Y_CENTER,
 )
 from vcm.cubedsphere.io import all_filenames
-from vcm.cubedsphere import create_fv3_grid, to_cross
+from vcm.cubedsphere import (
+    coarsen_restarts_on_pressure,
+    create_fv3_grid,
+    tile_boundaries,
+    tile_halos,
+    to_cross,
+)
 from vcm.xarray_utils import assert_identical_including_dtype
 import vcm.testing
 
@@ -245,6 +256,38 @@ def test_edge_weighted_block_average(data, spacing, factor, edge, expected_data)
     assert_identical_including_dtype(result, expected)
 
 
+@pytest.mark.parametrize("use_dask", [False, True])
+def test_weighted_block_average_matches_xarray_coarsen(use_dask):
+    np.random.seed(0)
+    coords = {"x": np.arange(1.0, 9.0), "y": np.arange(1.0, 9.0)}
+    ds = xr.Dataset(
+        {
+            "a": (["t", "z", "y", "x"], np.random.normal(size=(2, 3, 8, 8))),
+            "b": (["y", "x"], np.random.normal(size=(8, 8)).astype(np.float32)),
+            "c": (["t"], [1.0, 2.0]),
+        },
+        coords=coords,
+    )
+    ds["a"][0, 0, 0, 0] = np.nan
+    weights = xr.DataArray(
+        np.random.uniform(size=(3, 8, 8)), dims=["z", "y", "x"], coords=coords
+    )
+    coarsen_kwargs = {"x": 2, "y": 2}
+    numerator = (ds * weights).coarsen(coarsen_kwargs).sum()
+    expected = numerator / weights.coarsen(coarsen_kwargs).sum()
+    if use_dask:
+        ds = ds.chunk({"x": 3, "t": 1})
+
+    result = weighted_block_average(
+        ds, weights, 2, x_dim="x", y_dim="y", coord_func="mean"
+    )
+
+    xr.testing.assert_allclose(result.compute(), expected)
+    for name in expected:
+        assert result[name].dims == expected[name].dims
+        assert result[name].dtype == expected[name].dtype
+
+
 @pytest.fixture()
 def input_dataarray():
     shape = (4, 4, 2)
@@ -696,6 +739,35 @@ def test__mode_reduce(array, axis, expected, kwargs):
     np.testing.assert_array_equal(result, expected)
 
 
+@pytest.mark.parametrize("nan_policy", ["omit", "propagate"])
+@pytest.mark.parametrize("dtype", [np.int32, np.float32, np.float64])
+def test__mode_reduce_matches_scipy(dtype, nan_policy):
+    rng = np.random.default_rng(0)
+    array = rng.integers(-2, 5, size=(3, 8, 8)).astype(dtype)
+    if np.issubdtype(dtype, np.floating):
+        array[rng.random(array.shape) < 0.2] = np.nan
+        array[:, 0] = np.nan
+        array[0, 1] = np.nan
+
+    result = _mode_reduce(array, axis=(0, 2), nan_policy=nan_policy)
+    expected = _ureduce(
+        array, partial(scipy.stats.mode, nan_policy=nan_policy), axis=(0, 2)
+    ).mode.squeeze(axis=-1)
+
+    # scipy.stats.mode omitting NaN returns zero for all-NaN slices
+    if np.issubdtype(dtype, np.floating) and nan_policy == "omit":
+        all_nan = np.isnan(array).all(axis=(0, 2))
+        np.testing.assert_array_equal(result[all_nan], np.nan)
+        result, expected = result[~all_nan], np.asarray(expected)[~all_nan]
+    assert result.dtype == dtype
+    np.testing.assert_array_equal(result, expected)
+
+
+def test__mode_non_integer_values():
+    array = np.array([[0.5, 0.5, 1.0], [2.0, 1.5, 1.5]])
+    np.testing.assert_array_equal(_mode(array, axis=1), [0.5, 1.5])
+
+
 def test__block_mode():
     data = np.array(
         [
@@ -820,6 +892,82 @@ def test_xgcm_grid_interp(grid_dataset):
     grid.interp(grid_dataset.a, "x")
 
 
+def test_tile_halos_match_xgcm_grid_interp():
+    nx = 3
+    da = xr.DataArray(
+        np.random.default_rng(0).random((6, nx, nx)),
+        dims=["tile", COORD_Y_CENTER, COORD_X_CENTER],
+        coords={"tile": np.arange(6)},
+    )
+    grid = create_fv3_grid(
+        da.to_dataset(name="a").assign_coords(
+            {COORD_X_OUTER: np.arange(nx + 1.0), COORD_Y_OUTER: np.arange(nx + 1.0)}
+        )
+    )
+    boundaries = {
+        tile: tile_boundaries(da.isel(tile=tile), COORD_X_CENTER, COORD_Y_CENTER)
+        for tile in range(6)
+    }
+    axes = {"x": (COORD_X_CENTER, COORD_X_OUTER), "y": (COORD_Y_CENTER, COORD_Y_OUTER)}
+    for tile in range(6):
+        halos = tile_halos(tile, boundaries, COORD_X_CENTER, COORD_Y_CENTER)
+        for axis, (center, outer) in axes.items():
+            interpolated = grid.interp(da, axis).isel(tile=tile)
+            first, last = halos[axis]
+            np.testing.assert_allclose(
+                interpolated.isel({outer: 0}),
+                0.5 * (first + da.isel({"tile": tile, center: 0}, drop=True)),
+            )
+            np.testing.assert_allclose(
+                interpolated.isel({outer: -1}),
+                0.5 * (last + da.isel({"tile": tile, center: -1}, drop=True)),
+            )
+
+
+def test_coarsen_restarts_on_pressure_single_tile_with_halos():
+    nx, factor = 8, 2
+    rng = np.random.default_rng(0)
+    grid_spec = xr.Dataset(
+        {
+            "area": (["tile", "grid_yt", "grid_xt"], rng.uniform(1, 2, (6, nx, nx))),
+            "dx": (["tile", "grid_y", "grid_xt"], rng.uniform(1, 2, (6, nx + 1, nx))),
+            "dy": (["tile", "grid_yt", "grid_x"], rng.uniform(1, 2, (6, nx, nx + 1))),
+        },
+        coords={"tile": np.arange(6)},
+    )
+    restarts = {
+        category: xr.concat([tiles[tile] for tile in sorted(tiles)], dim="tile")
+        for category, tiles in synth.generate_restart_data(nx=nx).items()
+    }
+    restarts = {
+        category: ds.assign_coords(tile=np.arange(6))
+        for category, ds in restarts.items()
+    }
+    # the coarsened C-grid winds depend on delp interpolated across tile edges
+    expected = coarsen_restarts_on_pressure(factor, grid_spec, restarts)
+
+    boundaries = {
+        tile: tile_boundaries(
+            restarts["fv_core.res"].delp.isel(tile=tile),
+            FV_CORE_X_CENTER,
+            FV_CORE_Y_CENTER,
+        )
+        for tile in range(6)
+    }
+    for tile in range(6):
+        halos = tile_halos(tile, boundaries, FV_CORE_X_CENTER, FV_CORE_Y_CENTER)
+        result = coarsen_restarts_on_pressure(
+            factor,
+            grid_spec.isel(tile=tile),
+            {category: ds.isel(tile=tile) for category, ds in restarts.items()},
+            delp_halos=halos,
+        )
+        for category in expected:
+            xr.testing.assert_allclose(
+                result[category], expected[category].isel(tile=tile)
+            )
+
+
 @pytest.mark.parametrize("x_dim", ["grid_xt", "x"])
 @pytest.mark.parametrize("y_dim", ["grid_yt", "y"])
 @pytest.mark.parametrize("tile_dim", ["tile", "randomname"])
@@ -1,3 +1,4 @@
+import dask.array
 import numpy as np
 import xarray as xr
 from vcm.calc.histogram import histogram, histogram2d
@@ -37,3 +38,25 @@ def test_histogram2d():
     xr.testing.assert_equal(count, expected_count)
     xr.testing.assert_equal(xwidth, expected_xwidth)
     xr.testing.assert_equal(ywidth, expected_ywidth)
+
+
+def test_histogram_dask_is_lazy():
+    data = xr.DataArray(np.random.uniform(size=(5, 4)), dims=["x", "y"], name="a")
+    bins = np.array([0, 0.3, 0.6, 1])
+    count, width = histogram(data.chunk({"x": 2}), bins=bins, density=True)
+    expected_count, expected_width = histogram(data, bins=bins, density=True)
+    assert isinstance(count.data, dask.array.Array)
+    xr.testing.assert_allclose(count.compute(), expected_count)
+    xr.testing.assert_equal(width, expected_width)
+
+
+def test_histogram2d_dask_is_lazy():
+    x = xr.DataArray(np.random.uniform(size=(5, 4)), dims=["x", "y"], name="a")
+    y = xr.DataArray(np.random.uniform(size=(5, 4)), dims=["x", "y"], name="b")
+    bins = [np.array([0, 0.5, 1]), np.array([0, 0.3, 0.6, 1])]
+    count, xwidth, ywidth = histogram2d(x.chunk({"x": 2}), y, bins=bins)
+    expected_count, expected_xwidth, expected_ywidth = histogram2d(x, y, bins=bins)
+    assert isinstance(count.data, dask.array.Array)
+    xr.testing.assert_equal(count.compute(), expected_count)
+    xr.testing.assert_equal(xwidth, expected_xwidth)
+    xr.testing.assert_equal(ywidth, expected_ywidth)
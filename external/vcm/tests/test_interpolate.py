@@ -6,6 +6,8 @@ from vcm.interpolate import (
     interpolate_unstructured,
     interpolate_1d,
     _interpolate_2d,
+    _interpolate_columns,
+    _interpolate_columns_metpy,
     interpolate_to_pressure_levels,
 )
 
@@ -144,3 +146,33 @@ def test_interpolate_to_pressure_levels_no_nans():
 
     out = interpolate_to_pressure_levels(ds.y, ds.delp, levels=ds.pressure, dim="z")
     assert not out.isnull().any().item()
+
+
+@pytest.mark.parametrize(
+    "order", ["increasing", "decreasing", "non_monotonic", "decreasing_output"]
+)
+def test__interpolate_columns_matches_metpy(order):
+    np.random.seed(0)
+    x = np.sort(np.random.uniform(0, 10, size=(1, 2, 3, 8)), axis=-1)
+    y = np.random.normal(size=(4, 2, 3, 8))
+    output_grid = np.array([-1.0, 0.5, 2.0, 5.0, 9.5, 11.0])
+    # exact match to an input level
+    x[0, 0, 0, 3] = 5.0
+    if order == "decreasing":
+        x, y = x[..., ::-1], y[..., ::-1]
+    elif order == "non_monotonic":
+        x[0, 1, 1, [2, 5]] = x[0, 1, 1, [5, 2]]
+    elif order == "decreasing_output":
+        output_grid = output_grid[::-1]
+
+    expected = _interpolate_columns_metpy(output_grid, x, y)
+    ans = _interpolate_columns(output_grid, x, y)
+    np.testing.assert_allclose(ans, expected)
+
+
+def test_interpolate_1d_dask():
+    ds = _test_dataset()
+    output_pressure = xr.DataArray([0.5, 2], dims=["pressure_uniform"])
+    expected = interpolate_1d(output_pressure, ds["pressure"], ds, dim="pfull")
+    ans = interpolate_1d(output_pressure, ds["pressure"], ds.chunk({"x": 1}), "pfull")
+    xr.testing.assert_allclose(ans.compute(), expected)
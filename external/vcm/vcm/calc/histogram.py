@@ -1,5 +1,7 @@
 from typing import Any, Hashable, Mapping, Tuple
 
+import dask
+import dask.array as dask_array
 import numpy as np
 import xarray as xr
 
@@ -13,10 +15,15 @@ def histogram(da: xr.DataArray, **kwargs) -> Tuple[xr.DataArray, xr.DataArray]:
 
     Return:
         counts, bin_widths tuple of xr.DataArrays. The coordinate of both arrays is
-        equal to the left side of the histogram bins.
+        equal to the left side of the histogram bins. If da is backed by a dask
+        array, the counts are computed lazily with dask.array.histogram, which
+        requires either the bin edges or a range to be given.
     """
     coord_name = f"{da.name}_bins" if da.name is not None else "bins"
-    count, bins = np.histogram(da, **kwargs)
+    if isinstance(da.data, dask_array.Array):
+        count, bins = dask_array.histogram(da.data, **kwargs)
+    else:
+        count, bins = np.histogram(da, **kwargs)
     coords: Mapping[Hashable, Any] = {coord_name: bins[:-1]}
     width = bins[1:] - bins[:-1]
     width_da = xr.DataArray(width, coords=coords, dims=[coord_name])
@@ -38,15 +45,27 @@ def histogram2d(
     Args:
         x: input data
         y: input data
-        kwargs: optional parameters to pass on to np.histogram
+        kwargs: optional parameters to pass on to np.histogram2d
 
     Return:
         counts, x_bin_widths, y_bin_widths tuple of xr.DataArrays. The coordinate of all
-        arrays is equal to the left side of the histogram bins.
+        arrays is equal to the left side of the histogram bins. If x or y is backed
+        by a dask array, the counts are computed lazily, which requires the bins
+        to be given as a pair of bin edge arrays.
     """
     xcoord_name = f"{x.name}_bins" if x.name is not None else "xbins"
     ycoord_name = f"{y.name}_bins" if y.name is not None else "ybins"
-    count, xedges, yedges = np.histogram2d(x.values.ravel(), y.values.ravel(), **kwargs)
+    if isinstance(x.data, dask_array.Array) or isinstance(y.data, dask_array.Array):
+        xedges, yedges = (np.asarray(edges) for edges in kwargs["bins"])
+        count = dask_array.from_delayed(
+            dask.delayed(_histogram2d_counts)(x.data.ravel(), y.data.ravel(), **kwargs),
+            shape=(len(xedges) - 1, len(yedges) - 1),
+            dtype=float,
+        )
+    else:
+        count, xedges, yedges = np.histogram2d(
+            x.values.ravel(), y.values.ravel(), **kwargs
+        )
     xcoord: Mapping[Hashable, Any] = {xcoord_name: xedges[:-1]}
     ycoord: Mapping[Hashable, Any] = {ycoord_name: yedges[:-1]}
     xwidth = xedges[1:] - xedges[:-1]
@@ -64,3 +83,8 @@ def histogram2d(
         ywidth_da.attrs["units"] = y.units
 
     return count_da, xwidth_da, ywidth_da
+
+
+def _histogram2d_counts(x: np.ndarray, y: np.ndarray, **kwargs) -> np.ndarray:
+    count, _, _ = np.histogram2d(x, y, **kwargs)
+    return count
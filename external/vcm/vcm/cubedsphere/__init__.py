@@ -12,7 +12,7 @@ from .coarsen import (
 )
 from .io import all_filenames
 from .rotate import center_and_rotate_xy_winds, rotate_xy_winds
-from .xgcm import create_fv3_grid
+from .xgcm import create_fv3_grid, tile_boundaries, tile_halos
 from .coarsen_restarts import coarsen_restarts_on_pressure, coarsen_restarts_on_sigma
 from .regridz import regrid_vertical
 from .cross import to_cross
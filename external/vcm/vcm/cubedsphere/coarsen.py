@@ -1,5 +1,6 @@
 """Tools for working with cubedsphere data"""
 from functools import partial
+import string
 from typing import (
     Any,
     Callable,
@@ -27,6 +28,9 @@ NUM_TILES = 6
 SUBTILE_FILE_PATTERN = "{prefix}.tile{tile:d}.nc.{subtile:04d}"
 STAGGERED_DIMS = [COORD_X_OUTER, COORD_Y_OUTER]
 
+# largest range of values reduced with the bincount implementation of _mode
+_MAX_MODE_BINS = 256
+
 T_DataArray_or_Dataset = TypeVar("T_DataArray_or_Dataset", xr.DataArray, xr.Dataset)
 CoordFunc = Callable[[Any, Union[int, Tuple[int]]], Any]
 
@@ -208,7 +212,7 @@ def weighted_block_average(
         xr.Dataset or xr.DataArray.
     """
     coarsen_kwargs = {x_dim: coarsening_factor, y_dim: coarsening_factor}
-    numerator = (obj * weights).coarsen(coarsen_kwargs, coord_func=coord_func).sum()  # type: ignore # noqa
+    numerator = _weighted_block_sum(obj, weights, coarsen_kwargs, coord_func)
     denominator = weights.coarsen(coarsen_kwargs, coord_func=coord_func).sum()  # type: ignore # noqa
     result = numerator / denominator
 
@@ -256,12 +260,17 @@ def edge_weighted_block_average(
     else:
         raise ValueError(f"'edge' most be either 'x' or 'y'; got {edge}.")
 
+    # downsample before coarsening, which is equivalent but reduces the work
+    downsample_kwargs = {downsample_dim: slice(None, None, coarsening_factor)}
+    downsampled_obj = obj.isel(downsample_kwargs, missing_dims="ignore")
+    spacing = spacing.isel(downsample_kwargs, missing_dims="ignore")
+
     coarsen_kwargs = {coarsen_dim: coarsening_factor}
-    numerator = (spacing * obj).coarsen(coarsen_kwargs, coord_func=coord_func).sum()  # type: ignore # noqa
+    numerator = _weighted_block_sum(
+        downsampled_obj, spacing, coarsen_kwargs, coord_func
+    )
     denominator = spacing.coarsen(coarsen_kwargs, coord_func=coord_func).sum()  # type: ignore # noqa
-    coarsened = numerator / denominator
-    downsample_kwargs = {downsample_dim: slice(None, None, coarsening_factor)}
-    result = coarsened.isel(downsample_kwargs)
+    result = numerator / denominator
 
     # Separate logic is needed to apply coord_func to the downsample dimension
     # coordinate (if it exists), because it is not included in the call to
@@ -273,6 +282,124 @@ def edge_weighted_block_average(
     return _propagate_attrs(obj, result)
 
 
+def _weighted_block_sum(
+    obj: T_DataArray_or_Dataset,
+    weights: xr.DataArray,
+    block_sizes: Mapping[Hashable, int],
+    coord_func: Union[str, CoordFunc] = coarsen_coords_coord_func,
+) -> T_DataArray_or_Dataset:
+    """Block sums of obj * weights, equivalent to
+    ``(obj * weights).coarsen(block_sizes, coord_func=coord_func).sum()``
+    without computing the full resolution product.
+    """
+    obj, weights = xr.align(obj, weights, join="inner")
+    coords = xr.Dataset(coords=obj.coords)
+    coords_block_sizes = {
+        dim: size for dim, size in block_sizes.items() if dim in coords.dims
+    }
+    if coords_block_sizes:
+        coords = coords.coarsen(coords_block_sizes, coord_func=coord_func).sum()  # type: ignore # noqa
+    if isinstance(obj, xr.Dataset):
+        data_vars = {
+            name: _weighted_block_sum_dataarray(obj[name], weights, block_sizes)
+            for name in obj.data_vars
+        }
+        return xr.Dataset(data_vars, coords=coords.coords)
+    else:
+        result = _weighted_block_sum_dataarray(obj, weights, block_sizes)
+        return result.assign_coords(coords.coords)
+
+
+def _weighted_block_sum_dataarray(
+    da: xr.DataArray, weights: xr.DataArray, block_sizes: Mapping[Hashable, int]
+) -> xr.DataArray:
+    # coordinates are coarsened separately, and the inputs are already aligned
+    da, weights = xr.broadcast(
+        da.drop_vars(da.coords), weights.drop_vars(weights.coords)
+    )
+    weights = weights.transpose(*da.dims)
+    for dim, size in block_sizes.items():
+        if da.sizes[dim] % size != 0:
+            raise ValueError(
+                f"Dimension {dim} of size {da.sizes[dim]} is not divisible by "
+                f"the block size, {size}."
+            )
+    ordered_block_sizes = tuple(block_sizes.get(dim, 1) for dim in da.dims)
+    return xr.apply_ufunc(
+        _weighted_block_sum_wrapper,
+        da,
+        weights,
+        input_core_dims=[da.dims, da.dims],
+        output_core_dims=[da.dims],
+        exclude_dims=set(da.dims),
+        dask="allowed",
+        kwargs={"block_sizes": ordered_block_sizes},
+    )
+
+
+def _weighted_block_sum_wrapper(data, weights, block_sizes):
+    """Apply _weighted_block_sum_kernel to numpy arrays, or to each block of dask
+    arrays, rechunking them so chunks are divisible by the block sizes."""
+    if isinstance(data, dask_array.Array) or isinstance(weights, dask_array.Array):
+        data = dask_array.asarray(data)
+        chunks = tuple(
+            _divisible_chunks(axis_chunks, block_size)
+            for axis_chunks, block_size in zip(data.chunks, block_sizes)
+        )
+        data = data.rechunk(chunks)
+        weights = dask_array.asarray(weights).rechunk(chunks)
+        new_chunks = tuple(
+            tuple(size // block_size for size in axis_chunks)
+            for axis_chunks, block_size in zip(chunks, block_sizes)
+        )
+        return dask_array.map_blocks(
+            _weighted_block_sum_kernel,
+            data,
+            weights,
+            block_sizes=block_sizes,
+            dtype=np.result_type(data.dtype, weights.dtype),
+            chunks=new_chunks,
+        )
+    else:
+        return _weighted_block_sum_kernel(data, weights, block_sizes)
+
+
+def _divisible_chunks(chunks: Tuple[int, ...], block_size: int) -> Tuple[int, ...]:
+    if all(size % block_size == 0 for size in chunks):
+        return chunks
+    else:
+        size = max(chunks[0] // block_size, 1) * block_size
+        total = sum(chunks)
+        return (size,) * (total // size) + ((total % size,) if total % size else ())
+
+
+def _weighted_block_sum_kernel(
+    data: np.ndarray, weights: np.ndarray, block_sizes: Tuple[int, ...]
+) -> np.ndarray:
+    """Block sums of data * weights in a single pass over the arrays
+
+    NaNs are skipped, as in xarray's coarsen sum.
+    """
+    blocked_shape: List[int] = []
+    for size, block_size in zip(data.shape, block_sizes):
+        blocked_shape.extend([size // block_size, block_size])
+    blocked_data = data.reshape(blocked_shape)
+    blocked_weights = weights.reshape(blocked_shape)
+    if _contains_nan(data) or _contains_nan(weights):
+        block_axes = tuple(range(1, len(blocked_shape), 2))
+        return np.nansum(blocked_data * blocked_weights, axis=block_axes)
+    else:
+        coarse = string.ascii_letters[: data.ndim]
+        fine = string.ascii_letters[data.ndim : 2 * data.ndim]
+        blocked = "".join(c + f for c, f in zip(coarse, fine))
+        subscripts = f"{blocked},{blocked}->{coarse}"
+        return np.einsum(subscripts, blocked_data, blocked_weights)
+
+
+def _contains_nan(array: np.ndarray) -> bool:
+    return array.dtype.kind in "fc" and bool(np.isnan(array.sum()))
+
+
 def _is_dict_like(value: Any) -> bool:
     """This is a function copied from xarray's internals for use in determining
     whether an object is dictionary like."""
@@ -644,7 +771,16 @@ def block_edge_sum(
 
 def _mode(arr: np.array, axis: int = 0, nan_policy: str = "propagate") -> np.array:
     """A version of scipy.stats.mode that only returns a NumPy array with the
-    mode values along the given axis."""
+    mode values along the given axis.
+
+    Arrays of small integer values (e.g. categorical surface fields) are
+    reduced with np.bincount; other arrays fall back to scipy.stats.mode.
+    """
+    if axis is not None and nan_policy in ("omit", "propagate"):
+        result = _integer_mode(np.asarray(arr), axis, nan_policy)
+        if result is not None:
+            return result
+
     result = scipy.stats.mode(arr, axis=axis, nan_policy=nan_policy).mode
 
     # Note that the result always has a length-one extra dimension in place of
@@ -653,6 +789,63 @@ def _mode(arr: np.array, axis: int = 0, nan_policy: str = "propagate") -> np.arr
     return np.squeeze(result, axis)
 
 
+def _integer_mode(arr: np.ndarray, axis: int, nan_policy: str) -> Optional[np.ndarray]:
+    """Mode along an axis of an array of integer values, computed by counting
+    the occurrences of each value with np.bincount.
+
+    Ties are resolved in favor of the smallest value, as in scipy.stats.mode.
+    If nan_policy is 'propagate', NaN is counted like any other value and
+    loses ties; if it is 'omit', NaN values are ignored and slices containing
+    only NaN reduce to NaN.
+
+    Returns None if the array is empty, contains non-integer values, or spans
+    more than _MAX_MODE_BINS distinct values.
+    """
+    if arr.size == 0:
+        return None
+
+    values = np.moveaxis(arr, axis, -1)
+    shape = values.shape[:-1]
+    values = values.reshape(-1, values.shape[-1])
+    n_rows = values.shape[0]
+
+    if np.issubdtype(arr.dtype, np.integer):
+        valid = None
+        vmin, vmax = int(values.min()), int(values.max())
+        bins = values.astype(np.int64) - vmin
+    elif np.issubdtype(arr.dtype, np.floating):
+        valid = ~np.isnan(values)
+        finite = values[valid]
+        if finite.size == 0 or not np.all(np.mod(finite, 1) == 0):
+            return None
+        vmin, vmax = finite.min(), finite.max()
+        bins = np.where(valid, values - vmin, 0).astype(np.int64)
+    else:
+        return None
+
+    n_bins = int(vmax - vmin) + 1
+    if n_bins > _MAX_MODE_BINS:
+        return None
+
+    if valid is not None and nan_policy == "propagate":
+        # count NaN in an extra bin following the largest value
+        n_bins += 1
+        bins[~valid] = n_bins - 1
+        valid = None
+
+    index = bins + n_bins * np.arange(n_rows)[:, np.newaxis]
+    index = index.ravel() if valid is None else index[valid]
+    counts = np.bincount(index, minlength=n_rows * n_bins)
+    mode_bin = np.argmax(counts.reshape(n_rows, n_bins), axis=-1)
+    result = (mode_bin + vmin).astype(arr.dtype)
+
+    if np.issubdtype(arr.dtype, np.floating):
+        result[mode_bin > vmax - vmin] = np.nan
+        if valid is not None:
+            result[~valid.any(axis=-1)] = np.nan
+    return result.reshape(shape)
+
+
 def _ureduce(arr: np.array, func: Callable, **kwargs) -> np.array:
     """Heavily adapted from NumPy: https://github.com/numpy/numpy/blob/
     b83f10ef7ee766bf30ccfa563b6cc8f7fd38a4c8/numpy/lib/
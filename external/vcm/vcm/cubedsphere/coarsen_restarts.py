@@ -2,7 +2,7 @@
 Utilities for coarse-graining restart data and directories
 """
 import logging
-from typing import Dict, Hashable, Mapping, Callable
+from typing import Dict, Hashable, Mapping, Callable, Optional, Tuple
 
 import dask
 import numpy as np
@@ -129,6 +129,7 @@ def coarsen_restarts_on_pressure(
     grid_spec: xr.Dataset,
     restarts: Mapping[str, xr.Dataset],
     coarsen_agrid_winds: bool = False,
+    delp_halos: Optional[Mapping[str, Tuple[xr.DataArray, xr.DataArray]]] = None,
 ) -> Mapping[str, xr.Dataset]:
     """ Coarsen a complete set of restart files, averaging on pressure levels and
     using the 'complex' surface coarsening method
@@ -141,6 +142,9 @@ def coarsen_restarts_on_pressure(
             "fv_core.res", "fv_srf_wnd.res", "fv_tracer.res", and "sfc_data".
         coarsen_agrid_winds: flag indicating whether to coarsen A-grid winds in
             "fv_core.res" restart files (default False).
+        delp_halos (optional): the "delp" of the cells adjacent to a single tile
+            in the neighboring tiles, as returned by vcm.cubedsphere.tile_halos.
+            If given, the grid_spec and restarts are the data of that tile alone.
 
     Returns:
         restarts_coarse: a dictionary with the same format as restarts but
@@ -163,6 +167,7 @@ def coarsen_restarts_on_pressure(
         ),
         coarsening_factor,
         coarsen_agrid_winds,
+        delp_halos,
     )
 
     coarsened["fv_srf_wnd.res"] = _coarse_grain_fv_srf_wnd(
@@ -279,7 +284,14 @@ def _coarse_grain_fv_core(
 
 
 def _coarse_grain_fv_core_on_pressure(
-    ds, delp, area, dx, dy, coarsening_factor, coarsen_agrid_winds=False
+    ds,
+    delp,
+    area,
+    dx,
+    dy,
+    coarsening_factor,
+    coarsen_agrid_winds=False,
+    delp_halos=None,
 ):
     """Coarse grain a set of fv_core restart files, averaging on surfaces of
     constant pressure (except for delp, DZ and phis which are averaged on model
@@ -299,11 +311,16 @@ def _coarse_grain_fv_core_on_pressure(
         Coarsening factor to use
     coarsen_agrid_winds : bool
         Whether to coarse-grain A-grid winds (default False)
+    delp_halos : Mapping[str, Tuple[xr.DataArray, xr.DataArray]], optional
+        Pressure thicknesses of the cells adjacent to a single tile, see
+        vcm.cubedsphere.tile_halos
 
     Returns
     -------
     xr.Dataset
     """
+    if delp_halos is None:
+        delp_halos = {"x": None, "y": None}
     area_weighted_vars = ["phis", "delp", "DZ"]
     mass_weighted_vars = ["W", "T"]
     if coarsen_agrid_winds:
@@ -333,6 +350,7 @@ def _coarse_grain_fv_core_on_pressure(
         x_dim=FV_CORE_X_CENTER,
         y_dim=FV_CORE_Y_OUTER,
         edge="x",
+        delp_halo=delp_halos["y"],
     )
 
     dy_pressure_regridded, masked_dy = regrid_to_edge_weighted_pressure(
@@ -343,6 +361,7 @@ def _coarse_grain_fv_core_on_pressure(
         x_dim=FV_CORE_X_OUTER,
         y_dim=FV_CORE_Y_CENTER,
         edge="y",
+        delp_halo=delp_halos["x"],
     )
 
     area_weighted = weighted_block_average(
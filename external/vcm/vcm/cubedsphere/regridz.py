@@ -2,7 +2,7 @@ import dask
 import numpy as np
 import xarray as xr
 
-from typing import Tuple, Union
+from typing import Optional, Tuple, Union
 
 import vcm.mappm
 from ..calc.thermo import pressure_at_interface
@@ -61,6 +61,7 @@ def regrid_to_edge_weighted_pressure(
     y_dim: str = FV_CORE_Y_OUTER,
     z_dim: str = RESTART_Z_CENTER,
     edge: str = "x",
+    delp_halo: Optional[Tuple[xr.DataArray, xr.DataArray]] = None,
 ) -> Union[xr.Dataset, xr.DataArray]:
     """ Vertically regrid a dataset of edge-valued quantities to coarsened
     pressure levels.
@@ -74,21 +75,32 @@ def regrid_to_edge_weighted_pressure(
         y_dim (optional): y-dimension name. Defaults to "yaxis_1"
         z_dim (optional): z-dimension name. Defaults to "zaxis_1"
         edge (optional): grid cell side to coarse-grain along {"x", "y"}
+        delp_halo (optional): pressure thicknesses of the neighboring cells
+            before and after a single tile along the axis normal to the edge,
+            see vcm.cubedsphere.tile_halos. If given, delp is the data of that
+            tile alone and need not have a tile dimension.
 
     Returns:
         tuple of regridded input Dataset and length masked wherever coarse
         pressure bottom interfaces are below fine surface pressure
     """
     hor_dims = {"x": x_dim, "y": y_dim}
-    grid = create_fv3_grid(
-        xr.Dataset({"delp": delp}),
-        x_center=FV_CORE_X_CENTER,
-        x_outer=FV_CORE_X_OUTER,
-        y_center=FV_CORE_Y_CENTER,
-        y_outer=FV_CORE_Y_OUTER,
-    )
     interp_dim = "x" if edge == "y" else "y"
-    delp_staggered = grid.interp(delp, interp_dim).assign_coords(
+    if delp_halo is None:
+        grid = create_fv3_grid(
+            xr.Dataset({"delp": delp}),
+            x_center=FV_CORE_X_CENTER,
+            x_outer=FV_CORE_X_OUTER,
+            y_center=FV_CORE_Y_CENTER,
+            y_outer=FV_CORE_Y_OUTER,
+        )
+        delp_staggered = grid.interp(delp, interp_dim)
+    else:
+        center_dim = {"x": FV_CORE_X_CENTER, "y": FV_CORE_Y_CENTER}[interp_dim]
+        delp_staggered = _interp_with_halo(
+            delp, delp_halo, center_dim, hor_dims[interp_dim]
+        )
+    delp_staggered = delp_staggered.assign_coords(
         {hor_dims[interp_dim]: np.arange(1, delp.sizes[hor_dims[edge]] + 2)}
     )
     delp_staggered_coarse = edge_weighted_block_average(
@@ -105,6 +117,30 @@ def regrid_to_edge_weighted_pressure(
     )
 
 
+def _interp_with_halo(
+    da: xr.DataArray,
+    halo: Tuple[xr.DataArray, xr.DataArray],
+    center_dim: str,
+    outer_dim: str,
+) -> xr.DataArray:
+    """Linearly interpolate cell-centered data of a single tile to the cell
+    interfaces along a dimension, given the adjacent cells of the neighboring tiles.
+    """
+    first, last = [
+        xr.DataArray(cells.variable).expand_dims(center_dim) for cells in halo
+    ]
+    extended = xr.concat(
+        [first, xr.DataArray(da.variable), last], dim=center_dim
+    ).transpose(*da.dims)
+    interpolated = 0.5 * (
+        extended[{center_dim: slice(None, -1)}] + extended[{center_dim: slice(1, None)}]
+    )
+    coords = {
+        name: coord for name, coord in da.coords.items() if center_dim not in coord.dims
+    }
+    return interpolated.rename({center_dim: outer_dim}).assign_coords(coords)
+
+
 def _regrid_given_delp(
     ds,
     delp_fine,
@@ -1,3 +1,5 @@
+from typing import Mapping, Tuple
+
 import xarray as xr
 import xgcm
 from . import constants
@@ -84,3 +86,71 @@ def create_fv3_grid(
         "y": {"center": y_center, "outer": y_outer},
     }
     return xgcm.Grid(ds, coords=coords, face_connections=FV3_FACE_CONNECTIONS)
+
+
+def tile_boundaries(
+    da: xr.DataArray, x_dim: str, y_dim: str
+) -> Mapping[str, Tuple[xr.DataArray, xr.DataArray]]:
+    """The first and last cells of a single tile along each horizontal axis
+
+    Args:
+        da: cell-centered data of a single tile
+        x_dim: the dimension name for the x centers
+        y_dim: the dimension name for the y centers
+
+    Returns:
+        mapping from axis name ("x" or "y") to the first and last cells along that
+        axis, without coordinates.
+    """
+    boundaries = {}
+    for axis, dim in [("x", x_dim), ("y", y_dim)]:
+        boundaries[axis] = (
+            xr.DataArray(da.variable[{dim: 0}]),
+            xr.DataArray(da.variable[{dim: -1}]),
+        )
+    return boundaries
+
+
+def tile_halos(
+    tile: int,
+    boundaries: Mapping[int, Mapping[str, Tuple[xr.DataArray, xr.DataArray]]],
+    x_dim: str,
+    y_dim: str,
+) -> Mapping[str, Tuple[xr.DataArray, xr.DataArray]]:
+    """The cells of the neighboring tiles adjacent to a tile
+
+    Neighbors are found with the same face connections, and rotated in the same
+    way, as in the grid returned by create_fv3_grid.
+
+    Args:
+        tile: the tile index, from 0 to 5
+        boundaries: mapping from tile index to the output of tile_boundaries for
+            every tile
+        x_dim: the dimension name for the x centers
+        y_dim: the dimension name for the y centers
+
+    Returns:
+        mapping from axis name ("x" or "y") to the cells before the first and after
+        the last cell of the tile along that axis.
+    """
+    dims = {"x": x_dim, "y": y_dim}
+    halos = {}
+    for axis, (left, right) in FV3_FACE_CONNECTIONS["tile"][tile].items():
+        left_tile, left_axis, _ = left
+        right_tile, right_axis, _ = right
+        halos[axis] = (
+            _rotate_halo(boundaries[left_tile][left_axis][1], axis, left_axis, dims),
+            _rotate_halo(boundaries[right_tile][right_axis][0], axis, right_axis, dims),
+        )
+    return halos
+
+
+def _rotate_halo(
+    halo: xr.DataArray, axis: str, neighbor_axis: str, dims: Mapping[str, str]
+) -> xr.DataArray:
+    if neighbor_axis == axis:
+        return halo
+    # the neighboring edge runs along the other axis and in the opposite direction
+    return halo[{dims[axis]: slice(None, None, -1)}].rename(
+        {dims[axis]: dims[neighbor_axis]}
+    )
@@ -98,7 +98,8 @@ def interpolate_1d(
 ) -> T:
     """Interpolates data with any shape over a specified axis.
 
-    Wraps metpy.interpolate.interplolate_1d
+    Matches metpy.interpolate.interplolate_1d, which is used as a fallback when
+    ``x`` is not monotonic along the interpolating dimension.
 
     Args:
         xp: desired output levels.
@@ -148,13 +149,8 @@ def _interpolate_1d_constant_output_levels(
     output_grid = np.asarray(xp)
     out_dim = list(xp.dims)[0]
 
-    def _interpolate(x: np.ndarray, field: np.ndarray) -> np.ndarray:
-        # axis=-1 gives a broadcast error in the current version of metpy
-        axis = field.ndim - 1
-        return metpy.interpolate.interpolate_1d(output_grid, x, field, axis=axis)
-
     output = xr.apply_ufunc(
-        _interpolate,
+        functools.partial(_interpolate_columns, output_grid),
         x,
         field,
         input_core_dims=[[dim], [dim]],
@@ -169,6 +165,73 @@ def _interpolate_1d_constant_output_levels(
     return output.transpose(*dim_order).assign_coords({out_dim: output_grid})
 
 
+def _interpolate_columns(
+    output_grid: np.ndarray, x: np.ndarray, y: np.ndarray
+) -> np.ndarray:
+    """Linearly interpolate y along its last axis to the 1D output_grid
+
+    Returns the same values as metpy.interpolate.interpolate_1d, including NaN
+    outside of the range of x. Uses a vectorized numpy implementation when
+    output_grid is monotonic and every column of x is monotonic in the same
+    direction, otherwise falls back to metpy.
+    """
+    n = x.shape[-1]
+    diff = np.diff(x, axis=-1)
+    if n < 2 or not _is_monotonic(output_grid):
+        return _interpolate_columns_metpy(output_grid, x, y)
+    elif not np.all(diff >= 0):
+        if np.all(diff <= 0):
+            # reversed views, so no copies are made
+            x, y = x[..., ::-1], y[..., ::-1]
+        else:
+            return _interpolate_columns_metpy(output_grid, x, y)
+    if output_grid[0] > output_grid[-1]:
+        return _interpolate_columns(output_grid[::-1], x, y)[..., ::-1]
+
+    index = _searchsorted_columns(x, output_grid)
+    above = np.clip(index, 1, n - 1)
+    below = above - 1
+    x_below = np.take_along_axis(x, below, axis=-1)
+    x_above = np.take_along_axis(x, above, axis=-1)
+    y_below = np.take_along_axis(y, below, axis=-1)
+    y_above = np.take_along_axis(y, above, axis=-1)
+    output = y_below + (y_above - y_below) * (
+        (output_grid - x_below) / (x_above - x_below)
+    )
+    out_of_bounds = (index == n) | (output_grid < x[..., :1])
+    return np.where(out_of_bounds, np.nan, output)
+
+
+def _searchsorted_columns(x: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Number of elements of each column of x less than each of values
+
+    Equivalent to a searchsorted of the increasing values into each sorted
+    column of x, but searches each element of x in values instead, so a single
+    searchsorted call covers all columns.
+    """
+    n, m = x.shape[-1], values.size
+    # number of values less than or equal to each element of x
+    position = np.searchsorted(values, x, side="right").reshape((-1, n))
+    n_columns = position.shape[0]
+    offsets = np.arange(0, n_columns * (m + 1), m + 1)[:, None]
+    counts = np.bincount((position + offsets).ravel(), minlength=n_columns * (m + 1))
+    index = np.cumsum(counts.reshape((n_columns, m + 1))[:, :m], axis=-1)
+    return index.reshape(x.shape[:-1] + (m,))
+
+
+def _interpolate_columns_metpy(
+    output_grid: np.ndarray, x: np.ndarray, y: np.ndarray
+) -> np.ndarray:
+    # axis=-1 gives a broadcast error in the current version of metpy
+    axis = y.ndim - 1
+    return metpy.interpolate.interpolate_1d(output_grid, x, y, axis=axis)
+
+
+def _is_monotonic(array: np.ndarray) -> bool:
+    diff = np.diff(array)
+    return bool(np.all(diff >= 0) or np.all(diff <= 0))
+
+
 def _interpolate_2d(xp: np.ndarray, x: np.ndarray, y: np.ndarray) -> np.ndarray:
     return vcm.mappm.interpolate_2d(xp, x, y, fill_value=np.nan)
 
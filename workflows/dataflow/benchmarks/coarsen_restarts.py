@@ -0,0 +1,124 @@
+"""
+Benchmark the restart coarsening pipeline with the DirectRunner on synthetic
+restart files, counting the bytes read from the input files.
+
+Usage::
+
+    python benchmarks/coarsen_restarts.py --nx 48 --factor 8 --n-times 2
+
+Additional arguments are passed to the pipeline options.
+"""
+import argparse
+import glob
+import os
+import tempfile
+import time
+from unittest import mock
+
+import synth
+from fsspec.implementations.local import LocalFileOpener
+
+from fv3net.pipelines.coarsen_restarts.pipeline import OUTPUT_CATEGORY_NAMES, run
+
+GRID_SPEC_SCHEMA = os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    "tests",
+    "local",
+    "test_coarsen_restarts",
+    "grid_spec.json",
+)
+
+
+def _grid_spec(nx):
+    scaling_factor = 384 / nx
+    ranges = {
+        "dx": synth.Range(20000 * scaling_factor, 28800 * scaling_factor),
+        "dy": synth.Range(20000 * scaling_factor, 28800 * scaling_factor),
+        "area": synth.Range(
+            3.6205933e08 * scaling_factor ** 2, 8.3428736e08 * scaling_factor ** 2
+        ),
+    }
+    with open(GRID_SPEC_SCHEMA) as f:
+        schema = synth.load(f)
+    ds = synth.generate(schema, ranges)
+    return ds.isel(
+        grid_xt=slice(nx), grid_yt=slice(nx), grid_x=slice(nx + 1), grid_y=slice(nx + 1)
+    )
+
+
+def _save_inputs(root, nx, n_times):
+    restarts = synth.generate_restart_data(nx=nx)
+    for i in range(n_times):
+        timestep = f"20160101.{i:02d}0000"
+        os.makedirs(os.path.join(root, "restarts", timestep))
+        for category, tiles in restarts.items():
+            for tile, dataset in tiles.items():
+                filename = f"{timestep}.{OUTPUT_CATEGORY_NAMES[category]}.tile{tile}.nc"
+                dataset.to_netcdf(os.path.join(root, "restarts", timestep, filename))
+
+    os.makedirs(os.path.join(root, "grid_spec"))
+    grid_spec = _grid_spec(nx)
+    for tile in range(1, 7):
+        grid_spec.to_netcdf(os.path.join(root, "grid_spec", f"grid_spec.tile{tile}.nc"))
+
+
+def _size(pattern):
+    return sum(os.path.getsize(path) for path in glob.glob(pattern, recursive=True))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nx", type=int, default=48)
+    parser.add_argument("--factor", type=int, default=8)
+    parser.add_argument("--n-times", type=int, default=2)
+    args, pipeline_args = parser.parse_known_args()
+
+    bytes_read = 0
+
+    # all local reads, including cat_file, go through a LocalFileOpener
+    def counting_read(self, *args, **kwargs):
+        nonlocal bytes_read
+        data = self.f.read(*args, **kwargs)
+        bytes_read += len(data)
+        return data
+
+    def counting_readinto(self, buffer):
+        nonlocal bytes_read
+        n = self.f.readinto(buffer)
+        bytes_read += n
+        return n
+
+    with tempfile.TemporaryDirectory() as root:
+        _save_inputs(root, args.nx, args.n_times)
+        input_bytes = _size(f"{root}/restarts/**/*.nc")
+        grid_spec_bytes = _size(f"{root}/grid_spec/*.nc")
+
+        start = time.perf_counter()
+        with mock.patch.object(
+            LocalFileOpener, "read", counting_read
+        ), mock.patch.object(
+            LocalFileOpener, "readinto", counting_readinto, create=True
+        ):
+            run(
+                os.path.join(root, "grid_spec", "grid_spec"),
+                os.path.join(root, "restarts"),
+                os.path.join(root, "output"),
+                args.factor,
+                coarsen_agrid_winds=False,
+                pipeline_args=pipeline_args,
+            )
+        elapsed = time.perf_counter() - start
+        n_outputs = len(glob.glob(f"{root}/output/**/*.nc", recursive=True))
+
+    print(f"{'wall-clock (s)':<35} {elapsed:>15.2f}")
+    print(f"{'restart bytes':<35} {input_bytes:>15d}")
+    print(f"{'grid spec bytes':<35} {grid_spec_bytes:>15d}")
+    print(f"{'bytes read':<35} {bytes_read:>15d}")
+    print(f"{'output files':<35} {n_outputs:>15d}")
+    print(f"{'bytes read per output file':<35} {bytes_read / n_outputs:>15.0f}")
+    print(f"{'restart bytes per output file':<35} {input_bytes / n_outputs:>15.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,29 @@
 import argparse
 import logging
 import os
-from typing import Iterable, Mapping, Tuple, TypeVar
+from typing import Iterable, Mapping, Tuple
 
 import apache_beam as beam
 import xarray as xr
 from apache_beam.options.pipeline_options import PipelineOptions
 
 import vcm.cubedsphere
-from fv3net.pipelines.common import FunctionSource, WriteToNetCDFs, list_timesteps
+from fv3net.pipelines.common import WriteToNetCDFs, list_timesteps
+from vcm.cubedsphere.constants import FV_CORE_X_CENTER, FV_CORE_Y_CENTER
 
 logger = logging.getLogger("CoarsenPipeline")
 logger.setLevel(logging.DEBUG)
 
+# first and last cells along each axis of a tile, see vcm.cubedsphere.tile_boundaries
+Boundaries = Mapping[str, Tuple[xr.DataArray, xr.DataArray]]
+
+OUTPUT_CATEGORY_NAMES = {
+    "fv_core.res": "fv_core_coarse.res",
+    "fv_srf_wnd.res": "fv_srf_wnd_coarse.res",
+    "fv_tracer.res": "fv_tracer_coarse.res",
+    "sfc_data": "sfc_data_coarse",
+}
+
 
 def output_filename(arg: Tuple[str, str, int], directory: str) -> str:
     time, category, tile = arg
@@ -20,51 +31,80 @@ def output_filename(arg: Tuple[str, str, int], directory: str) -> str:
     return os.path.join(directory, time, f"{time}.{category}.tile{tile}.nc")
 
 
-def _open_restart_categories(
-    time: str, prefix: str
-) -> Tuple[str, Mapping[str, xr.Dataset]]:
-    source = {}
+def split_by_tiles(time: str) -> Iterable[Tuple[str, int]]:
+    for tile in range(6):
+        yield time, tile + 1
+
 
-    OUTPUT_CATEGORY_NAMES = {
-        "fv_core.res": "fv_core_coarse.res",
-        "fv_srf_wnd.res": "fv_srf_wnd_coarse.res",
-        "fv_tracer.res": "fv_tracer_coarse.res",
-        "sfc_data": "sfc_data_coarse",
-    }
+def _open_tile(url: str, tile: int) -> xr.Dataset:
+    """Read a single tile file into memory with one request"""
+    ds = vcm.open_remote_nc(vcm.get_fs(url), url)
+    # match the tile coordinate of vcm.open_tiles
+    return ds.assign_coords(tile=tile - 1)
 
-    for output_category in OUTPUT_CATEGORY_NAMES:
-        input_category = OUTPUT_CATEGORY_NAMES[output_category]
-        tile_prefix = os.path.join(prefix, time, f"{time}.{input_category}")
-        source[output_category] = vcm.open_tiles(tile_prefix)
-    return time, source
+
+def open_restart_categories(
+    arg: Tuple[str, int], prefix: str
+) -> Tuple[Tuple[str, int], Mapping[str, xr.Dataset]]:
+    time, tile = arg
+    source = {}
+    for output_category, input_category in OUTPUT_CATEGORY_NAMES.items():
+        url = os.path.join(prefix, time, f"{time}.{input_category}.tile{tile}.nc")
+        source[output_category] = _open_tile(url, tile)
+    return (time, tile), source
+
+
+def read_delp_boundaries(
+    arg: Tuple[str, int], prefix: str
+) -> Tuple[str, Tuple[int, Boundaries]]:
+    """Read only the first and last rows and columns of delp of a tile"""
+    time, tile = arg
+    input_category = OUTPUT_CATEGORY_NAMES["fv_core.res"]
+    url = os.path.join(prefix, time, f"{time}.{input_category}.tile{tile}.nc")
+    with vcm.get_fs(url).open(url, "rb") as f, xr.open_dataset(f) as ds:
+        boundaries = {
+            axis: (first.load(), last.load())
+            for axis, (first, last) in vcm.cubedsphere.tile_boundaries(
+                ds.delp, FV_CORE_X_CENTER, FV_CORE_Y_CENTER
+            ).items()
+        }
+    return time, (tile - 1, boundaries)
+
+
+def delp_halos(
+    kv: Tuple[str, Iterable[Tuple[int, Boundaries]]]
+) -> Iterable[Tuple[Tuple[str, int], Boundaries]]:
+    """The delp halos of every tile of a timestep, from the boundaries of its
+    six tiles"""
+    time, tile_boundaries = kv
+    boundaries = dict(tile_boundaries)
+    for tile in boundaries:
+        halos = vcm.cubedsphere.tile_halos(
+            tile, boundaries, FV_CORE_X_CENTER, FV_CORE_Y_CENTER
+        )
+        yield (time, tile + 1), halos
 
 
-def coarsen_timestep(
-    arg: Tuple[str, Mapping[str, xr.Dataset]],
+def coarsen_tile(
+    kv: Tuple[Tuple[str, int], Boundaries],
+    prefix: str,
+    gridspec_path: str,
     coarsen_factor: int,
-    grid_spec: xr.Dataset,
     coarsen_agrid_winds: bool = False,
-) -> Iterable[Tuple[Tuple[str, str], Mapping[str, xr.Dataset]]]:
-
-    time, source = arg
+) -> Iterable[Tuple[Tuple[str, str, int], xr.Dataset]]:
+    """Read and coarsen the restart files of a single tile of a timestep
+
+    The data of the neighboring tiles needed to interpolate delp to the cell
+    edges is given by delp_halos.
+    """
+    (time, tile), halos = kv
+    logger.info(f"Coarsening tile {tile} of {time}")
+    _, source = open_restart_categories((time, tile), prefix)
+    grid_spec = _open_tile(f"{gridspec_path}.tile{tile}.nc", tile)
     for category, data in vcm.cubedsphere.coarsen_restarts_on_pressure(
-        coarsen_factor, grid_spec, source, coarsen_agrid_winds
+        coarsen_factor, grid_spec, source, coarsen_agrid_winds, halos
     ).items():
-        yield (time, category), data
-
-
-def split_by_tiles(kv: Tuple[Tuple, xr.Dataset]) -> Iterable[Tuple[Tuple, xr.Dataset]]:
-    key, ds = kv
-    for tile in range(6):
-        yield key + (tile + 1,), ds.isel(tile=tile)
-
-
-T = TypeVar("T")
-
-
-def load(kv: Tuple[T, xr.Dataset]) -> Tuple[T, xr.Dataset]:
-    key, val = kv
-    return key, val.load()
+        yield (time, category, tile), data.load()
 
 
 def run(
@@ -79,29 +119,31 @@ def run(
     beam_options = PipelineOptions(flags=pipeline_args, save_main_session=True)
 
     with beam.Pipeline(options=beam_options) as p:
-        grid_spec = p | FunctionSource(
-            lambda x: vcm.open_tiles(x).load(), gridspec_path
-        )
+        # Only the delp edges of each tile are grouped by timestep. Each
+        # (timestep, tile) then reads its restart files exactly once, so the
+        # memory needed by a worker is bounded by the size of a single tile
         (
             p
             | beam.Create([src_dir]).with_output_types(str)
             | "ListTimes" >> beam.ParDo(list_timesteps)
             | "ParseTimeString" >> beam.Map(vcm.parse_timestep_str_from_path)
-            # Data is still lazy at this point so reshuffle is not too costly
+            | "Split By Tiles" >> beam.ParDo(split_by_tiles)
+            # Nothing has been read yet so reshuffle is cheap
             # It distributes the work
             | "Reshuffle" >> beam.Reshuffle()
-            | "OpenRestartLazy" >> beam.Map(_open_restart_categories, src_dir)
-            | "CoarsenTStep"
+            | "ReadDelpBoundaries" >> beam.Map(read_delp_boundaries, src_dir)
+            | "GroupBoundariesByTime" >> beam.GroupByKey()
+            | "DelpHalos" >> beam.FlatMap(delp_halos)
+            # Only the halos have been read, so this reshuffle is cheap too
+            | "ReshuffleTiles" >> beam.Reshuffle()
+            | "CoarsenTile"
             >> beam.ParDo(
-                coarsen_timestep,
+                coarsen_tile,
+                prefix=src_dir,
+                gridspec_path=gridspec_path,
                 coarsen_factor=factor,
-                grid_spec=beam.pvalue.AsSingleton(grid_spec),
                 coarsen_agrid_winds=coarsen_agrid_winds,
             )
-            # Reduce problem size by splitting by tiles
-            # This will result in repeated reads to each fv_core file
-            | "Split By Tiles" >> beam.ParDo(split_by_tiles)
-            | "Force evaluation" >> beam.Map(load)
             | WriteToNetCDFs(output_filename, output_dir)
         )
 
@@ -0,0 +1,160 @@
+"""
+Benchmark the computation of prognostic run diagnostics with the default joblib
+path against the single-pass dask path.
+
+Synthetic prognostic and verification data are written to a temporary zarr store,
+which is read back through a store counting the bytes of each chunk read.
+
+Usage::
+
+    python benchmarks/prognostic_run_save.py --n-days 5 --resolution 48
+
+The joblib path uses the threading backend so that bytes read by every diagnostic
+function are counted in this process.
+"""
+import argparse
+import tempfile
+import threading
+import time
+from collections.abc import MutableMapping
+from itertools import chain
+
+import cftime
+import joblib
+import numpy as np
+import xarray as xr
+import zarr
+
+from fv3net.diagnostics._shared.constants import HISTOGRAM_BINS, WVP, COL_DRYING
+from fv3net.diagnostics.prognostic_run import compute
+from fv3net.diagnostics.prognostic_run.constants import (
+    DIURNAL_CYCLE_VARS,
+    GLOBAL_AVERAGE_VARS,
+    RMSE_VARS,
+    TIME_MEAN_VARS,
+)
+
+
+class CountingStore(MutableMapping):
+    """Wrap a zarr store, counting the number of bytes read"""
+
+    def __init__(self, store):
+        self._store = store
+        self._lock = threading.Lock()
+        self.bytes_read = 0
+
+    def __getitem__(self, key):
+        value = self._store[key]
+        with self._lock:
+            self.bytes_read += len(value)
+        return value
+
+    def __setitem__(self, key, value):
+        self._store[key] = value
+
+    def __delitem__(self, key):
+        del self._store[key]
+
+    def __iter__(self):
+        return iter(self._store)
+
+    def __len__(self):
+        return len(self._store)
+
+
+def _variables():
+    names = chain(
+        RMSE_VARS,
+        GLOBAL_AVERAGE_VARS,
+        TIME_MEAN_VARS,
+        DIURNAL_CYCLE_VARS,
+        HISTOGRAM_BINS,
+        [WVP, COL_DRYING],
+    )
+    return sorted(set(names))
+
+
+def _synthetic_run(n_days, resolution, seed) -> xr.Dataset:
+    rng = np.random.default_rng(seed)
+    times = xr.cftime_range(
+        cftime.DatetimeJulian(2016, 8, 1),
+        periods=n_days * 48,
+        freq="30T",
+        calendar="julian",
+    )
+    shape = (len(times), 6, resolution, resolution)
+    dims = ["time", "tile", "y", "x"]
+    data_vars = {
+        name: (dims, rng.uniform(0, 50, size=shape).astype(np.float32))
+        for name in _variables()
+    }
+    return xr.Dataset(data_vars, coords={"time": times})
+
+
+def _synthetic_grid(resolution) -> xr.Dataset:
+    dims = ["tile", "y", "x"]
+    shape = (6, resolution, resolution)
+    lat = np.broadcast_to(np.linspace(-89, 89, resolution)[:, None], shape)
+    lon = np.broadcast_to(np.linspace(0, 359, resolution)[None, :], shape)
+    land_sea_mask = np.indices(shape)[-1] % 3
+    return xr.Dataset(
+        {
+            "lat": (dims, lat),
+            "lon": (dims, lon),
+            "area": (dims, np.ones(shape)),
+            "land_sea_mask": (dims, land_sea_mask),
+        }
+    )
+
+
+def _open_counted(path) -> xr.Dataset:
+    store = CountingStore(zarr.DirectoryStore(path))
+    return xr.open_zarr(store), store
+
+
+def _stored_bytes(path) -> int:
+    store = zarr.DirectoryStore(path)
+    return sum(len(store[key]) for key in store)
+
+
+def _run(input_paths, grid, n_jobs, single_pass):
+    (prognostic, prognostic_store), (verification, verification_store) = [
+        _open_counted(path) for path in input_paths
+    ]
+    input_data = {"2d": (prognostic, verification, grid)}
+    start = time.perf_counter()
+    with joblib.parallel_backend("threading"):
+        compute._merge_diag_computes(
+            input_data, compute.registries, n_jobs, single_pass=single_pass
+        )
+    elapsed = time.perf_counter() - start
+    return elapsed, prognostic_store.bytes_read + verification_store.bytes_read
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-days", type=int, default=2)
+    parser.add_argument("--resolution", type=int, default=12)
+    parser.add_argument("--n-jobs", type=int, default=-1)
+    parser.add_argument("--chunk-times", type=int, default=48)
+    args = parser.parse_args()
+
+    grid = _synthetic_grid(args.resolution)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        input_paths = []
+        for name, seed in [("prognostic", 0), ("verification", 1)]:
+            path = f"{tmpdir}/{name}.zarr"
+            ds = _synthetic_run(args.n_days, args.resolution, seed)
+            ds.chunk({"time": args.chunk_times}).to_zarr(path)
+            input_paths.append(path)
+
+        stored = sum(_stored_bytes(path) for path in input_paths)
+        print(f"input stores: {stored} bytes")
+        print(f"{'path':<12} {'wall-clock (s)':>15} {'bytes read':>15}")
+        for label, single_pass in [("joblib", False), ("single-pass", True)]:
+            elapsed, bytes_read = _run(input_paths, grid, args.n_jobs, single_pass)
+            print(f"{label:<12} {elapsed:>15.2f} {bytes_read:>15d}")
+
+
+if __name__ == "__main__":
+    main()
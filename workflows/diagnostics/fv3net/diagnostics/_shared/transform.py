@@ -8,7 +8,8 @@ diagnostic function arguments.
 """
 
 import logging
-from typing import Sequence, Tuple, Callable
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Mapping, MutableMapping, Sequence, Tuple
 import numpy as np
 import pandas as pd
 import xarray as xr
@@ -56,10 +57,12 @@ def apply(
         transform_args_partial: All transform function specific arguments preceding the
             final diagnostic argument tuple, e.g., [freq_label] for resample_time
         transform_kwargs: Any transform function keyword arguments
-    
-    Note: I tried memoizing the current transforms but am unsure
-    if it will work on highly mutable datasets.
+
+    The wrapped function exposes the transform as ``transform_step`` and the wrapped
+    diagnostic function as ``diag_func``, so that a :py:class:`TransformCache` can
+    share intermediate results between diagnostic functions.
     """
+    step = TransformStep(transform_func, transform_args_partial, transform_kwargs)
 
     def _apply_to_diag_func(diag_func):
         def transform(diag_args):
@@ -71,18 +74,96 @@ def apply(
                 f"\n\tkwargs: {transform_kwargs}"
             )
 
-            # append diagnostic function input to be transformed
-            transform_args = (*transform_args_partial, diag_args)
-
-            transformed_diag_args = transform_func(*transform_args, **transform_kwargs)
-
-            return diag_func(transformed_diag_args)
+            return diag_func(step(diag_args))
 
+        transform.transform_step = step
+        transform.diag_func = diag_func
         return transform
 
     return _apply_to_diag_func
 
 
+@dataclass(frozen=True)
+class TransformStep:
+    """A transform function with its transform-specific arguments bound"""
+
+    func: Callable[..., DiagArg]
+    args: Tuple[Any, ...]
+    kwargs: Mapping[str, Any]
+
+    def __call__(self, arg: DiagArg) -> DiagArg:
+        # append diagnostic function input to be transformed
+        return self.func(*self.args, arg, **self.kwargs)
+
+    @property
+    def key(self) -> Hashable:
+        # transform arguments include unhashable objects (e.g. lists of variables),
+        # so compare them by their representation
+        return (
+            self.func.__module__,
+            self.func.__name__,
+            repr(self.args),
+            repr(sorted(self.kwargs.items())),
+        )
+
+
+class TransformCache:
+    """Memoize transformed diagnostic arguments across diagnostic functions
+
+    The transforms applied to all diagnostic functions of a registry form a DAG
+    rooted at the untransformed input. Each node is keyed by the transform, its
+    arguments and the identity of the node it is applied to, so a chain shared by
+    several diagnostic functions (e.g. 3H resampling followed by a daily mean) is
+    only evaluated once.
+
+    Transforms must not modify their inputs in place, and neither may the diagnostic
+    functions, since the cached outputs are passed to every function sharing them.
+
+    Example:
+
+        cache = TransformCache()
+        diag_func, transformed_arg = cache.prepare(registered_func, diag_arg)
+        diag_func(transformed_arg)
+    """
+
+    def __init__(self):
+        # cache values hold a reference to the transform input so that its id
+        # cannot be reused by another object while the cache is alive
+        self._outputs: MutableMapping[Hashable, Tuple[DiagArg, DiagArg]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._outputs)
+
+    def transform(self, step: TransformStep, arg: DiagArg) -> DiagArg:
+        key = (step.key, id(arg))
+        if key in self._outputs:
+            self.hits += 1
+        else:
+            self.misses += 1
+            logger.debug(f"Computing transform {step.func.__name__}: {step.key}")
+            self._outputs[key] = (arg, step(arg))
+        return self._outputs[key][1]
+
+    def prepare(
+        self, func: Callable[[DiagArg], Any], arg: DiagArg
+    ) -> Tuple[Callable[[DiagArg], Any], DiagArg]:
+        """Apply the transforms wrapping a diagnostic function using cached results
+
+        Args:
+            func: diagnostic function, possibly wrapped by :py:func:`apply`
+            arg: untransformed diagnostic function input
+
+        Returns:
+            the innermost diagnostic function and its transformed input
+        """
+        while hasattr(func, "transform_step"):
+            arg = self.transform(func.transform_step, arg)
+            func = func.diag_func
+        return func, arg
+
+
 @add_to_input_transform_fns
 def resample_time(
     freq_label: str,
@@ -1,5 +1,5 @@
 import argparse
-from fv3net.diagnostics.prognostic_run import metrics, compute
+from fv3net.diagnostics.prognostic_run import metrics, compute, incremental
 from fv3net.diagnostics.prognostic_run.views import movies, static_report
 from fv3net.diagnostics.prognostic_run.apps import log_viewer
 
@@ -17,6 +17,7 @@ def get_parser():
     )
 
     compute.register_parser(subparsers)
+    incremental.register_parser(subparsers)
     metrics.register_parser(subparsers)
     movies.register_parser(subparsers)
     static_report.register_parser(subparsers)
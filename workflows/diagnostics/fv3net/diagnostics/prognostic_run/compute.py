@@ -15,6 +15,7 @@ grouping contains outputs from the physics routines (`sfc_dt_atmos.tile*.nc` and
 from argparse import ArgumentParser
 import sys
 
+import dask
 import datetime
 import intake
 import numpy as np
@@ -24,7 +25,7 @@ import fsspec
 from joblib import Parallel, delayed
 
 
-from typing import Mapping, Union, Tuple, Sequence
+from typing import Callable, Mapping, Union, Tuple, Sequence
 
 import vcm
 
@@ -71,9 +72,24 @@ def _merge_diag_computes(
     input_data: Mapping[str, Tuple[xr.Dataset, xr.Dataset, xr.Dataset]],
     registries: Mapping[str, Registry],
     n_jobs: int,
+    single_pass: bool = False,
 ) -> Mapping[str, xr.DataArray]:
+    """Compute all diagnostics registered for the given input data.
+
+    Args:
+        input_data: mapping from registry key to (prognostic, verification, grid)
+        registries: mapping from registry key to registry of diagnostic functions
+        n_jobs: number of joblib processes used to compute diagnostics
+        single_pass: if True, build the lazy outputs of all diagnostic functions
+            and evaluate them with a single dask.compute call, so that input
+            chunks shared between diagnostics are only read once. n_jobs is
+            ignored in this case.
+    """
     # Flattens list of all computations across registries before
-    # parallelizing the computation.
+    # parallelizing the computation. Input transforms are applied up front
+    # so that transforms shared between diagnostic functions are only
+    # computed once.
+    cache = transform.TransformCache()
     merged_input_data = []
     for registry_key, (prog, verif, grid) in input_data.items():
 
@@ -92,20 +108,44 @@ def _merge_diag_computes(
             continue
 
         diag_arg = DiagArg(prog, verif, grid)
-        merged_input_data += [
-            (func_name, func, registry_key, diag_arg)
-            for func_name, func in registries[registry_key].funcs.items()
-        ]
-
-    def _compute(func_name, func, key, diag_arg):
-        return registries[key].load(func_name, func, diag_arg)
+        for func_name, func in registries[registry_key].funcs.items():
+            diag_func, transformed_arg = cache.prepare(func, diag_arg)
+            merged_input_data.append(
+                (func_name, diag_func, registry_key, transformed_arg)
+            )
 
-    computed_outputs = Parallel(n_jobs=n_jobs, verbose=True)(
-        delayed(_compute)(*compute_args) for compute_args in merged_input_data
+    logger.info(
+        f"Computed {cache.misses} input transforms, reused {cache.hits} from cache."
     )
+
+    if single_pass:
+        computed_outputs = _compute_single_pass(merged_input_data)
+    else:
+
+        def _compute(func_name, func, key, diag_arg):
+            return registries[key].load(func_name, func, diag_arg)
+
+        computed_outputs = Parallel(n_jobs=n_jobs, verbose=True)(
+            delayed(_compute)(*compute_args) for compute_args in merged_input_data
+        )
     return merge_diags(computed_outputs)
 
 
+def _compute_single_pass(
+    diag_computes: Sequence[Tuple[str, Callable, str, DiagArg]]
+) -> Sequence[Tuple[str, xr.Dataset]]:
+    names, lazy_outputs = [], []
+    for func_name, func, _, diag_arg in diag_computes:
+        logger.info(f"Building task graph for {func_name}")
+        names.append(func_name)
+        lazy_outputs.append(func(diag_arg))
+
+    logger.info(f"Computing {len(lazy_outputs)} diagnostics in a single pass")
+    with ProgressBar():
+        computed_outputs = dask.compute(*lazy_outputs)
+    return list(zip(names, computed_outputs))
+
+
 def merge_diags(diags: Sequence[Tuple[str, xr.Dataset]]) -> Mapping[str, xr.DataArray]:
     out = {}
     for name, ds in diags:
@@ -221,7 +261,7 @@ def zonal_means_3d(diag_arg: DiagArg):
         logger.info(f"Computing zonal+time means (3d) for {var}")
         with xr.set_options(keep_attrs=True):
             zm = zonal_mean(prognostic[[var]], grid.lat)
-            zm_time_mean = time_mean(zm)[var].load()
+            zm_time_mean = time_mean(zm)[var]
             zonal_means[var] = zm_time_mean
     return zonal_means
 
@@ -243,7 +283,7 @@ def zonal_bias_3d(diag_arg: DiagArg):
         logger.info(f"Computing zonal+time mean biases (3d) for {var}")
         with xr.set_options(keep_attrs=True):
             zm_bias = zonal_mean(bias(verification[[var]], prognostic[[var]]), grid.lat)
-            zm_bias_time_mean = time_mean(zm_bias)[var].load()
+            zm_bias_time_mean = time_mean(zm_bias)[var]
             zonal_means[var] = zm_bias_time_mean
     return zonal_means
 
@@ -265,7 +305,7 @@ def zonal_and_time_mean_biases_2d(diag_arg: DiagArg):
         zonal_mean_bias = zonal_mean(
             bias(verification[[var]], prognostic[[var]]), grid.lat
         )
-        zonal_means[var] = time_mean(zonal_mean_bias)[var].load()
+        zonal_means[var] = time_mean(zonal_mean_bias)[var]
     return zonal_means
 
 
@@ -280,7 +320,7 @@ def zonal_mean_hovmoller(diag_arg: DiagArg):
     for var in prognostic.data_vars:
         logger.info(f"Computing zonal mean (2d) over time for {var}")
         with xr.set_options(keep_attrs=True):
-            zonal_means[var] = zonal_mean(prognostic[[var]], grid.lat)[var].load()
+            zonal_means[var] = zonal_mean(prognostic[[var]], grid.lat)[var]
     return zonal_means
 
 
@@ -303,7 +343,7 @@ def zonal_mean_bias_hovmoller(diag_arg: DiagArg):
         with xr.set_options(keep_attrs=True):
             zonal_means[var] = zonal_mean(
                 bias(verification[[var]], prognostic[[var]]), grid.lat
-            )[var].load()
+            )[var]
     return zonal_means
 
 
@@ -400,7 +440,7 @@ for mask_type in ["global", "land", "sea"]:
         if len(prognostic.time) == 0:
             return xr.Dataset({})
         else:
-            diag = diurnal_cycle.calc_diagnostics(prognostic, verification, grid).load()
+            diag = diurnal_cycle.calc_diagnostics(prognostic, verification, grid)
             return _assign_diagnostic_time_attrs(diag, prognostic)
 
 
@@ -483,6 +523,17 @@ def register_parser(subparsers):
     parser: ArgumentParser = subparsers.add_parser(
         "save", help="Compute the prognostic run diags."
     )
+    add_input_arguments(parser)
+    parser.add_argument(
+        "--single-pass",
+        action="store_true",
+        help="Build the task graphs of all diagnostics and compute them together "
+        "with dask, reading each input chunk once. Ignores --n-jobs.",
+    )
+    parser.set_defaults(func=main)
+
+
+def add_input_arguments(parser: ArgumentParser):
     parser.add_argument("url", help="Prognostic run output location.")
     parser.add_argument("output", help="Output path including filename.")
     parser.add_argument("--catalog", default=vcm.catalog.catalog_path)
@@ -509,7 +560,6 @@ def register_parser(subparsers):
         "access data concurrently.",
         default=-1,
     )
-    parser.set_defaults(func=main)
 
 
 def get_verification(args, catalog):
@@ -519,14 +569,9 @@ def get_verification(args, catalog):
         return load_diags.CatalogSimulation(args.verification, catalog)
 
 
-def main(args):
-
-    logging.basicConfig(level=logging.INFO)
-    attrs = vars(args)
-    attrs["history"] = " ".join(sys.argv)
-
-    # begin constructing diags
-    diags = {}
+def load_input_data(args, attrs: dict):
+    """Load the input data of all registries and the grid, recording
+    the verification used in attrs"""
     catalog = intake.open_catalog(args.catalog)
     prognostic = load_diags.SegmentedRun(args.url, catalog)
     verification = get_verification(args, catalog)
@@ -536,8 +581,11 @@ def main(args):
     input_data = load_diags.evaluation_pair_to_input_data(
         prognostic, verification, grid
     )
+    return input_data, grid
+
 
-    # maps
+def get_maps(input_data) -> Mapping[str, xr.DataArray]:
+    diags = {}
     diags["pwat_run_initial"] = (
         input_data["2d"][0].PWAT.isel(time=0).rename({"time": "initial_time"})
     )
@@ -547,10 +595,10 @@ def main(args):
     diags["pwat_verification_final"] = (
         input_data["2d"][0].PWAT.isel(time=-1).rename({"time": "final_time"})
     )
+    return diags
 
-    computed_diags = _merge_diag_computes(input_data, registries, args.n_jobs)
-    diags.update(computed_diags)
 
+def save_diags(diags: Mapping[str, xr.DataArray], grid: xr.Dataset, attrs, output):
     # add grid vars
     diags = xr.Dataset(diags, attrs=attrs)
     diags = diags.merge(grid)
@@ -559,6 +607,24 @@ def main(args):
     with ProgressBar():
         diags = diags.load()
 
-    logger.info(f"Saving data to {args.output}")
-    with fsspec.open(args.output, "wb") as f:
+    logger.info(f"Saving data to {output}")
+    with fsspec.open(output, "wb") as f:
         vcm.dump_nc(diags, f)
+
+
+def main(args):
+
+    logging.basicConfig(level=logging.INFO)
+    attrs = vars(args)
+    attrs["history"] = " ".join(sys.argv)
+
+    # begin constructing diags
+    input_data, grid = load_input_data(args, attrs)
+    diags = dict(get_maps(input_data))
+
+    computed_diags = _merge_diag_computes(
+        input_data, registries, args.n_jobs, single_pass=args.single_pass
+    )
+    diags.update(computed_diags)
+
+    save_diags(diags, grid, attrs, args.output)
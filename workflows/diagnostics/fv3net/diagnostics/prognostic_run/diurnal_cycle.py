@@ -20,6 +20,16 @@ def calc_diagnostics(prognostic, verification, grid):
     prog_diurnal_ds = _calc_ds_diurnal_cycle(prognostic.assign(lon=grid["lon"]))
     verif_diurnal_ds = _calc_ds_diurnal_cycle(verification.assign(lon=grid["lon"]))
 
+    return combine_diurnal_cycles(prog_diurnal_ds, verif_diurnal_ds)
+
+
+def combine_diurnal_cycles(
+    prog_diurnal_ds: xr.Dataset, verif_diurnal_ds: xr.Dataset
+) -> xr.Dataset:
+    """
+    Add moisture components and biases against verification to the
+    diurnal cycles of the prognostic run.
+    """
     prog_diurnal_ds = _add_diurnal_moisture_components(prog_diurnal_ds)
     verif_diurnal_ds = _add_diurnal_moisture_components(verif_diurnal_ds)
 
@@ -28,21 +38,30 @@ def calc_diagnostics(prognostic, verification, grid):
     return prog_diurnal_ds
 
 
-def _calc_ds_diurnal_cycle(ds):
+def bin_local_time(ds: xr.Dataset) -> xr.Dataset:
     """
-    Calculates the diurnal cycle for all variables.  Expects
-    time dimension and longitude variable "lon".
+    Add hourly binned local time to a dataset with a time dimension
+    and longitude variable "lon".
     """
     local_time = vcm.local_time(ds, time="time", lon_var="lon")
     local_time.attrs = {"long_name": "local time", "units": "hour"}
 
     local_time = np.floor(local_time)  # equivalent to hourly binning
     ds["local_time"] = local_time
+    return ds
+
+
+def _calc_ds_diurnal_cycle(ds):
+    """
+    Calculates the diurnal cycle for all variables.  Expects
+    time dimension and longitude variable "lon".
+    """
+    ds = bin_local_time(ds)
     diurnal_cycles = xr.Dataset()
     for var in ds.data_vars:
         with xr.set_options(keep_attrs=True):
             diurnal_cycles[var] = (
-                ds[[var, "local_time"]].groupby("local_time").mean()[var].load()
+                ds[[var, "local_time"]].groupby("local_time").mean()[var]
             )
     return diurnal_cycles
 
@@ -0,0 +1,389 @@
+"""
+Incrementally update prognostic run diagnostics as segments are appended to a run.
+
+Diagnostics which are mergeable reductions over time (time means, zonal means,
+histograms and diurnal composites) are computed from running sums and counts kept
+in a sidecar zarr store, with one group per diagnostic. Each update folds only the
+times after those already accumulated into the stored state, so refreshing these
+diagnostics after a new segment costs O(segment) rather than O(run). All other
+diagnostics are computed over the full run as in ``prognostic_run_diags save``.
+
+Input transforms are applied to the full run before selecting the new times, so
+that resampling gives the same times as for a full computation.
+"""
+from argparse import ArgumentParser
+from dataclasses import dataclass
+import logging
+import sys
+from typing import Callable, Dict, Mapping, MutableMapping, Optional
+
+import cftime
+import fsspec
+import numpy as np
+import xarray as xr
+from toolz import curry
+
+import vcm
+
+from fv3net.diagnostics._shared.constants import DiagArg, HISTOGRAM_BINS
+from fv3net.diagnostics._shared.registry import Registry
+from fv3net.diagnostics._shared import transform
+from fv3net.diagnostics.prognostic_run import compute, diurnal_cycle
+from .constants import DIURNAL_CYCLE_VARS, GLOBAL_AVERAGE_VARS, TIME_MEAN_VARS
+
+logger = logging.getLogger("SaveDiags")
+
+LAST_TIME_ATTR = "last_time"
+START_TIME_ATTR = "diagnostic_start_time"
+END_TIME_ATTR = "diagnostic_end_time"
+VARIABLES_ATTR = "source_variables"
+
+
+@dataclass
+class MergeableDiagnostic:
+    """A diagnostic computed from extensive statistics accumulated over time
+
+    Attributes:
+        accumulate: computes the statistics (e.g. sums and counts) of a diagnostic
+            argument. Statistics of consecutive time ranges are merged by addition.
+        finalize: computes the diagnostic from the merged statistics
+    """
+
+    accumulate: Callable[[DiagArg], xr.Dataset]
+    finalize: Callable[[xr.Dataset], xr.Dataset]
+
+
+class MergeableRegistry:
+    def __init__(self):
+        self.diagnostics: Dict[str, MergeableDiagnostic] = {}
+
+    @curry
+    def register(
+        self,
+        name: str,
+        finalize: Callable[[xr.Dataset], xr.Dataset],
+        accumulate: Callable[[DiagArg], xr.Dataset],
+    ):
+        if name in self.diagnostics:
+            raise ValueError(f"Function {name} has already been added to registry.")
+        self.diagnostics[name] = MergeableDiagnostic(accumulate, finalize)
+        return accumulate
+
+
+# names must match those of the corresponding functions in compute.registry_2d
+mergeable_registry_2d = MergeableRegistry()
+
+
+def _stack(**datasets: xr.Dataset) -> xr.Dataset:
+    """Combine datasets into one, prefixing variable names with the keyword"""
+    return xr.merge(
+        [
+            ds.rename({variable: f"{key}.{variable}" for variable in ds.data_vars})
+            for key, ds in datasets.items()
+        ]
+    )
+
+
+def _unstack(state: xr.Dataset, key: str) -> xr.Dataset:
+    prefix = f"{key}."
+    variables = [var for var in state.data_vars if var.startswith(prefix)]
+    return state[variables].rename({var: var[len(prefix) :] for var in variables})
+
+
+def _sum_and_count(ds: xr.Dataset, dim: str = "time") -> xr.Dataset:
+    with xr.set_options(keep_attrs=True):
+        return _stack(sum=ds.sum(dim), count=ds.count(dim))
+
+
+def _mean(state: xr.Dataset) -> xr.Dataset:
+    with xr.set_options(keep_attrs=True):
+        return _unstack(state, "sum") / _unstack(state, "count")
+
+
+def merge_states(old: xr.Dataset, new: xr.Dataset) -> xr.Dataset:
+    """Add the statistics of two time ranges, treating missing bins as empty"""
+    old, new = xr.align(old, new, join="outer", fill_value=0)
+    merged = old.copy()
+    with xr.set_options(keep_attrs=True):
+        for variable in new.data_vars:
+            if variable in old:
+                merged[variable] = old[variable] + new[variable]
+            else:
+                merged[variable] = new[variable]
+    return merged
+
+
+@mergeable_registry_2d.register("time_mean_value", _mean)
+@transform.apply(transform.resample_time, "1H", inner_join=True)
+@transform.apply(transform.subset_variables, TIME_MEAN_VARS)
+def time_means_2d(diag_arg: DiagArg):
+    return _sum_and_count(diag_arg.prediction)
+
+
+@mergeable_registry_2d.register("time_mean_bias", _mean)
+@transform.apply(transform.resample_time, "1H", inner_join=True)
+@transform.apply(transform.subset_variables, TIME_MEAN_VARS)
+def time_mean_biases_2d(diag_arg: DiagArg):
+    prognostic, verification = diag_arg.prediction, diag_arg.verification
+    return _sum_and_count(compute.bias(verification, prognostic))
+
+
+@mergeable_registry_2d.register("zonal_and_time_mean", _mean)
+@transform.apply(transform.resample_time, "1H")
+@transform.apply(transform.subset_variables, GLOBAL_AVERAGE_VARS)
+def zonal_means_2d(diag_arg: DiagArg):
+    prognostic, grid = diag_arg.prediction, diag_arg.grid
+    return _sum_and_count(compute.zonal_mean(prognostic, grid.lat))
+
+
+@mergeable_registry_2d.register("zonal_bias", _mean)
+@transform.apply(transform.resample_time, "1H")
+@transform.apply(transform.subset_variables, GLOBAL_AVERAGE_VARS)
+def zonal_and_time_mean_biases_2d(diag_arg: DiagArg):
+    prognostic, verification, grid = (
+        diag_arg.prediction,
+        diag_arg.verification,
+        diag_arg.grid,
+    )
+    common_vars = list(set(prognostic.data_vars).intersection(verification.data_vars))
+    bias = compute.bias(verification[common_vars], prognostic[common_vars])
+    return _sum_and_count(compute.zonal_mean(bias, grid.lat))
+
+
+def _histogram_counts(ds: xr.Dataset) -> xr.Dataset:
+    counts = xr.Dataset()
+    for varname in ds.data_vars:
+        count, _ = vcm.histogram(ds[varname], bins=HISTOGRAM_BINS[varname])
+        counts[varname] = count.assign_attrs(ds[varname].attrs)
+    return counts
+
+
+def _density(counts: xr.Dataset) -> xr.Dataset:
+    # same normalization as np.histogram(..., density=True)
+    densities = xr.Dataset()
+    for varname in counts.data_vars:
+        count = counts[varname]
+        width = xr.DataArray(
+            np.diff(HISTOGRAM_BINS[varname]), coords=count.coords, dims=count.dims
+        )
+        if "units" in count.attrs:
+            width.attrs["units"] = count.units
+        with xr.set_options(keep_attrs=True):
+            densities[varname] = count / count.sum() / width
+        densities[f"{varname}_bin_width"] = width
+    return densities
+
+
+def _finalize_histogram(state: xr.Dataset) -> xr.Dataset:
+    return _density(_unstack(state, "prognostic"))
+
+
+def _finalize_histogram_bias(state: xr.Dataset) -> xr.Dataset:
+    prognostic = _density(_unstack(state, "prognostic"))
+    verification = _density(_unstack(state, "verification"))
+    biases = xr.Dataset()
+    for varname in _unstack(state, "prognostic").data_vars:
+        biases[varname] = compute.bias(verification[varname], prognostic[varname])
+    return biases
+
+
+@mergeable_registry_2d.register("histogram", _finalize_histogram)
+@transform.apply(transform.resample_time, "3H", inner_join=True, method="mean")
+@transform.apply(transform.subset_variables, list(HISTOGRAM_BINS.keys()))
+def compute_histogram(diag_arg: DiagArg):
+    return _stack(prognostic=_histogram_counts(diag_arg.prediction))
+
+
+@mergeable_registry_2d.register("hist_bias", _finalize_histogram_bias)
+@transform.apply(transform.resample_time, "3H", inner_join=True, method="mean")
+@transform.apply(transform.subset_variables, list(HISTOGRAM_BINS.keys()))
+def compute_histogram_bias(diag_arg: DiagArg):
+    prognostic, verification = diag_arg.prediction, diag_arg.verification
+    return _stack(
+        prognostic=_histogram_counts(prognostic),
+        verification=_histogram_counts(verification[list(prognostic.data_vars)]),
+    )
+
+
+def _diurnal_sum_and_count(ds: xr.Dataset, lon: xr.DataArray) -> xr.Dataset:
+    ds = diurnal_cycle.bin_local_time(ds.assign(lon=lon))
+    sums, counts = xr.Dataset(), xr.Dataset()
+    for var in ds.data_vars:
+        if var != "local_time":
+            with xr.set_options(keep_attrs=True):
+                grouped = ds[[var, "local_time"]].groupby("local_time")
+                sums[var] = grouped.sum()[var].load()
+                counts[var] = grouped.count()[var].load()
+    return _stack(sum=sums, count=counts)
+
+
+def _finalize_diurnal_cycle(state: xr.Dataset) -> xr.Dataset:
+    prognostic = _mean(_unstack(state, "prognostic"))
+    verification = _mean(_unstack(state, "verification"))
+    return diurnal_cycle.combine_diurnal_cycles(prognostic, verification)
+
+
+for mask_type in ["global", "land", "sea"]:
+
+    @mergeable_registry_2d.register(f"diurnal_{mask_type}", _finalize_diurnal_cycle)
+    @transform.apply(transform.mask_to_sfc_type, mask_type)
+    @transform.apply(transform.resample_time, "1H", inner_join=True)
+    @transform.apply(transform.subset_variables, DIURNAL_CYCLE_VARS)
+    def _diurnal_func(diag_arg: DiagArg, mask_type=mask_type) -> xr.Dataset:
+        logger.info(f"Accumulating diurnal cycle statistics with mask={mask_type}")
+        prognostic, verification, grid = (
+            diag_arg.prediction,
+            diag_arg.verification,
+            diag_arg.grid,
+        )
+        return _stack(
+            prognostic=_diurnal_sum_and_count(prognostic, grid.lon),
+            verification=_diurnal_sum_and_count(verification, grid.lon),
+        )
+
+
+def _select_times_after(arg: DiagArg, time: Optional[cftime.datetime]) -> DiagArg:
+    if time is None:
+        return arg
+    return DiagArg(
+        arg.prediction.isel(time=(arg.prediction.time > time).values),
+        arg.verification.isel(time=(arg.verification.time > time).values),
+        arg.grid,
+        arg.delp,
+    )
+
+
+def _open_state(mapper: MutableMapping, name: str) -> Optional[xr.Dataset]:
+    if f"{name}/.zgroup" in mapper:
+        return xr.open_zarr(mapper, group=name, consolidated=False).load()
+    else:
+        return None
+
+
+def _assign_time_attrs(diagnostics: xr.Dataset, state: xr.Dataset) -> xr.Dataset:
+    attrs = {
+        START_TIME_ATTR: state.attrs[START_TIME_ATTR],
+        END_TIME_ATTR: state.attrs[END_TIME_ATTR],
+    }
+    for variable in state.attrs[VARIABLES_ATTR]:
+        if variable in diagnostics:
+            diagnostics[variable] = diagnostics[variable].assign_attrs(attrs)
+    return diagnostics
+
+
+def update_state(
+    mapper: MutableMapping,
+    name: str,
+    diagnostic: MergeableDiagnostic,
+    diag_arg: DiagArg,
+    cache: transform.TransformCache,
+) -> Optional[xr.Dataset]:
+    """Fold the times of diag_arg not yet accumulated into the stored state
+
+    Returns:
+        the updated state, or None if no times have been accumulated
+    """
+    state = _open_state(mapper, name)
+    last_time = (
+        None
+        if state is None
+        else vcm.parse_datetime_from_str(state.attrs[LAST_TIME_ATTR])
+    )
+    accumulate, transformed_arg = cache.prepare(diagnostic.accumulate, diag_arg)
+    new_arg = _select_times_after(transformed_arg, last_time)
+    times = new_arg.prediction.time.values
+    if len(times) == 0:
+        logger.info(f"No new times to accumulate for {name}")
+        return state
+
+    logger.info(f"Accumulating {name} from {times[0]} to {times[-1]}")
+    new_state = accumulate(new_arg).load()
+    variables = list(new_arg.prediction.data_vars)
+    if state is None:
+        start_time = str(times[0])
+    else:
+        start_time = state.attrs[START_TIME_ATTR]
+        variables = sorted(set(variables).union(state.attrs[VARIABLES_ATTR]))
+        new_state = merge_states(state, new_state)
+    new_state.attrs = {
+        LAST_TIME_ATTR: vcm.encode_time(times[-1]),
+        START_TIME_ATTR: start_time,
+        END_TIME_ATTR: str(times[-1]),
+        VARIABLES_ATTR: variables,
+    }
+    new_state.to_zarr(mapper, group=name, mode="w", consolidated=False)
+    return new_state
+
+
+def compute_incremental(
+    mapper: MutableMapping,
+    diag_arg: DiagArg,
+    registry: MergeableRegistry = mergeable_registry_2d,
+) -> Mapping[str, xr.DataArray]:
+    """Update the stored state of all mergeable diagnostics and compute them
+
+    Args:
+        mapper: sidecar store of the accumulated statistics
+        diag_arg: input data of the full run
+        registry: mergeable diagnostics to compute
+
+    Returns:
+        diagnostics named as by ``prognostic_run_diags save``
+    """
+    cache = transform.TransformCache()
+    computed_outputs = []
+    for name, diagnostic in registry.diagnostics.items():
+        state = update_state(mapper, name, diagnostic, diag_arg, cache)
+        if state is not None:
+            diagnostics = _assign_time_attrs(diagnostic.finalize(state), state)
+            computed_outputs.append((name, diagnostics))
+    return compute.merge_diags(computed_outputs)
+
+
+def _exclude(registry: Registry, names) -> Registry:
+    remaining = Registry(registry.merge)
+    remaining.funcs.update(
+        {name: func for name, func in registry.funcs.items() if name not in names}
+    )
+    return remaining
+
+
+def register_parser(subparsers):
+    parser: ArgumentParser = subparsers.add_parser(
+        "save-incremental",
+        help="Compute the prognostic run diags, updating mergeable diagnostics "
+        "from statistics accumulated over previous segments.",
+    )
+    compute.add_input_arguments(parser)
+    parser.add_argument(
+        "--state",
+        required=True,
+        help="Location of the zarr store of accumulated statistics. "
+        "Created if it does not exist.",
+    )
+    parser.set_defaults(func=main)
+
+
+def main(args):
+
+    logging.basicConfig(level=logging.INFO)
+    attrs = vars(args)
+    attrs["history"] = " ".join(sys.argv)
+
+    input_data, grid = compute.load_input_data(args, attrs)
+    diags = dict(compute.get_maps(input_data))
+
+    prog, verif, grid_2d = input_data["2d"]
+    if len(prog) > 0 and len(verif) > 0:
+        mapper = fsspec.get_mapper(args.state)
+        diags.update(compute_incremental(mapper, DiagArg(prog, verif, grid_2d)))
+    else:
+        logger.warn("2d prognostic or verification data missing.")
+
+    registries = {
+        "2d": _exclude(compute.registry_2d, mergeable_registry_2d.diagnostics),
+        "3d": compute.registry_3d,
+    }
+    diags.update(compute._merge_diag_computes(input_data, registries, args.n_jobs))
+
+    compute.save_diags(diags, grid, attrs, args.output)
@@ -0,0 +1,89 @@
+from datetime import timedelta
+
+import cftime
+import numpy as np
+import pytest
+import xarray as xr
+
+from fv3net.diagnostics._shared.constants import DiagArg
+from fv3net.diagnostics.prognostic_run import compute, incremental
+
+
+def _run(seed, ntimes):
+    rng = np.random.RandomState(seed)
+    times = [
+        cftime.DatetimeJulian(2016, 8, 1) + timedelta(minutes=30 * i)
+        for i in range(ntimes)
+    ]
+    variables = [
+        "PWAT",
+        "total_precip_to_surface",
+        "PRATEsfc",
+        "LHTFLsfc",
+        "column_integrated_dQ2",
+    ]
+    dims = ["time", "tile", "y", "x"]
+    shape = (ntimes, 6, 4, 4)
+    return xr.Dataset(
+        {
+            name: (dims, rng.uniform(0, 60, size=shape), {"units": "mm"})
+            for name in variables
+        },
+        coords={"time": times},
+    ).chunk({"time": 10})
+
+
+def _grid():
+    dims = ["tile", "y", "x"]
+    shape = (6, 4, 4)
+    return xr.Dataset(
+        {
+            "lat": (dims, np.broadcast_to(np.linspace(-60, 60, 4)[:, None], shape)),
+            "lon": (dims, np.broadcast_to(np.linspace(0, 270, 4)[None, :], shape)),
+            "area": (dims, np.ones(shape)),
+            "land_sea_mask": (dims, np.indices(shape)[-1] % 3),
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def diag_arg():
+    return DiagArg(_run(0, 96), _run(1, 96), _grid())
+
+
+def _truncate(arg, ntimes):
+    return DiagArg(
+        arg.prediction.isel(time=slice(ntimes)),
+        arg.verification.isel(time=slice(ntimes)),
+        arg.grid,
+    )
+
+
+def test_compute_incremental_matches_full_computation(diag_arg):
+    mapper = {}
+    incremental.compute_incremental(mapper, _truncate(diag_arg, 41))
+    output = incremental.compute_incremental(mapper, diag_arg)
+
+    expected = compute.merge_diags(
+        (name, compute.registry_2d.funcs[name](diag_arg).load())
+        for name in incremental.mergeable_registry_2d.diagnostics
+    )
+    assert set(output) == set(expected)
+    for name in expected:
+        xr.testing.assert_allclose(output[name], expected[name])
+        assert output[name].attrs == expected[name].attrs, name
+
+
+def test_compute_incremental_without_new_times(diag_arg):
+    mapper = {}
+    first = incremental.compute_incremental(mapper, diag_arg)
+    second = incremental.compute_incremental(mapper, diag_arg)
+    for name in first:
+        xr.testing.assert_identical(first[name], second[name])
+
+
+def test_merge_states_missing_bins():
+    old = xr.Dataset({"a": ("local_time", [1, 2])}, coords={"local_time": [0, 1]})
+    new = xr.Dataset({"a": ("local_time", [1, 2])}, coords={"local_time": [1, 2]})
+    merged = incremental.merge_states(old, new)
+    np.testing.assert_array_equal(merged.a, [1, 3, 2])
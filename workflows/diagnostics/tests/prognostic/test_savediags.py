@@ -66,3 +66,29 @@ def test_get_verification_from_catalog(url, expected_cls):
 
     verification = savediags.get_verification(Args, catalog=None)
     assert isinstance(verification, expected_cls), verification
+
+
+@pytest.mark.parametrize("single_pass", [True, False])
+def test__merge_diag_computes(single_pass):
+    ntimes = 4
+    time_coord = [cftime.DatetimeJulian(2016, 4, 2, i + 1) for i in range(ntimes)]
+    ds = xr.Dataset(
+        data_vars={"temperature": (["time", "x"], np.ones((ntimes, 10)))},
+        coords={"time": time_coord},
+    ).chunk({"time": 1})
+    registry = savediags.Registry(savediags.merge_diags)
+    registry.register("time_mean")(lambda arg: savediags.time_mean(arg.prediction))
+    registry.register("bias")(
+        lambda arg: savediags.bias(arg.verification, arg.prediction)
+    )
+
+    diags = savediags._merge_diag_computes(
+        {"2d": (ds, 2 * ds, xr.Dataset())},
+        {"2d": registry},
+        n_jobs=1,
+        single_pass=single_pass,
+    )
+
+    np.testing.assert_array_equal(diags["temperature_time_mean"], np.ones(10))
+    np.testing.assert_array_equal(diags["temperature_bias"], -np.ones((ntimes, 10)))
+    assert not diags["temperature_bias"].chunks
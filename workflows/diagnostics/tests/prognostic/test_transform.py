@@ -113,3 +113,51 @@ def test_select_2d_variables(input_args):
     for subsetted_dataset in ["prediction", "verification"]:
         ds = getattr(output, subsetted_dataset)
         assert set(ds.data_vars) == {"SLMSKsfc", "temperature"}
+
+
+def test_TransformCache_shares_transforms(input_args):
+    calls = []
+
+    def counting_subset(variables, arg):
+        calls.append(variables)
+        return transform.subset_variables(variables, arg)
+
+    @transform.apply(counting_subset, ["temperature"])
+    @transform.apply(transform.mask_area, "sea")
+    def spatial_max(arg):
+        return arg.prediction.max()
+
+    @transform.apply(counting_subset, ["temperature"])
+    @transform.apply(transform.mask_area, "land")
+    def spatial_min(arg):
+        return arg.prediction.min()
+
+    cache = transform.TransformCache()
+    max_func, max_arg = cache.prepare(spatial_max, input_args)
+    min_func, min_arg = cache.prepare(spatial_min, input_args)
+
+    assert len(calls) == 1
+    assert (cache.hits, cache.misses) == (1, 3)
+    xr.testing.assert_identical(max_func(max_arg), spatial_max(input_args))
+    xr.testing.assert_identical(min_func(min_arg), spatial_min(input_args))
+
+
+def test_TransformCache_distinguishes_args(input_args):
+    @transform.apply(transform.subset_variables, ["temperature"])
+    def func_a(arg):
+        return arg
+
+    @transform.apply(transform.subset_variables, ["SLMSKsfc"])
+    def func_b(arg):
+        return arg
+
+    cache = transform.TransformCache()
+    _, arg_a = cache.prepare(func_a, input_args)
+    _, arg_b = cache.prepare(func_b, input_args)
+    other_input = transform.select_2d_variables(input_args)
+    _, arg_other_input = cache.prepare(func_a, other_input)
+
+    assert set(arg_a.prediction) == {"temperature"}
+    assert set(arg_b.prediction) == {"SLMSKsfc"}
+    assert arg_other_input is not arg_a
+    assert cache.hits == 0
@@ -1,50 +1,50 @@
 #!/usr/bin/env python3
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from glob import glob
+from functools import partial
 import os
-import json
 import logging
 import re
 import shutil
 import tempfile
+from typing import Any, Iterator, Mapping, MutableMapping, Optional, Sequence, Tuple
 
 import cftime
 import click
 import fsspec
 import numpy as np
 import random
-import xarray as xr
 import zarr
+from zarr.meta import json_dumps, json_loads
 
 from .gsutil import authenticate, upload_dir
-from .consolidate_metadata import consolidate_metadata
 
 logger = logging.getLogger(__file__)
 logging.basicConfig(level=logging.INFO)
 
 TIMESTAMP_FORMAT = "%Y%m%d.%H%M%S"
 XARRAY_DIM_NAMES_ATTR = "_ARRAY_DIMENSIONS"
+METADATA_KEYS = [".zarray", ".zgroup", ".zattrs"]
+APPEND_JOURNAL_KEY = ".zappend"
+MAX_CONCURRENT_ARRAYS = 12
 
 
-def _set_time_units_like(source_store: zarr.Group, target_store: zarr.Group):
-    """Modify all time-like variables in source_store to use same units as
-    corresponding variable in target_store. The provided source_store must be
-    opened in a mode such that it can be modified (e.g. mode='r+')"""
-    for variable, source_array in source_store.items():
-        target_array = target_store[variable]
-        if "units" in source_array.attrs and "since" in source_array.attrs["units"]:
-            _set_array_time_units_like(source_array, target_array)
+def _is_time_like(array: zarr.Array) -> bool:
+    return "units" in array.attrs and "since" in array.attrs["units"]
 
 
-def _set_array_time_units_like(source_array: zarr.Array, target_array: zarr.Array):
+def _values_with_units_like(
+    source_array: zarr.Array, target_array: zarr.Array
+) -> np.ndarray:
+    """Return the values of time-like source_array encoded with the units of the
+    corresponding target_array"""
     _assert_calendars_same(source_array, target_array)
-    source_array[:] = _rebase_times(
+    return _rebase_times(
         source_array[:],
         source_array.attrs["units"],
         source_array.attrs["calendar"],
         target_array.attrs["units"],
     )
-    source_array.attrs["units"] = target_array.attrs["units"]
 
 
 def _assert_calendars_same(source_array: zarr.Array, target_array: zarr.Array):
@@ -70,15 +70,6 @@ def _rebase_times(
     return cftime.date2num(dates, output_units, calendar)
 
 
-def _update_zarray_shape(var_path, axis, increment):
-    zarray_path = os.path.join(var_path, ".zarray")
-    with open(zarray_path) as f:
-        zarray = json.load(f)
-    zarray["shape"][axis] += increment
-    with open(zarray_path, "w") as f:
-        json.dump(zarray, f)
-
-
 def _assert_n_shift_valid(array: zarr.array, axis: str, n_shift: int):
     """Ensure chunk size evenly divides n_shift"""
     chunk_size = array.chunks[axis]
@@ -143,46 +134,127 @@ def _get_dim_size(group: zarr.Group, dim: str):
             return array.shape[axis]
 
 
-def _shift_store(group: zarr.Group, dim: str, n_shift: int):
-    """Shift local zarr store which represents an xarray dataset by n_shift along dim
-    
-    Args:
-        group: zarr Group for an xarray dataset backed by a DirectoryStore
-        dim: name of dimension of xarray dataset along which to shift zarr
-        n_shift: how far to shift. The chunk size along dim of every array in group
-            must evenly divide n_shift.
-
-    Note:
-        The zarr store represented by group will no longer be valid after this
-        function is called since its chunks will not be listed starting at 0. It is
-        intended that the output of this function be copied into another zarr store as
-        a method of appending.
-    """
-    for array in group.values():
-        if dim in array.attrs[XARRAY_DIM_NAMES_ATTR]:
-            axis = array.attrs[XARRAY_DIM_NAMES_ATTR].index(dim)
-            _shift_array(array, axis, n_shift)
-
-
-def _shift_array(array: zarr.Array, axis: int, n_shift: int):
-    """Rename files within array backed by DirectoryStore: e.g. 0.0 -> 1.0 if n_shift
-    equals chunks[axis] and axis=0"""
-    _assert_n_shift_valid(array, axis, n_shift)
-    array_path = os.path.join(array.store.dir_path(), array.path)
-    _update_zarray_shape(array_path, axis, n_shift)
-    generic_chunk_filename = ".".join("*" * array.ndim)
-    chunk_paths = glob(os.path.join(array_path, generic_chunk_filename))
-    # go in reverse order to not overwrite existing chunks
-    for chunk_path in sorted(chunk_paths, reverse=True):
-        _rename_chunk(chunk_path, axis, n_shift, array.chunks[axis])
-
-
-def _rename_chunk(chunk_path: str, axis: int, n_shift: int, chunk_size: int):
-    head, tail = os.path.split(chunk_path)
-    chunk_indices = tail.split(".")
-    chunk_indices[axis] = str(int(chunk_indices[axis]) + n_shift // chunk_size)
-    new_chunk_path = os.path.join(head, ".".join(chunk_indices))
-    os.rename(chunk_path, new_chunk_path)
+def _shift_chunk_key(key: str, axis: int, n_chunks: int) -> str:
+    """Shift the index along axis of a chunk key: e.g. 0.0 -> 1.0 if n_chunks equals
+    1 and axis=0"""
+    chunk_indices = key.split(".")
+    chunk_indices[axis] = str(int(chunk_indices[axis]) + n_chunks)
+    return ".".join(chunk_indices)
+
+
+def _encoded_chunks(array: zarr.Array) -> Iterator[Tuple[str, bytes]]:
+    """Yield (key, encoded bytes) of every chunk of array stored in its store"""
+    prefix = array.path + "/" if array.path else ""
+    for key in array.store.listdir(array.path):
+        if not key.startswith("."):
+            yield key, array.store[prefix + key]
+
+
+def _encode_like(
+    array: zarr.Array, values: np.ndarray, chunks: Optional[Sequence[int]] = None
+) -> zarr.Array:
+    """Return an in-memory zarr array holding values with the dtype and codecs
+    of array, chunked like array unless chunks is given"""
+    encoded = zarr.create(
+        shape=values.shape,
+        chunks=array.chunks if chunks is None else chunks,
+        dtype=array.dtype,
+        compressor=array.compressor,
+        filters=array.filters,
+        fill_value=array.fill_value,
+        order=array.order,
+        store=zarr.MemoryStore(),
+    )
+    encoded[...] = values
+    return encoded
+
+
+def _read_metadata(store: MutableMapping) -> Mapping[str, dict]:
+    return {
+        key: json_loads(store[key])
+        for key in store.keys()
+        if os.path.basename(key) in METADATA_KEYS
+    }
+
+
+def _consolidated_metadata(store: MutableMapping) -> Optional[Mapping[str, dict]]:
+    try:
+        return json_loads(store[".zmetadata"])["metadata"]
+    except KeyError:
+        return None
+
+
+def _get_merged_time(
+    source_group: zarr.Group, target_group: Optional[zarr.Group], dim: str
+) -> Optional[list]:
+    if dim in source_group:
+        source_time = source_group[dim]
+        if target_group is None:
+            return source_time[:].tolist()
+        target_time = target_group[dim]
+        if _is_time_like(source_time):
+            appended_time = _values_with_units_like(source_time, target_time)
+        else:
+            appended_time = source_time[:]
+        return np.concatenate([target_time[:], appended_time]).tolist()
+
+
+def _start_append(
+    target: MutableMapping,
+    source_group: zarr.Group,
+    target_group: Optional[zarr.Group],
+    dim: str,
+) -> Mapping[str, Any]:
+    """Return the journal of appending source_group to target, resuming an
+    unfinished append if target has one. The journal is written before any chunk,
+    since a resumed append can no longer read the merged time coordinate from
+    target."""
+    source_length = _get_dim_size(source_group, dim)
+    if APPEND_JOURNAL_KEY in target:
+        journal = json_loads(target[APPEND_JOURNAL_KEY])
+        if journal["length"] - journal["offset"] != source_length:
+            raise ValueError(
+                f"{target.root} has an unfinished append of a segment of length "
+                f"{journal['length'] - journal['offset']} along {dim}, which "
+                f"cannot be resumed with a segment of length {source_length}."
+            )
+        logger.info(f"Resuming unfinished append to {target.root}")
+        return journal
+    offset = 0 if target_group is None else _get_dim_size(target_group, dim)
+    journal = {
+        "offset": offset,
+        "length": offset + source_length,
+        "time": _get_merged_time(source_group, target_group, dim),
+    }
+    target[APPEND_JOURNAL_KEY] = json_dumps(journal)
+    return journal
+
+
+def _append_array_chunks(
+    source_array: zarr.Array,
+    target: MutableMapping,
+    target_group: Optional[zarr.Group],
+    dim: str,
+    offset: int,
+):
+    """Copy the encoded chunks of source_array to their keys in target, shifted
+    by offset along dim. Arrays without dim are only copied to a new target."""
+    name = source_array.basename
+    if dim in source_array.attrs[XARRAY_DIM_NAMES_ATTR]:
+        axis = source_array.attrs[XARRAY_DIM_NAMES_ATTR].index(dim)
+        _assert_n_shift_valid(source_array, axis, offset)
+        n_chunks = offset // source_array.chunks[axis]
+        if target_group is not None and _is_time_like(source_array):
+            values = _values_with_units_like(source_array, target_group[name])
+            source_array = _encode_like(source_array, values)
+    elif target_group is None:
+        axis, n_chunks = 0, 0
+    else:
+        return
+    for key, chunk in _encoded_chunks(source_array):
+        if n_chunks:
+            key = _shift_chunk_key(key, axis, n_chunks)
+        target[f"{name}/{key}"] = chunk
 
 
 def _get_initial_timestamp(rundir: str) -> str:
@@ -192,32 +264,18 @@ def _get_initial_timestamp(rundir: str) -> str:
     return start_date.strftime(TIMESTAMP_FORMAT)
 
 
-def _get_merged_time_coordinate(
-    source: str, target: str, dim: str, fs: fsspec.AbstractFileSystem
-) -> xr.DataArray:
-    source_ds = xr.open_zarr(source, consolidated=True)
-    if dim in source_ds.coords:
-        if fs.exists(target):
-            target_ds = xr.open_zarr(fs.get_mapper(target), consolidated=True)
-            time = xr.concat([target_ds[dim], source_ds[dim]], dim=dim)
-        else:
-            time = source_ds[dim]
-        return time
-
-
-def _overwrite_time_array_with_single_chunk(target: str, time: xr.DataArray, dim: str):
-    if time is not None:
-        del zarr.open_group(fsspec.get_mapper(target))[dim]
-        with tempfile.TemporaryDirectory() as tmpdir:
-            xr.Dataset({dim: time}).to_zarr(tmpdir)
-            upload_dir(tmpdir, target)
-
-
 def append_zarr_along_time(
     source_path: str, target_path: str, fs: fsspec.AbstractFileSystem, dim: str = "time"
 ):
     """Append local zarr store at source_path to zarr store at target_path along time.
-    
+
+    The encoded chunks of source_path are written directly to their shifted keys
+    in target_path, outside of the extent recorded by its metadata. The metadata
+    of target_path is written last, followed by the time coordinate, which is
+    rewritten as a single chunk, and the consolidated metadata. An append
+    interrupted before the consolidated metadata is written is resumed by calling
+    this function again with the same arguments.
+
     Args:
         source_path: Local path to zarr store that represents an xarray dataset.
         target_path: Local or remote url for zarr store to be appended to.
@@ -227,26 +285,57 @@ def append_zarr_along_time(
     Raises:
         ValueError: If the chunk size in time does not evenly divide length of time
             dimension for zarr stores at source_path.
-
-    Warning:
-        The zarr store as source_path will be modified in place.
     """
+    source_group = zarr.open_group(source_path, mode="r")
+    target = fs.get_mapper(target_path)
+    metadata = _consolidated_metadata(target)
+    if metadata is None:
+        target_group = None
+        metadata = _read_metadata(source_group.store)
+        updated_keys = set(metadata)
+    else:
+        target_group = zarr.open_consolidated(target, mode="r")
+        _assert_chunks_match(source_group, target_group, dim)
+        updated_keys = set()
+
+    journal = _start_append(target, source_group, target_group, dim)
+    source_arrays = [array for name, array in source_group.arrays() if name != dim]
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_ARRAYS) as pool:
+        append_chunks = partial(
+            _append_array_chunks,
+            target=target,
+            target_group=target_group,
+            dim=dim,
+            offset=journal["offset"],
+        )
+        list(pool.map(append_chunks, source_arrays))
+
+        for array in source_arrays:
+            if dim in array.attrs[XARRAY_DIM_NAMES_ATTR]:
+                axis = array.attrs[XARRAY_DIM_NAMES_ATTR].index(dim)
+                key = f"{array.basename}/.zarray"
+                metadata[key]["shape"][axis] = journal["length"]
+                updated_keys.add(key)
+        if journal["time"] is not None:
+            template_group = source_group if target_group is None else target_group
+            time = _encode_like(
+                template_group[dim], np.asarray(journal["time"]), (journal["length"],)
+            )
+            metadata[f"{dim}/.zarray"] = json_loads(time.store[".zarray"])
+            updated_keys.add(f"{dim}/.zarray")
 
-    merged_time = _get_merged_time_coordinate(source_path, target_path, dim, fs)
-    if fs.exists(target_path):
-        source_store = zarr.open(source_path, mode="r+")
-        target_store = zarr.open_consolidated(fsspec.get_mapper(target_path))
-        _assert_chunks_match(source_store, target_store, dim)
-        _set_time_units_like(source_store, target_store)
-        _shift_store(source_store, dim, _get_dim_size(target_store, dim))
-    elif fs.protocol == "file":
-        os.makedirs(target_path)
-
-    upload_dir(source_path, target_path)
-    _overwrite_time_array_with_single_chunk(target_path, merged_time, dim)
-
-    _, _, absolute_target_paths = fsspec.get_fs_token_paths(target_path)
-    consolidate_metadata(fs, absolute_target_paths[0])
+        list(
+            pool.map(
+                lambda key: target.__setitem__(key, json_dumps(metadata[key])),
+                updated_keys,
+            )
+        )
+    if journal["time"] is not None:
+        target[f"{dim}/0"] = time.store["0"]
+    target[".zmetadata"] = json_dumps(
+        {"zarr_consolidated_format": 1, "metadata": metadata}
+    )
+    del target[APPEND_JOURNAL_KEY]
 
 
 def append_segment(rundir: str, destination: str, segment_label: str, no_copy: bool):
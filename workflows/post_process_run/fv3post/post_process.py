@@ -1,23 +1,31 @@
 #!/usr/bin/env python3
+import concurrent.futures
+import contextlib
+import dataclasses
+import functools
+import multiprocessing
 import os
 import re
+import threading
 import yaml
 import shutil
-from typing import Sequence, Iterable, Union, Mapping
+from typing import Callable, Iterable, List, Mapping, Optional, Sequence, Union
+import fsspec
 import numpy as np
 import xarray as xr
 import tempfile
 import logging
 import click
+from fsspec.implementations.local import LocalFileSystem
 from toolz import groupby
-from itertools import chain
-from .gsutil import authenticate, upload_dir, download_directory
+from .gsutil import authenticate
 
 logger = logging.getLogger(__file__)
 logging.basicConfig(level=logging.INFO)
 
 ChunkSpec = Mapping[str, Mapping[str, int]]
 CHUNKS_DEFAULT = {"time": 96}
+TRANSFERS_DEFAULT = 8
 
 
 def _get_true_chunks(ds, chunks):
@@ -141,6 +149,294 @@ def process_item(
             logger.warning(f"{item} not found. Possibly a broken symlink.")
 
 
+@dataclasses.dataclass
+class WorkItem:
+    """An output of the post-processing and the inputs it is made from
+
+    Attributes:
+        kind: "tiles" for a group of tile files converted to a zarr store,
+            "zarr" for a zarr store to rechunk, or "file" for a file to copy
+        inputs: paths of the inputs relative to the run directory
+        output: path of the output relative to the destination
+        nbytes: total size of the inputs in bytes
+    """
+
+    kind: str
+    inputs: Sequence[str]
+    output: str
+    nbytes: int = 0
+
+
+def list_work_items(
+    walker,
+    root: str,
+    chunks: ChunkSpec,
+    files_to_skip: Sequence[str] = (),
+    size: Callable[[str], int] = lambda path: 0,
+) -> List[WorkItem]:
+    """
+    Args:
+        walker: output of os.walk, or of a similar walk through the run directory
+        root: the run directory that is walked
+        chunks: chunk sizes of the tile groups to convert to zarr stores
+        files_to_skip: paths relative to the run directory of files to skip
+        size: function returning the size in bytes of a path in the run directory
+    Returns:
+        work items, largest first
+    """
+    tiles, zarrs, other = parse_rundir(walker)
+    skip = {os.path.normpath(path) for path in files_to_skip}
+    tiles = {os.path.relpath(path, root) for path in tiles} - skip
+    other = {os.path.relpath(path, root) for path in other} - skip
+
+    items = []
+    grouped_tiles = groupby(lambda x: x[: -len(".tile1.nc")], sorted(tiles))
+    for key, files in grouped_tiles.items():
+        output = key + ".zarr"
+        if output in chunks:
+            items.append(WorkItem("tiles", files, output))
+        else:
+            other.update(files)
+    for zarr in zarrs:
+        relpath = os.path.relpath(zarr, root)
+        items.append(WorkItem("zarr", [relpath], relpath))
+    for file_ in sorted(other):
+        items.append(WorkItem("file", [file_], file_))
+
+    for item in items:
+        item.nbytes = sum(size(os.path.join(root, path)) for path in item.inputs)
+    return sorted(items, key=lambda item: item.nbytes, reverse=True)
+
+
+def process_work_item(item: WorkItem, d_in: str, d_out: str, chunks: ChunkSpec):
+    paths = [os.path.join(d_in, path) for path in item.inputs]
+    if item.kind == "tiles":
+        (obj,) = open_tiles(paths, d_in, chunks)
+    elif item.kind == "zarr":
+        (obj,) = open_zarrs(paths)
+    else:
+        (obj,) = paths
+    process_item(obj, d_in, d_out, chunks)
+
+
+class DiskBudget:
+    """Bound the number of bytes of local disk reserved at any time
+
+    A reservation larger than the budget waits until nothing else is reserved.
+    """
+
+    def __init__(self, nbytes: Optional[int] = None):
+        self.nbytes = nbytes
+        self._reserved = 0
+        self._condition = threading.Condition()
+
+    def _available(self, nbytes: int) -> bool:
+        return (
+            self.nbytes is None
+            or self._reserved == 0
+            or self._reserved + nbytes <= self.nbytes
+        )
+
+    @contextlib.contextmanager
+    def reserve(self, nbytes: int):
+        with self._condition:
+            self._condition.wait_for(lambda: self._available(nbytes))
+            self._reserved += nbytes
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._reserved -= nbytes
+                self._condition.notify_all()
+
+
+def _walk(fs: fsspec.AbstractFileSystem, path: str, sizes: dict):
+    """os.walk for a filesystem, only recursing into the directories left in the
+    list of directories, and recording the size of each file listed"""
+    dirs, files = [], []
+    for info in fs.ls(path, detail=True):
+        name = os.path.basename(info["name"].rstrip("/"))
+        if info["type"] == "directory":
+            dirs.append(name)
+        else:
+            files.append(name)
+            sizes[os.path.join(path, name)] = info["size"]
+    yield path, dirs, files
+    for dir_ in dirs:
+        yield from _walk(fs, os.path.join(path, dir_), sizes)
+
+
+def _local_size(path: str) -> int:
+    if os.path.isdir(path):
+        return sum(
+            _local_size(os.path.join(root, file_))
+            for root, _, files in os.walk(path)
+            for file_ in files
+        )
+    try:
+        return os.path.getsize(path)
+    except FileNotFoundError:
+        return 0
+
+
+def _local_files(path: str) -> List[str]:
+    if os.path.isdir(path):
+        return [
+            os.path.join(root, file_)
+            for root, _, files in os.walk(path)
+            for file_ in files
+        ]
+    elif os.path.exists(path):
+        return [path]
+    else:
+        return []
+
+
+def _process_work_item_in(pool: concurrent.futures.Executor, *args):
+    return pool.submit(process_work_item, *args).result()
+
+
+def _remove(path: str):
+    if os.path.isdir(path):
+        shutil.rmtree(path)
+    elif os.path.lexists(path):
+        os.remove(path)
+
+
+class PostProcessPipeline:
+    """Post-process work items in three concurrent stages
+
+    Inputs are downloaded with a bounded number of concurrent transfers,
+    converted in a pool of processes, and each output is uploaded as soon as
+    it is written. Local copies of the inputs and outputs of an item are removed
+    once it is uploaded, and the bytes they take up are bounded by a disk budget.
+
+    A local run directory is read in place and a local destination is written in
+    place, skipping the corresponding transfers.
+    """
+
+    def __init__(
+        self,
+        rundir: str,
+        destination: str,
+        chunks: ChunkSpec,
+        workers: int = 0,
+        transfers: int = TRANSFERS_DEFAULT,
+        disk_budget: Optional[int] = None,
+    ):
+        """
+        Args:
+            rundir: local or remote run directory
+            destination: local or remote destination
+            chunks: chunk sizes of the zarr stores written
+            workers: number of processes used to convert the data. If 0, the data
+                is converted in the threads driving the pipeline.
+            transfers: maximum number of items downloaded, and uploaded, at once
+            disk_budget: maximum number of bytes of local disk used by inputs
+                and outputs of in-flight items. Unbounded by default.
+        """
+        self.fs_in, self.rundir = fsspec.core.url_to_fs(rundir)
+        self.fs_out, self.destination = fsspec.core.url_to_fs(destination)
+        self.chunks = chunks
+        self.workers = workers
+        self.transfers = transfers
+        self.budget = DiskBudget(disk_budget)
+        self._download_slots = threading.Semaphore(transfers)
+        self._upload_slots = threading.Semaphore(transfers)
+
+    @property
+    def _remote_input(self) -> bool:
+        return not isinstance(self.fs_in, LocalFileSystem)
+
+    @property
+    def _remote_output(self) -> bool:
+        return not isinstance(self.fs_out, LocalFileSystem)
+
+    def list_work_items(self, files_to_skip: Sequence[str] = ()) -> List[WorkItem]:
+        if self._remote_input:
+            sizes: dict = {}
+            walker = _walk(self.fs_in, self.rundir, sizes)
+
+            def size(path):
+                return sizes[path] if path in sizes else self.fs_in.du(path)
+
+        else:
+            walker = os.walk(self.rundir, topdown=True)
+            size = _local_size
+        return list_work_items(walker, self.rundir, self.chunks, files_to_skip, size)
+
+    def run(self, items: Sequence[WorkItem]):
+        with contextlib.ExitStack() as stack:
+            d_in, d_out = self.rundir, self.destination
+            if self._remote_input:
+                d_in = stack.enter_context(tempfile.TemporaryDirectory())
+            if self._remote_output:
+                d_out = stack.enter_context(tempfile.TemporaryDirectory())
+
+            if self.workers > 0:
+                pool = stack.enter_context(
+                    concurrent.futures.ProcessPoolExecutor(
+                        self.workers, mp_context=multiprocessing.get_context("spawn")
+                    )
+                )
+                convert = functools.partial(_process_work_item_in, pool)
+            else:
+                convert = process_work_item
+
+            # enough threads to keep every stage of the pipeline busy
+            n_threads = 2 * self.transfers + max(self.workers, 1)
+            with concurrent.futures.ThreadPoolExecutor(n_threads) as executor:
+                futures = [
+                    executor.submit(self._run_item, item, d_in, d_out, convert)
+                    for item in items
+                ]
+                for future in concurrent.futures.as_completed(futures):
+                    future.result()
+
+    def _run_item(self, item: WorkItem, d_in: str, d_out: str, convert: Callable):
+        staged_copies = int(self._remote_input) + int(self._remote_output)
+        with self.budget.reserve(staged_copies * item.nbytes):
+            try:
+                if self._remote_input:
+                    with self._download_slots:
+                        self._download(item, d_in)
+                convert(item, d_in, d_out, self.chunks)
+                if self._remote_output:
+                    with self._upload_slots:
+                        self._upload(item, d_out)
+            finally:
+                if self._remote_input:
+                    for path in item.inputs:
+                        _remove(os.path.join(d_in, path))
+                if self._remote_output:
+                    _remove(os.path.join(d_out, item.output))
+
+    def _download(self, item: WorkItem, d_in: str):
+        logger.info(f"Downloading {item.inputs}")
+        rpaths = []
+        for path in item.inputs:
+            rpath = os.path.join(self.rundir, path)
+            if item.kind == "zarr":
+                rpaths.extend(self.fs_in.find(rpath))
+            else:
+                rpaths.append(rpath)
+        rpaths = sorted(rpaths)
+        lpaths = [os.path.join(d_in, os.path.relpath(p, self.rundir)) for p in rpaths]
+        for lpath in lpaths:
+            os.makedirs(os.path.dirname(lpath), exist_ok=True)
+        if rpaths:
+            self.fs_in.get(rpaths, lpaths)
+
+    def _upload(self, item: WorkItem, d_out: str):
+        logger.info(f"Uploading {item.output}")
+        lpaths = sorted(_local_files(os.path.join(d_out, item.output)))
+        rpaths = [
+            os.path.join(self.destination, os.path.relpath(p, d_out)) for p in lpaths
+        ]
+        if lpaths:
+            self.fs_out.put(lpaths, rpaths)
+
+
 @click.command()
 @click.argument("rundir")
 @click.argument("destination")
@@ -150,7 +446,33 @@ def process_item(
 @click.option(
     "--skip", type=click.Path(), help="path to text file listing files to skip."
 )
-def post_process_entrypoint(rundir: str, destination: str, chunks: str, skip: str):
+@click.option(
+    "--workers",
+    type=int,
+    default=None,
+    help="number of processes converting data. Defaults to the number of CPUs.",
+)
+@click.option(
+    "--transfers",
+    type=int,
+    default=TRANSFERS_DEFAULT,
+    help="maximum number of concurrent downloads, and of concurrent uploads.",
+)
+@click.option(
+    "--disk-budget-gb",
+    type=float,
+    default=None,
+    help="maximum local disk used for downloaded inputs and staged outputs.",
+)
+def post_process_entrypoint(
+    rundir: str,
+    destination: str,
+    chunks: str,
+    skip: str,
+    workers: Optional[int],
+    transfers: int,
+    disk_budget_gb: Optional[float],
+):
     """Post-process the fv3gfs output located RUNDIR and save to DESTINATION
 
     RUNDIR and DESTINATION may be local or GCS paths.
@@ -158,10 +480,19 @@ def post_process_entrypoint(rundir: str, destination: str, chunks: str, skip: st
     This script rechunks the python zarr output and converts the netCDF
     outputs to zarr.
     """
-    post_process(rundir, destination, chunks, skip)
-
-
-def post_process(rundir: str, destination: str, chunks: str, skip: str):
+    disk_budget = None if disk_budget_gb is None else int(disk_budget_gb * 2 ** 30)
+    post_process(rundir, destination, chunks, skip, workers, transfers, disk_budget)
+
+
+def post_process(
+    rundir: str,
+    destination: str,
+    chunks: str,
+    skip: str,
+    workers: Optional[int] = None,
+    transfers: int = TRANSFERS_DEFAULT,
+    disk_budget: Optional[int] = None,
+):
     logger.info("Post-processing the run")
     authenticate()
 
@@ -177,27 +508,13 @@ def post_process(rundir: str, destination: str, chunks: str, skip: str):
     else:
         files_to_skip = []
 
-    with tempfile.TemporaryDirectory() as d_in, tempfile.TemporaryDirectory() as d_out:
-        if rundir.startswith("gs://"):
-            download_directory(rundir, d_in)
-        else:
-            d_in = rundir
-
-        if not destination.startswith("gs://"):
-            d_out = destination
-
-        tiles, zarrs, other = parse_rundir(os.walk(d_in, topdown=True))
-
-        files_to_skip = [os.path.join(d_in, file_) for file_ in files_to_skip]
-        files_to_skip = [os.path.normpath(path) for path in files_to_skip]
-        tiles = set(tiles) - set(files_to_skip)
-        other = set(other) - set(files_to_skip)
-
-        for item in chain(open_tiles(tiles, d_in, chunks), open_zarrs(zarrs), other):
-            process_item(item, d_in, d_out, chunks)
+    if workers is None:
+        workers = os.cpu_count() or 1
 
-        if destination.startswith("gs://"):
-            upload_dir(d_out, destination)
+    pipeline = PostProcessPipeline(
+        rundir, destination, chunks, workers, transfers, disk_budget
+    )
+    pipeline.run(pipeline.list_work_items(files_to_skip))
 
 
 if __name__ == "__main__":
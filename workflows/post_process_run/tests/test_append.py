@@ -2,10 +2,10 @@ import fsspec
 import numpy as np
 import xarray as xr
 import fv3post.append as append
-import os
 import zarr
 import cftime
 import pytest
+from zarr.meta import json_dumps
 
 
 def _time_array(n, units):
@@ -35,12 +35,11 @@ def test__assert_calendars_same(source_attr, target_attr, expected_error):
         append._assert_calendars_same(source_array, target_array)
 
 
-def test__set_array_time_units_like():
+def test__values_with_units_like():
     source_array = _time_array(3, "days since 2016-08-08")
     target_array = _time_array(3, "days since 2016-08-05")
-    append._set_array_time_units_like(source_array, target_array)
-    assert source_array.attrs["units"] == target_array.attrs["units"]
-    np.testing.assert_allclose(source_array[:], np.arange(3, 6))
+    values = append._values_with_units_like(source_array, target_array)
+    np.testing.assert_allclose(values, np.arange(3, 6))
 
 
 def test__get_initial_timestamp(tmpdir):
@@ -51,35 +50,36 @@ def test__get_initial_timestamp(tmpdir):
 
 
 @pytest.mark.parametrize(
-    "shape, chunks, ax, shift, raises_value_error",
+    "key, axis, n_chunks, expected",
     [
-        ((8,), (2,), 0, 4, False),
-        ((8, 4), (2, 1), 0, 8, False),
-        ((8, 4), (2, 2), 0, 8, False),
-        ((8, 4), (2, 1), 0, 16, False),
-        ((8, 4), (2, 1), 1, 1, False),
-        ((8, 4), (2, 1), 1, 2, False),
-        ((8, 4), (3, 1), 0, 8, True),
-        ((8, 4), (2, 1), 0, 7, True),
+        ("0", 0, 2, "2"),
+        ("1.0", 0, 3, "4.0"),
+        ("1.0", 1, 3, "1.3"),
+        ("9.2.1", 0, 1, "10.2.1"),
     ],
 )
-def test__shift_array(tmpdir, shape, chunks, ax, shift, raises_value_error):
-    path = str(tmpdir.join("test.zarr"))
-    z1 = zarr.open(path, mode="w", shape=shape, chunks=chunks)
-    z1[:] = np.zeros(shape)
+def test__shift_chunk_key(key, axis, n_chunks, expected):
+    assert append._shift_chunk_key(key, axis, n_chunks) == expected
+
+
+@pytest.mark.parametrize(
+    "shape, chunks, axis, offset, raises_value_error",
+    [((8, 4), (2, 1), 0, 8, False), ((8, 4), (3, 1), 0, 8, True)],
+)
+def test__append_array_chunks(tmpdir, shape, chunks, axis, offset, raises_value_error):
+    source = zarr.open_group(str(tmpdir.join("source.zarr")), mode="w")
+    array = source.zeros("a", shape=shape, chunks=chunks)
+    array.attrs[append.XARRAY_DIM_NAMES_ATTR] = ["time", "x"]
+    array[:] = np.arange(np.prod(shape)).reshape(shape)
+    target = {}
     if raises_value_error:
         with pytest.raises(ValueError):
-            append._shift_array(z1, ax, shift)
+            append._append_array_chunks(array, target, None, "time", offset)
     else:
-        items_before = os.listdir(path)
-        append._shift_array(z1, ax, shift)
-        items_after = os.listdir(path)
-        assert len(items_before) == len(items_after)
-        for item in items_before:
-            if item != ".zarray":
-                chunk_indices = item.split(".")
-                chunk_indices[ax] = str(int(chunk_indices[ax]) + shift // chunks[ax])
-                assert ".".join(chunk_indices) in items_after
+        append._append_array_chunks(array, target, None, "time", offset)
+        for key, _ in append._encoded_chunks(array):
+            shifted_key = append._shift_chunk_key(key, axis, offset // chunks[axis])
+            assert target[f"a/{shifted_key}"] == array.store[f"a/{key}"]
 
 
 def _get_datasets_to_append(with_coords, lengths, chunk_sizes):
@@ -139,6 +139,40 @@ def test_append_zarr_along_time(
         xr.testing.assert_identical(manually_appended_ds, expected_ds)
 
 
+def test_append_zarr_along_time_leaves_source_unchanged(tmpdir):
+    fs = fsspec.filesystem("file")
+    datasets = _get_datasets_to_append(True, (6, 6), (2, 2))
+    paths = [str(tmpdir.join(f"ds{i}.zarr")) for i in range(len(datasets))]
+    for ds, path in zip(datasets, paths):
+        ds.to_zarr(path, consolidated=True)
+    append.append_zarr_along_time(paths[1], paths[0], fs)
+    xr.testing.assert_identical(xr.open_zarr(paths[1]), datasets[1])
+
+
+def test_append_zarr_along_time_resumes_interrupted_append(tmpdir, monkeypatch):
+    fs = fsspec.filesystem("file")
+    datasets = _get_datasets_to_append(True, (6, 6), (2, 2))
+    paths = [str(tmpdir.join(f"ds{i}.zarr")) for i in range(len(datasets))]
+    for ds, path in zip(datasets, paths):
+        ds.to_zarr(path, consolidated=True)
+
+    def interrupt_before_consolidating(obj):
+        if "zarr_consolidated_format" in obj:
+            raise RuntimeError("interrupted")
+        return json_dumps(obj)
+
+    with monkeypatch.context() as m:
+        m.setattr(append, "json_dumps", interrupt_before_consolidating)
+        with pytest.raises(RuntimeError):
+            append.append_zarr_along_time(paths[1], paths[0], fs)
+    assert zarr.open_consolidated(paths[0])["var1"].shape == (6, 5)
+
+    append.append_zarr_along_time(paths[1], paths[0], fs)
+    expected_ds = xr.concat(datasets, dim="time")
+    xr.testing.assert_identical(xr.open_zarr(paths[0], consolidated=True), expected_ds)
+    assert append.APPEND_JOURNAL_KEY not in fs.get_mapper(paths[0])
+
+
 def test_appended_zarr_has_single_time_chunk(tmpdir):
     fs = fsspec.filesystem("file")
     datasets = _get_datasets_to_append(True, (6, 6), (2, 2))
@@ -1,12 +1,18 @@
 import os
+import fsspec
 import numpy as np
+import pytest
 import xarray as xr
+import yaml
 from fv3post.post_process import (
     parse_rundir,
     process_item,
     open_tiles,
     cast_time,
     clear_encoding,
+    list_work_items,
+    post_process,
+    WorkItem,
 )
 import tempfile
 from datetime import datetime
@@ -57,6 +63,100 @@ def test_parse_rundir_os_walk_integration(tmpdir):
     assert set(other) == {f"{tmpdir}/INPUT/restart.nc", f"{tmpdir}/randomfile"}
 
 
+def test_list_work_items_mocked_walker():
+    walker = [
+        (
+            "/run",
+            ["diags.zarr", "INPUT"],
+            ["a.tile1.nc", "a.tile2.nc", "b.tile1.nc", "randomfile"],
+        ),
+        ("/run/diags.zarr", [], [".zattrs"]),
+        ("/run/INPUT", [], ["restart.nc", "skipped.nc"]),
+    ]
+    sizes = {"/run/a.tile1.nc": 10, "/run/a.tile2.nc": 10, "/run/diags.zarr": 30}
+
+    items = list_work_items(
+        walker,
+        "/run",
+        chunks={"a.zarr": {"time": 1}},
+        files_to_skip=["INPUT/skipped.nc"],
+        size=lambda path: sizes.get(path, 1),
+    )
+
+    assert items[:2] == [
+        WorkItem("zarr", ["diags.zarr"], "diags.zarr", 30),
+        WorkItem("tiles", ["a.tile1.nc", "a.tile2.nc"], "a.zarr", 20),
+    ]
+    assert {item.output: item.kind for item in items[2:]} == {
+        "INPUT/restart.nc": "file",
+        "b.tile1.nc": "file",
+        "randomfile": "file",
+    }
+
+
+def _write_rundir(fs, rundir):
+    ds = xr.Dataset({"a": (["time", "x"], np.ones((10, 4)))})
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for tile in range(1, 7):
+            ds.to_netcdf(os.path.join(tmpdir, f"a.tile{tile}.nc"))
+        ds.to_zarr(os.path.join(tmpdir, "diags.zarr"))
+        os.makedirs(os.path.join(tmpdir, "INPUT"))
+        for path in ["INPUT/restart.nc", "skipped.txt", "chunks.yaml"]:
+            with open(os.path.join(tmpdir, path), "w") as f:
+                f.write(path)
+        with open(os.path.join(tmpdir, "chunks.yaml"), "w") as f:
+            yaml.safe_dump({"a.zarr": {"time": 5}}, f)
+        with open(os.path.join(tmpdir, "skip.txt"), "w") as f:
+            f.write("skipped.txt\n")
+        fs.put(tmpdir, rundir, recursive=True)
+
+
+def _assert_post_processed(fs, destination):
+    chunked = xr.open_zarr(fs.get_mapper(os.path.join(destination, "a.zarr")))
+    assert chunked.chunks["time"] == (5, 5)
+    xr.open_zarr(fs.get_mapper(os.path.join(destination, "diags.zarr")))
+    assert fs.cat(os.path.join(destination, "INPUT/restart.nc")) == b"INPUT/restart.nc"
+    assert not fs.exists(os.path.join(destination, "skipped.txt"))
+    assert not fs.exists(os.path.join(destination, "a.tile1.nc"))
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_post_process_local(tmpdir, workers):
+    rundir = str(tmpdir.join("rundir"))
+    destination = str(tmpdir.join("destination"))
+    fs = fsspec.filesystem("file")
+    _write_rundir(fs, rundir)
+
+    post_process(
+        rundir,
+        destination,
+        os.path.join(rundir, "chunks.yaml"),
+        os.path.join(rundir, "skip.txt"),
+        workers=workers,
+    )
+
+    _assert_post_processed(fs, destination)
+
+
+def test_post_process_remote_with_disk_budget(tmpdir):
+    fs = fsspec.filesystem("memory")
+    _write_rundir(fs, "memory://rundir")
+    config = tmpdir.mkdir("config")
+    fs.get("memory://rundir/chunks.yaml", str(config.join("chunks.yaml")))
+    fs.get("memory://rundir/skip.txt", str(config.join("skip.txt")))
+
+    post_process(
+        "memory://rundir",
+        "memory://destination",
+        str(config.join("chunks.yaml")),
+        str(config.join("skip.txt")),
+        workers=0,
+        disk_budget=1,
+    )
+
+    _assert_post_processed(fs, "memory://destination")
+
+
 def test_process_item_dataset(tmpdir):
     d_in = str(tmpdir)
     localpath = str(tmpdir.join("diags.zarr"))
@@ -0,0 +1,112 @@
+"""
+Benchmark the per-step overhead of averaging diagnostics with DiagnosticFile
+against accumulating xarray objects directly.
+
+Synthetic float32 3D diagnostics of a single rank's subdomain are observed every
+step and averaged over intervals of several steps. The sink discards the output.
+
+Usage::
+
+    python benchmarks/diagnostic_file.py --n-variables 100 --nx 48 --nz 79
+
+"""
+import argparse
+import time
+from datetime import timedelta
+
+import cftime
+import numpy as np
+import xarray as xr
+
+from runtime.diagnostics.manager import DiagnosticFile
+from runtime.diagnostics.time import IntervalAveragedTimes
+
+
+class NullSink:
+    def sink(self, time, data):
+        pass
+
+
+class XarrayRunningAverage:
+    """Accumulate running totals with xarray arithmetic"""
+
+    def __init__(self, variables, times):
+        self.variables = variables
+        self.times = times
+        self._running_total = {}
+        self._current_label = None
+        self._n = 0
+
+    def observe(self, time, diagnostics):
+        label = self.times.indicator(time)
+        if label != self._current_label:
+            self.flush()
+            self._running_total = {
+                key: diagnostics[key].copy() for key in self.variables
+            }
+            self._current_label = label
+            self._n = 1
+        else:
+            self._n += 1
+            for key in self.variables:
+                self._running_total[key] += diagnostics[key]
+
+    def flush(self):
+        if self._current_label is not None:
+            NullSink().sink(
+                self._current_label,
+                {key: val / self._n for key, val in self._running_total.items()},
+            )
+
+
+def _diagnostics(n_variables: int, nx: int, nz: int, seed: int):
+    rng = np.random.default_rng(seed)
+    return {
+        f"var_{i}": xr.DataArray(
+            rng.normal(size=(nz, nx, nx)).astype(np.float32),
+            dims=["z", "y", "x"],
+            attrs={"units": "K"},
+        )
+        for i in range(n_variables)
+    }
+
+
+def _time_per_step(averager, samples, n_steps: int) -> float:
+    initial_time = cftime.DatetimeJulian(2016, 8, 1)
+    start = time.perf_counter()
+    for step in range(n_steps):
+        averager.observe(
+            initial_time + timedelta(minutes=15 * step), samples[step % len(samples)]
+        )
+    averager.flush()
+    return (time.perf_counter() - start) / n_steps
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-variables", type=int, default=100)
+    parser.add_argument("--nx", type=int, default=48)
+    parser.add_argument("--nz", type=int, default=79)
+    parser.add_argument("--n-steps", type=int, default=48)
+    parser.add_argument("--steps-per-interval", type=int, default=12)
+    args = parser.parse_args()
+
+    samples = [_diagnostics(args.n_variables, args.nx, args.nz, i) for i in range(2)]
+    variables = list(samples[0])
+    initial_time = cftime.DatetimeJulian(2016, 8, 1)
+    interval = timedelta(minutes=15 * args.steps_per_interval)
+
+    def times():
+        return IntervalAveragedTimes(interval, initial_time, includes_lower=True)
+
+    averagers = {
+        "xarray": XarrayRunningAverage(variables, times()),
+        "DiagnosticFile": DiagnosticFile(variables, times(), NullSink()),
+    }
+    for name, averager in averagers.items():
+        seconds = _time_per_step(averager, samples, args.n_steps)
+        print(f"{name}: {seconds * 1e3:.1f} ms per step")
+
+
+if __name__ == "__main__":
+    main()
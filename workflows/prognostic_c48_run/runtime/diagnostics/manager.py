@@ -13,6 +13,7 @@ from typing_extensions import Protocol
 import cftime
 import logging
 import fv3gfs.util
+import numpy as np
 import xarray as xr
 import dataclasses
 
@@ -95,6 +96,40 @@ class ZarrSink:
         self.monitor.store(quantities)
 
 
+class _RunningTotal:
+    """A running total of a DataArray, accumulated in place in a numpy buffer
+
+    The buffer has the floating point dtype of the average, and is reused
+    across averaging intervals. Only the dims, coords and name of the array
+    the total was last reset with are kept, and the average is wrapped in a
+    DataArray with them when requested. Like dividing a DataArray, the average
+    has no attrs.
+    """
+
+    def __init__(self, array: xr.DataArray):
+        self._total = np.empty(0)
+        self.reset(array)
+
+    def reset(self, array: xr.DataArray):
+        # dtype of dividing the array by the number of samples
+        dtype = np.result_type(array.dtype, 1.0)
+        if array.shape == self._total.shape and dtype == self._total.dtype:
+            np.copyto(self._total, array.values)
+        else:
+            self._total = np.array(array.values, dtype=dtype)
+        self._dims = array.dims
+        self._coords = dict(array.coords)
+        self._name = array.name
+
+    def add(self, array: xr.DataArray):
+        np.add(self._total, array.values, out=self._total)
+
+    def average(self, n: int) -> xr.DataArray:
+        return xr.DataArray(
+            self._total / n, dims=self._dims, coords=self._coords, name=self._name,
+        )
+
+
 class DiagnosticFile:
     """A object representing a time averaged diagnostics file
 
@@ -128,7 +163,7 @@ class DiagnosticFile:
         self.times = times
 
         # variables used for averaging
-        self._running_total: Dict[str, xr.DataArray] = {}
+        self._running_total: Dict[str, _RunningTotal] = {}
         self._current_label: Optional[cftime.DatetimeJulian] = None
         self._n = 0
         self._units: Dict[str, str] = {}
@@ -150,7 +185,13 @@ class DiagnosticFile:
                 self._increment_running_average(diagnostics)
 
     def _reset_running_average(self, label, diagnostics):
-        self._running_total = {key: diagnostics[key].copy() for key in self.variables}
+        # reuse the buffers of the previous interval
+        for key in self.variables:
+            array = diagnostics[key]
+            if key in self._running_total:
+                self._running_total[key].reset(array)
+            else:
+                self._running_total[key] = _RunningTotal(array)
         self._current_label = label
         self._n = 1
 
@@ -158,14 +199,17 @@ class DiagnosticFile:
         self._n += 1
         for key in diagnostics:
             if key in self.variables:
-                self._running_total[key] += diagnostics[key]
+                self._running_total[key].add(diagnostics[key])
 
     def flush(self):
         if (
             self._current_label is not None
             and self._last_time_flushed != self._current_label
         ):
-            average = {key: val / self._n for key, val in self._running_total.items()}
+            average = {
+                key: total.average(self._n)
+                for key, total in self._running_total.items()
+            }
             for key in average:
                 average[key].attrs["units"] = self._units[key]
             data_to_sink = {
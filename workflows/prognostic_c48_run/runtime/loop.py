@@ -306,7 +306,7 @@ class TimeLoop(
             local_model_paths = self.comm.bcast(local_model_paths, root=0)
             setattr(ml_config, "model", local_model_paths)
             self._log_info("Model Downloaded From Remote")
-            model = open_model(ml_config)
+            model = open_model(ml_config, timer=self._timer, label=f"ml{step}")
             MPI.COMM_WORLD.barrier()
         self._log_info("Model Loaded")
         return model
@@ -1,6 +1,7 @@
 import jsonschema
 import json
 import os
+import numpy as np
 import xarray as xr
 from typing import Mapping, Optional, Sequence
 
@@ -15,6 +16,17 @@ def validate(obj):
     return jsonschema.validate(obj, SCHEMA)
 
 
+def _reduce_sum(comm, values: Sequence[float]) -> Optional[np.ndarray]:
+    """Sum values over all ranks onto rank 0 with a single buffer-based reduction
+
+    Returns None on other ranks.
+    """
+    sendbuf = np.ascontiguousarray(values, dtype=np.float64)
+    recvbuf = np.empty_like(sendbuf) if comm.rank == 0 else None
+    comm.Reduce(sendbuf, recvbuf, root=0)
+    return recvbuf
+
+
 def global_average(comm, array: xr.DataArray, area: xr.DataArray) -> float:
     ans = comm.reduce((area * array).sum().item(), root=0)
     area_all = comm.reduce(area.sum().item(), root=0)
@@ -37,20 +49,36 @@ def globally_average_2d_diagnostics(
     diagnostics: Mapping[str, xr.DataArray],
     exclude: Optional[Sequence[str]] = None,
 ) -> Mapping[str, float]:
-    averages = {}
     exclude = exclude or []
-    for v in diagnostics:
-        if (set(diagnostics[v].dims) == {"x", "y"}) and (v not in exclude):
-            averages[v] = global_average(comm, diagnostics[v], diagnostics["area"])
-    return averages
+    names = [
+        v
+        for v in diagnostics
+        if (set(diagnostics[v].dims) == {"x", "y"}) and (v not in exclude)
+    ]
+    area = diagnostics["area"]
+    # pack the area-weighted sums and the total area into one reduction
+    local_sums = [(area * diagnostics[v]).sum().item() for v in names]
+    sums = _reduce_sum(comm, local_sums + [area.sum().item()])
+    if sums is None:
+        return {v: -1 for v in names}
+    return {v: float(sums[i] / sums[-1]) for i, v in enumerate(names)}
 
 
 def globally_sum_3d_diagnostics(
     comm, diagnostics: Mapping[str, xr.DataArray], include: Sequence[str],
 ) -> Mapping[str, Sequence[float]]:
-    sums = {}
-    for v in diagnostics:
-        if set(diagnostics[v].dims) == {"x", "y", "z"} and v in include:
-            global_sum = global_horizontal_sum(comm, diagnostics[v])
-            sums[f"{v}_global_sum"] = list(global_sum.astype(float).values)
-    return sums
+    names = [
+        v
+        for v in diagnostics
+        if set(diagnostics[v].dims) == {"x", "y", "z"} and v in include
+    ]
+    # concatenate the horizontal sums of all profiles into one reduction
+    local_sums = [diagnostics[v].astype(float).sum(["x", "y"]).values for v in names]
+    offsets = np.cumsum([0] + [len(local_sum) for local_sum in local_sums])
+    sums = _reduce_sum(comm, np.concatenate(local_sums) if names else [])
+    if sums is None:
+        return {f"{v}_global_sum": [-1.0] for v in names}
+    return {
+        f"{v}_global_sum": list(sums[start:end])
+        for v, start, end in zip(names, offsets[:-1], offsets[1:])
+    }
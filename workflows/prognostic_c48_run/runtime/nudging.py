@@ -1,3 +1,6 @@
+import atexit
+import collections
+import concurrent.futures
 import fv3gfs.util
 from mpi4py import MPI
 import shutil
@@ -82,60 +85,169 @@ def setup_get_reference_state(
     """
     Configure the 'get_reference_function' for use in a nudged fv3gfs run.
     """
-    reference_dir = config.restarts_path
+    initial_time_label = config.reference_initial_time
+    frequency = timedelta(seconds=config.reference_frequency_seconds)
+
+    downloader = _ReferenceDownloader(
+        config.restarts_path,
+        frequency=frequency if initial_time_label is not None else None,
+    )
+    if MPI.COMM_WORLD.rank == 0:
+        atexit.register(downloader.close)
 
     get_reference_state: Callable[[Any], Dict[Any, Any]] = functools.partial(
         _get_reference_state,
-        reference_dir=reference_dir,
+        downloader=downloader,
         communicator=communicator,
         only_names=state_names,
         tracer_metadata=tracer_metadata,
     )
 
-    initial_time_label = config.reference_initial_time
     if initial_time_label is not None:
         get_reference_state = _time_interpolate_func(
             get_reference_state,
             initial_time=_label_to_time(initial_time_label),
-            frequency=timedelta(seconds=config.reference_frequency_seconds),
+            frequency=frequency,
         )
 
     return get_reference_state
 
 
+class _ReferenceDownloader:
+    """Download reference restart directories ahead of when they are needed
+
+    Each requested label is downloaded to its own directory under ``localdir``.
+    After every request, the reference for the next time is downloaded on a
+    background thread while the model integrates. The ``max_dirs`` most
+    recently used directories are kept on disk, and older ones are deleted by
+    :py:meth:`evict`.
+
+    Only one rank should use a downloader, since it does not synchronize with
+    other ranks.
+
+    Args:
+        reference_dir: local or remote directory of reference restart
+            directories, one per time label
+        frequency: spacing of the reference times. If not given, the spacing
+            of the two most recent requests is used.
+        localdir: local directory to download to
+        max_dirs: number of downloaded directories to keep, at least 2 so
+            that a prefetch never evicts the directory currently in use
+    """
+
+    def __init__(
+        self,
+        reference_dir: str,
+        frequency: Optional[timedelta] = None,
+        localdir: str = "download",
+        max_dirs: int = 2,
+    ):
+        if max_dirs < 2:
+            raise ValueError(f"max_dirs must be at least 2, got {max_dirs}.")
+        self.reference_dir = reference_dir
+        self.frequency = frequency
+        self.localdir = localdir
+        self.max_dirs = max_dirs
+        self._last_time: Optional[cftime.DatetimeJulian] = None
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._downloads: "collections.OrderedDict[str, concurrent.futures.Future]" = (
+            collections.OrderedDict()
+        )
+
+    def local_path(self, label: str) -> str:
+        return os.path.join(self.localdir, label)
+
+    def _download(self, label: str) -> str:
+        dirname = os.path.join(self.reference_dir, label)
+        fs = fsspec.get_fs_token_paths(dirname)[0]
+        fs.get(dirname, self.local_path(label), recursive=True)
+        return self.local_path(label)
+
+    def _submit(self, label: str) -> concurrent.futures.Future:
+        if label not in self._downloads:
+            self._downloads[label] = self._executor.submit(self._download, label)
+        return self._downloads[label]
+
+    def _next_time(
+        self, time: cftime.DatetimeJulian
+    ) -> Optional[cftime.DatetimeJulian]:
+        if self.frequency is not None:
+            return time + self.frequency
+        elif self._last_time is not None and time > self._last_time:
+            return time + (time - self._last_time)
+        else:
+            return None
+
+    def get(self, time: cftime.DatetimeJulian) -> str:
+        """Return the local directory of the reference at ``time``, waiting for
+        its download if needed, and start prefetching the following time"""
+        label = _time_to_label(time)
+        future = self._submit(label)
+        self._downloads.move_to_end(label)
+        try:
+            path = future.result()
+        except Exception:
+            logger.warning(
+                f"Prefetching reference {label} failed, retrying.", exc_info=True
+            )
+            shutil.rmtree(self.local_path(label), ignore_errors=True)
+            future = concurrent.futures.Future()
+            future.set_result(self._download(label))
+            self._downloads[label] = future
+            path = future.result()
+
+        next_time = self._next_time(time)
+        self._last_time = time
+        if next_time is not None:
+            self._submit(_time_to_label(next_time))
+        return path
+
+    def evict(self):
+        """Delete the least recently used directories beyond ``max_dirs``
+
+        Must only be called once no rank is reading from those directories.
+        """
+        while len(self._downloads) > self.max_dirs:
+            label, future = self._downloads.popitem(last=False)
+            # wait for an unused prefetch to finish before deleting its output
+            future.exception()
+            shutil.rmtree(self.local_path(label), ignore_errors=True)
+
+    def close(self):
+        """Wait for any prefetch in progress and delete all downloaded data"""
+        self._executor.shutdown(wait=True)
+        for label in self._downloads:
+            shutil.rmtree(self.local_path(label), ignore_errors=True)
+        self._downloads.clear()
+
+
 def _get_reference_state(
-    time: str,
-    reference_dir: str,
+    time: cftime.DatetimeJulian,
+    downloader: _ReferenceDownloader,
     communicator: fv3gfs.util.CubedSphereCommunicator,
     only_names: Iterable[str],
     tracer_metadata: Mapping,
 ):
     label = _time_to_label(time)
-    dirname = os.path.join(reference_dir, label)
-
-    localdir = "download"
 
     if MPI.COMM_WORLD.rank == 0:
-        fs = fsspec.get_fs_token_paths(dirname)[0]
-        fs.get(dirname, localdir, recursive=True)
+        downloader.get(time)
 
     # need this for synchronization
     MPI.COMM_WORLD.barrier()
 
+    # every rank has finished opening earlier references by now
+    if MPI.COMM_WORLD.rank == 0:
+        downloader.evict()
+
     state = fv3gfs.util.open_restart(
-        localdir,
+        downloader.local_path(label),
         communicator,
         label=label,
         only_names=only_names,
         tracer_properties=tracer_metadata,
     )
 
-    # clean up the local directory
-    # wait for other processes to finish using the data
-    MPI.COMM_WORLD.barrier()
-    if MPI.COMM_WORLD.rank == 0:
-        shutil.rmtree(localdir)
-
     return _to_state_dataarrays(state)
 
 
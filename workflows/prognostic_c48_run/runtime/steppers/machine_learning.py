@@ -1,11 +1,24 @@
 """Code for machine Learning in prognostic runs
 """
+import contextlib
 import dataclasses
 import logging
 import os
-from typing import Hashable, Iterable, Mapping, Sequence, Set, Tuple, cast
+from typing import (
+    Hashable,
+    Iterable,
+    MutableMapping,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    cast,
+)
 
 import fv3fit
+import fv3gfs.util
+import numpy as np
 import xarray as xr
 from runtime.diagnostics import compute_diagnostics, compute_ml_momentum_diagnostics
 from runtime.names import DELP, SPHUM, is_state_update_variable
@@ -115,23 +128,83 @@ class RenamingAdapter:
         return self._rename_outputs(prediction)
 
 
+def _columns_contiguous(ds: xr.Dataset, feature_dim: Optional[Hashable]) -> xr.Dataset:
+    """Copy every variable once into C-ordered memory with feature_dim last, so
+    stacking its columns into [sample, feature] arrays is a view"""
+    if feature_dim is not None:
+        ds = ds.transpose(..., feature_dim)
+    return xr.Dataset(
+        {
+            name: array.copy(data=np.ascontiguousarray(array.values))
+            for name, array in ds.data_vars.items()
+        }
+    )
+
+
+def _transpose_like(array: xr.DataArray, ds: xr.Dataset) -> xr.DataArray:
+    """Order the dims of array as they appear in the variables of ds, followed
+    by any dims not in ds"""
+    order = []
+    for variable in ds.data_vars.values():
+        order.extend(dim for dim in variable.dims if dim not in order)
+    return array.transpose(*[dim for dim in order if dim in array.dims], ...)
+
+
 class MultiModelAdapter:
-    def __init__(self, models: Iterable[RenamingAdapter]):
+    """Predict with several models sharing one copy of their inputs
+
+    Attributes:
+        models: models to predict with
+        timer: if given, the time spent in each model is recorded under
+            ``{label}_{i}`` for the i-th model
+        label: prefix of the timer names
+    """
+
+    def __init__(
+        self,
+        models: Iterable[RenamingAdapter],
+        timer: Optional[fv3gfs.util.Timer] = None,
+        label: str = "model",
+    ):
         self.models = models
+        self.timer = timer
+        self.label = label
 
     @property
     def input_variables(self) -> Set[str]:
         vars = [model.input_variables for model in self.models]
         return {var for model_vars in vars for var in model_vars}
 
+    def _clock(self, i: int):
+        if self.timer is None:
+            return contextlib.nullcontext()
+        return self.timer.clock(f"{self.label}_{i}")
+
     def predict_columnwise(self, arg: xr.Dataset, **kwargs) -> xr.Dataset:
-        predictions = []
-        for model in self.models:
-            predictions.append(model.predict_columnwise(arg, **kwargs))
-        return xr.merge(predictions)
+        inputs = _columns_contiguous(
+            arg[sorted(self.input_variables)], kwargs.get("feature_dim")
+        )
+        outputs: MutableMapping[Hashable, xr.DataArray] = {}
+        for i, model in enumerate(self.models):
+            with self._clock(i):
+                prediction = model.predict_columnwise(inputs, **kwargs)
+            for name, array in prediction.data_vars.items():
+                if name in outputs and not outputs[name].equals(array):
+                    raise xr.MergeError(
+                        f"Conflicting predictions of {name} by multiple models."
+                    )
+                outputs[name] = array
+        # inputs were transposed, so restore the dims order of the state
+        return xr.Dataset(
+            {name: _transpose_like(array, arg) for name, array in outputs.items()}
+        )
 
 
-def open_model(config: MachineLearningConfig) -> MultiModelAdapter:
+def open_model(
+    config: MachineLearningConfig,
+    timer: Optional[fv3gfs.util.Timer] = None,
+    label: str = "model",
+) -> MultiModelAdapter:
     model_paths = config.model
     models = []
     for path in model_paths:
@@ -139,7 +212,7 @@ def open_model(config: MachineLearningConfig) -> MultiModelAdapter:
         rename_in = config.input_standard_names
         rename_out = config.output_standard_names
         models.append(RenamingAdapter(model, rename_in, rename_out))
-    return MultiModelAdapter(models)
+    return MultiModelAdapter(models, timer=timer, label=label)
 
 
 def download_model(config: MachineLearningConfig, path: str) -> Sequence[str]:
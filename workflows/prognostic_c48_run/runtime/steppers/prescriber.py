@@ -1,4 +1,7 @@
-from typing import Sequence, Tuple, Optional
+from typing import MutableMapping, Sequence, Tuple, Optional
+import bisect
+import collections
+import concurrent.futures
 import dataclasses
 from datetime import timedelta
 import logging
@@ -48,6 +51,10 @@ class PrescriberConfig:
         variables (Sequence[str]): sequence of variable names in the dataset to prescribe
         consolidated (bool): optional, whether desired dataset has consolidated metadata;
             defaults to True
+        streaming (bool): optional, if True load and interpolate the prescribed
+            values one timestep at a time, keeping only the source times needed
+            for the current timestep in memory, rather than loading all timesteps
+            at startup; defaults to False
 
     Example::
 
@@ -65,6 +72,7 @@ class PrescriberConfig:
     dataset_key: str
     variables: Sequence[str]
     consolidated: bool = True
+    streaming: bool = False
 
 
 class Prescriber:
@@ -89,10 +97,23 @@ class Prescriber:
         self._config = config
         self._communicator = communicator
         self._timesteps = timesteps
-        prescribed_ds, time_coord = self._load_prescribed_ds()
-        self._prescribed_ds: xr.Dataset = self._scatter_prescribed_ds(
-            prescribed_ds, time_coord
-        )
+        if config.streaming:
+            self._stream: Optional[_PrescribedStream] = self._open_stream()
+        else:
+            prescribed_ds, time_coord = self._load_prescribed_ds()
+            self._prescribed_ds: xr.Dataset = self._scatter_prescribed_ds(
+                prescribed_ds, time_coord
+            )
+
+    def _open_stream(self) -> Optional["_PrescribedStream"]:
+        if self._communicator.rank == 0:
+            logger.info(f"Streaming prescribed dataset: {self._config.dataset_key}")
+            ds = _open_ds(self._config.dataset_key, self._config.consolidated)
+            return _PrescribedStream(
+                get_variables(ds, list(self._config.variables)), self._timesteps
+            )
+        else:
+            return None
 
     def _load_prescribed_ds(
         self,
@@ -125,9 +146,20 @@ class Prescriber:
         scattered_ds = scattered_ds.assign_coords({"time": time_coord})
         return scattered_ds
 
+    def _get_prescribed_timestep(self, time: cftime.DatetimeJulian) -> xr.Dataset:
+        if not self._config.streaming:
+            return self._prescribed_ds.sel(time=time)
+        if self._stream is not None:
+            scattered = self._communicator.scatter_state(
+                dataset_to_quantity_state(self._stream.get(time))
+            )
+        else:
+            scattered = self._communicator.scatter_state()
+        return quantity_state_to_dataset(scattered)
+
     def __call__(self, time, state):
         diagnostics: Diagnostics = {}
-        prescribed_timestep: xr.Dataset = self._prescribed_ds.sel(time=time)
+        prescribed_timestep: xr.Dataset = self._get_prescribed_timestep(time)
         state_updates: State = {}
         for name in prescribed_timestep.data_vars:
             if name == SST:
@@ -151,6 +183,88 @@ class Prescriber:
         return {}
 
 
+class _PrescribedStream:
+    """Interpolate a lazily opened dataset to one time at a time
+
+    Only the source times bracketing the most recent requests are kept in
+    memory. After each request the values for the following time are loaded
+    on a background thread, so they are usually ready when needed.
+
+    Args:
+        ds: dataset with a "time" dimension, typically backed by dask
+        timesteps: times which will be requested, in order; if not given,
+            the source times are assumed to be requested in order
+        window_size: number of most recently used source times to keep in
+            memory, at least 2 for interpolation
+    """
+
+    def __init__(
+        self,
+        ds: xr.Dataset,
+        timesteps: Optional[Sequence[cftime.DatetimeJulian]] = None,
+        window_size: int = 2,
+    ):
+        self._ds = ds
+        self._source_times = list(ds.indexes["time"])
+        self._timesteps = list(timesteps) if timesteps is not None else None
+        self._window_size = window_size
+        self._window: "collections.OrderedDict[int, xr.Dataset]" = (
+            collections.OrderedDict()
+        )
+        # a single worker serializes all access to the window
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._prefetched: MutableMapping[
+            cftime.DatetimeJulian, concurrent.futures.Future
+        ] = {}
+
+    def _load_source_time(self, index: int) -> xr.Dataset:
+        if index not in self._window:
+            self._window[index] = (
+                self._ds.isel(time=index).drop_vars(names="time").load()
+            )
+            while len(self._window) > self._window_size:
+                self._window.popitem(last=False)
+        self._window.move_to_end(index)
+        return self._window[index]
+
+    def _interpolate(self, time: cftime.DatetimeJulian) -> xr.Dataset:
+        index = bisect.bisect_left(self._source_times, time)
+        if index < len(self._source_times) and self._source_times[index] == time:
+            return self._load_source_time(index)
+        if index == 0 or index == len(self._source_times):
+            raise ValueError(
+                f"Time {time} is outside the range of prescribed times "
+                f"{self._source_times[0]} to {self._source_times[-1]}."
+            )
+        begin, end = self._source_times[index - 1], self._source_times[index]
+        weight = (end - time) / (end - begin)
+        ds_0 = self._load_source_time(index - 1)
+        ds_1 = self._load_source_time(index)
+        with xr.set_options(keep_attrs=True):
+            return ds_0 * weight + ds_1 * (1 - weight)
+
+    def _next_time(
+        self, time: cftime.DatetimeJulian
+    ) -> Optional[cftime.DatetimeJulian]:
+        times = self._timesteps if self._timesteps is not None else self._source_times
+        index = bisect.bisect_right(times, time)
+        return times[index] if index < len(times) else None
+
+    def get(self, time: cftime.DatetimeJulian) -> xr.Dataset:
+        """Return the prescribed values at time and start loading those at the
+        following time"""
+        future = self._prefetched.pop(time, None)
+        if future is None:
+            future = self._executor.submit(self._interpolate, time)
+        self._prefetched.clear()
+        next_time = self._next_time(time)
+        if next_time is not None:
+            self._prefetched[next_time] = self._executor.submit(
+                self._interpolate, next_time
+            )
+        return future.result()
+
+
 def _get_prescribed_ds(
     dataset_key: str,
     variables: Sequence[str],
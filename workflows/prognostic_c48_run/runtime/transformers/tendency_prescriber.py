@@ -1,6 +1,8 @@
+import concurrent.futures
 import dataclasses
+from datetime import timedelta
 import logging
-from typing import Hashable, Mapping, MutableMapping, Set
+from typing import Dict, Hashable, Mapping, MutableMapping, Set
 
 import cftime
 import xarray as xr
@@ -11,7 +13,6 @@ import vcm
 from runtime.monitor import Monitor
 from runtime.types import Diagnostics, Step
 from runtime.derived_state import DerivedFV3State
-from runtime.conversions import quantity_state_to_dataset, dataset_to_quantity_state
 
 QuantityState = MutableMapping[Hashable, fv3gfs.util.Quantity]
 
@@ -26,10 +27,13 @@ class TendencyPrescriberConfig:
         mapper_config: configuration of mapper used to load tendency data.
         variables: mapping from state name to name of corresponding tendency in
             provided mapper. For example: {"air_temperature": "fine_res_Q1"}.
+        prefetch: whether to read the tendencies for the next timestep in the
+            background while the current timestep is computed.
     """
 
     mapper_config: loaders.MapperConfig
     variables: Mapping[str, str]
+    prefetch: bool = False
 
 
 @dataclasses.dataclass
@@ -48,15 +52,34 @@ class TendencyPrescriber:
         self._mapper = self.config.mapper_config.load_mapper()
         self._tendency_names = list(self.config.variables.values())
         self._tile = self.communicator.partitioner.tile_index(self.communicator.rank)
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._prefetched: Dict[cftime.DatetimeJulian, concurrent.futures.Future] = {}
 
-    def _open_tendencies_dataset(self, time: cftime.DatetimeJulian) -> xr.Dataset:
+    def _subdomain(self, da: xr.DataArray) -> xr.DataArray:
+        subtile_slice = self.communicator.tile.partitioner.subtile_slice(
+            self.communicator.tile.rank, da.dims, da.shape, overlap=True
+        )
+        return da[subtile_slice]
+
+    def _read_tendencies(self, time: cftime.DatetimeJulian) -> xr.Dataset:
+        # every rank reads only its own subdomain, so no scatter is needed
         timestamp = vcm.encode_time(time)
-        tile = self.communicator.partitioner.tile_index(self.communicator.rank)
-        ds = xr.Dataset()
-        if self.communicator.tile.rank == 0:
-            ds = self._mapper[timestamp].isel(tile=tile)[self._tendency_names].load()
-        tendencies = self.communicator.tile.scatter_state(dataset_to_quantity_state(ds))
-        return quantity_state_to_dataset(tendencies)
+        ds = self._mapper[timestamp].isel(tile=self._tile)[self._tendency_names]
+        ds = ds.drop_vars(list(ds.coords))
+        return ds.map(self._subdomain).load()
+
+    def _open_tendencies_dataset(self, time: cftime.DatetimeJulian) -> xr.Dataset:
+        future = self._prefetched.pop(time, None)
+        self._prefetched.clear()
+        if self.config.prefetch:
+            next_time = time + timedelta(seconds=self.timestep)
+            self._prefetched[next_time] = self._executor.submit(
+                self._read_tendencies, next_time
+            )
+        if future is None:
+            return self._read_tendencies(time)
+        else:
+            return future.result()
 
     @property
     def monitor(self) -> Monitor:
@@ -1,4 +1,5 @@
 from runtime.steppers.machine_learning import RenamingAdapter, MultiModelAdapter
+import fv3gfs.util
 import xarray as xr
 import numpy as np
 import pytest
@@ -80,3 +81,49 @@ def test_MultiModelAdapter_exception_on_output_overlap():
     combined_model = MultiModelAdapter([model0, model1])
     with pytest.raises(xr.MergeError):
         combined_model.predict_columnwise(ds)
+
+
+class InputRecordingPredictor(MockPredictor):
+    def predict_columnwise(self, x, **kwargs):
+        self.inputs = x
+        return super().predict_columnwise(x)
+
+
+def test_MultiModelAdapter_shares_contiguous_inputs():
+    ds = xr.Dataset({"x": (["z", "y"], np.ones((5, 10)))})
+    model0 = InputRecordingPredictor(output_variables=["y0"], input_variables=["x"])
+    model1 = InputRecordingPredictor(output_variables=["y1"], input_variables=["x"])
+    combined_model = MultiModelAdapter([model0, model1])
+    combined_model.predict_columnwise(ds, feature_dim="z")
+
+    input0, input1 = model0.inputs["x"], model1.inputs["x"]
+    assert input0.dims == ("y", "z")
+    assert input0.values.flags["C_CONTIGUOUS"]
+    assert np.shares_memory(input0.values, input1.values)
+
+
+def test_MultiModelAdapter_outputs_have_input_dims():
+    ds = xr.Dataset(
+        {
+            "a": (["z", "y", "x"], np.arange(24.0).reshape(2, 3, 4)),
+            "b": (["y", "x"], np.ones((3, 4))),
+        }
+    )
+    model0 = InputRecordingPredictor(output_variables=["y0"], input_variables=["a"])
+    model1 = InputRecordingPredictor(output_variables=["y1"], input_variables=["b"])
+    combined_model = MultiModelAdapter([model0, model1])
+    out = combined_model.predict_columnwise(ds, feature_dim="z")
+
+    assert out["y0"].dims == ds["a"].dims
+    assert out["y1"].dims == ds["b"].dims
+    xr.testing.assert_equal(out["y0"], ds["a"])
+
+
+def test_MultiModelAdapter_clocks_each_model():
+    ds = xr.Dataset({"x": (["dim_0", "dim_1"], np.ones((5, 10)))})
+    model0 = MockPredictor(output_variables=["y0"], input_variables=["x"])
+    model1 = MockPredictor(output_variables=["y1"], input_variables=["x"])
+    timer = fv3gfs.util.Timer()
+    combined_model = MultiModelAdapter([model0, model1], timer=timer, label="ml")
+    combined_model.predict_columnwise(ds)
+    assert set(timer.times) == {"ml_0", "ml_1"}
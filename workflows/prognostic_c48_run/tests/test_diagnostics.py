@@ -4,6 +4,7 @@ from unittest.mock import Mock
 import cftime
 
 import fv3config
+import numpy as np
 import pytest
 import xarray as xr
 
@@ -422,3 +423,46 @@ def test_DiagnosticFileConfig(config, sinktype):
     )
 
     assert isinstance(diag_file._sink, sinktype)
+
+
+def test_DiagnosticFile_average_keeps_metadata():
+    t = datetime(2000, 1, 1)
+    coords = {"x": [10, 20]}
+    attrs = {"units": "K", "long_name": "a"}
+    diagnostics = [
+        {
+            "a": xr.DataArray(
+                np.array([1.0, 2.0], dtype=np.float32) * i,
+                dims=["x"],
+                coords=coords,
+                attrs=attrs,
+            ),
+            "b": xr.DataArray(np.array([i, 2 * i]), dims=["x"], coords=coords),
+        }
+        for i in range(1, 5)
+    ]
+
+    class MockSink:
+        data = {}
+
+        def sink(self, time, x):
+            self.data[time] = x
+
+    sink = MockSink()
+    times = IntervalAveragedTimes(timedelta(hours=2), t, includes_lower=True)
+    diag_file = DiagnosticFile(times=times, variables=["a", "b"], sink=sink)
+    for i, x in enumerate(diagnostics):
+        diag_file.observe(t + timedelta(hours=i), x)
+    diag_file.flush()
+
+    assert len(sink.data) == 2
+    for interval, first in zip(sorted(sink.data), [1, 3]):
+        a, b = sink.data[interval]["a"], sink.data[interval]["b"]
+        expected = (diagnostics[first - 1]["a"] + diagnostics[first]["a"]) / 2
+        xr.testing.assert_allclose(a, expected)
+        assert a.dtype == np.float32
+        # only the units are kept
+        assert a.attrs == {"units": "K"}
+        np.testing.assert_allclose(b, [first + 0.5, 2 * first + 1])
+        assert b.dtype == np.float64
+        assert b.attrs == {"units": "unknown"}
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+import xarray as xr
+
+from runtime.metrics import (
+    global_average,
+    global_horizontal_sum,
+    globally_average_2d_diagnostics,
+    globally_sum_3d_diagnostics,
+)
+
+
+class SerialComm:
+    """A single-rank stand-in for an mpi4py communicator"""
+
+    def __init__(self, rank=0):
+        self.rank = rank
+
+    def reduce(self, obj, root=0):
+        return obj
+
+    def Reduce(self, sendbuf, recvbuf, root=0):
+        if self.rank == root:
+            recvbuf[:] = sendbuf
+
+
+@pytest.fixture
+def diagnostics():
+    rng = np.random.RandomState(0)
+    return {
+        "area": xr.DataArray(rng.uniform(size=(4, 4)), dims=["y", "x"]),
+        "a": xr.DataArray(rng.normal(size=(4, 4)), dims=["y", "x"]),
+        "b": xr.DataArray(rng.normal(size=(4, 4)).astype(np.float32), dims=["y", "x"]),
+        "c": xr.DataArray(rng.normal(size=(3, 4, 4)), dims=["z", "y", "x"]),
+        "d": xr.DataArray(rng.normal(size=(2, 4, 4)), dims=["z", "y", "x"]),
+    }
+
+
+def test_globally_average_2d_diagnostics(diagnostics):
+    comm = SerialComm()
+    averages = globally_average_2d_diagnostics(comm, diagnostics, exclude=["b"])
+    assert set(averages) == {"area", "a"}
+    for v, average in averages.items():
+        expected = global_average(comm, diagnostics[v], diagnostics["area"])
+        assert average == pytest.approx(expected)
+
+
+def test_globally_sum_3d_diagnostics(diagnostics):
+    comm = SerialComm()
+    sums = globally_sum_3d_diagnostics(comm, diagnostics, ["c", "d"])
+    assert set(sums) == {"c_global_sum", "d_global_sum"}
+    for v in ["c", "d"]:
+        expected = global_horizontal_sum(comm, diagnostics[v])
+        np.testing.assert_allclose(sums[f"{v}_global_sum"], expected.values)
+
+
+def test_global_statistics_are_placeholders_off_root(diagnostics):
+    comm = SerialComm(rank=1)
+    averages = globally_average_2d_diagnostics(comm, diagnostics)
+    sums = globally_sum_3d_diagnostics(comm, diagnostics, ["c"])
+    assert averages == {"area": -1, "a": -1, "b": -1}
+    assert sums == {"c_global_sum": [-1.0]}
@@ -1,5 +1,6 @@
 from runtime.names import STATE_NAME_TO_TENDENCY, TENDENCY_TO_STATE_NAME
 from runtime.nudging import (
+    _ReferenceDownloader,
     _time_interpolate_func,
     _time_to_label,
     _label_to_time,
@@ -11,6 +12,7 @@ import pytest
 import numpy as np
 import cftime
 import copy
+import os
 
 
 @pytest.mark.parametrize("fraction", [0, 0.25, 0.5, 0.75, 1])
@@ -64,6 +66,37 @@ def test__label_to_time():
     assert result == time
 
 
+@pytest.mark.parametrize("frequency", [timedelta(hours=1), None])
+def test__ReferenceDownloader(tmpdir, frequency):
+    initial_time = cftime.DatetimeJulian(2016, 1, 1)
+    times = [initial_time + timedelta(hours=i) for i in range(4)]
+    for time in times:
+        label = _time_to_label(time)
+        tmpdir.join("reference", label, f"{label}.fv_core.res.nc").write(
+            label, ensure=True
+        )
+
+    localdir = tmpdir.join("download")
+    downloader = _ReferenceDownloader(
+        str(tmpdir.join("reference")), frequency, localdir=str(localdir)
+    )
+
+    for time in times[:3]:
+        label = _time_to_label(time)
+        path = downloader.get(time)
+        assert path == downloader.local_path(label)
+        assert localdir.join(label, f"{label}.fv_core.res.nc").read() == label
+        downloader.evict()
+
+    # the requested time and the prefetched next time stay on disk
+    downloader._executor.shutdown(wait=True)
+    expected = [_time_to_label(time) for time in times[2:]]
+    assert sorted(os.listdir(localdir)) == expected
+
+    downloader.close()
+    assert os.listdir(localdir) == []
+
+
 # tests of nudging tendency below adapted from fv3gfs.util versions
 
 
@@ -3,6 +3,7 @@ from runtime.steppers.prescriber import (
     Prescriber,
     get_timesteps,
     _sst_from_reference,
+    _PrescribedStream,
 )
 from fv3gfs.util.testing import DummyComm
 import fv3gfs.util
@@ -79,7 +80,7 @@ def external_dataset_path(tmpdir_factory):
     return path
 
 
-def get_prescriber_config(external_dataset_path):
+def get_prescriber_config(external_dataset_path, streaming=False):
     return PrescriberConfig(
         dataset_key=external_dataset_path,
         variables=[
@@ -87,6 +88,7 @@ def get_prescriber_config(external_dataset_path):
             "override_for_time_adjusted_total_sky_net_shortwave_flux_at_surface",
             "override_for_time_adjusted_total_sky_downward_longwave_flux_at_surface",
         ],
+        streaming=streaming,
     )
 
 
@@ -109,12 +111,17 @@ def get_communicators(layout):
     return communicator_list
 
 
-def get_prescribers(external_dataset_path, layout):
+@pytest.fixture(params=[False, True], scope="module")
+def streaming(request):
+    return request.param
+
+
+def get_prescribers(external_dataset_path, layout, streaming):
     communicator_list = get_communicators(layout)
     prescriber_list = []
     for communicator in communicator_list:
         prescriber = Prescriber(
-            config=get_prescriber_config(external_dataset_path),
+            config=get_prescriber_config(external_dataset_path, streaming),
             communicator=communicator,
         )
         prescriber_list.append(prescriber)
@@ -122,8 +129,8 @@ def get_prescribers(external_dataset_path, layout):
 
 
 @pytest.fixture(scope="module")
-def prescriber_output(external_dataset_path, layout):
-    prescriber_list = get_prescribers(external_dataset_path, layout)
+def prescriber_output(external_dataset_path, layout, streaming):
+    prescriber_list = get_prescribers(external_dataset_path, layout, streaming)
     state_updates_list, tendencies_list = [], []
     for prescriber in prescriber_list:
         tendencies, _, state_updates = prescriber(TIME_COORD[0], {})
@@ -161,6 +168,32 @@ def test_no_tendencies(prescriber_output):
         assert not tendencies
 
 
+def test__PrescribedStream_matches_interp():
+    source_times = [init_time, time_3, time_5]
+    ds = xr.Dataset(
+        {"a": (["time", "x"], np.arange(6.0).reshape(3, 2) ** 2, {"units": "m"})},
+        coords={"time": source_times},
+    )
+    timesteps = get_timesteps(init_time, 900.0, 4)
+    stream = _PrescribedStream(ds.chunk({"time": 1}), timesteps)
+
+    for time in timesteps:
+        expected = ds.interp(time=time).drop_vars("time")
+        result = stream.get(time)
+        xr.testing.assert_allclose(result, expected)
+        assert result["a"].attrs == {"units": "m"}
+        assert len(stream._window) <= 2
+
+
+def test__PrescribedStream_outside_range_raises():
+    ds = xr.Dataset(
+        {"a": (["time", "x"], np.zeros((2, 2)))}, coords={"time": [time_2, time_3]}
+    )
+    stream = _PrescribedStream(ds)
+    with pytest.raises(ValueError):
+        stream.get(time_4)
+
+
 def test__sst_from_reference():
     land_sea_mask = xr.DataArray(
         np.array([0.0, 1.0, 2.0]), dims=["x"], attrs={"units": None}
@@ -4,6 +4,7 @@ import cftime
 import numpy as np
 import xarray as xr
 import dacite
+import loaders
 
 import fv3gfs.util
 from fv3gfs.util.testing import DummyComm
@@ -99,3 +100,51 @@ def test_tendency_prescriber(state, tmpdir, regtest):
     )
     for variable in sorted(diags):
         print(variable, joblib.hash(diags[variable].values), file=regtest)
+
+
+def test_tendency_prescriber_reads_subdomains(tmpdir):
+    time = cftime.DatetimeJulian(2016, 8, 1)
+    layout = (2, 2)
+    path = str(tmpdir.join("tendencies.zarr"))
+    tendencies = _get_tendencies(time)
+    q1 = tendencies.Q1
+    tendencies["Q1"] = q1.copy(data=np.arange(q1.size).reshape(q1.shape))
+    tendencies.to_zarr(path, consolidated=True)
+    config = TendencyPrescriberConfig(
+        mapper_config=loaders.MapperConfig(
+            function="open_zarr", kwargs={"data_path": path}
+        ),
+        variables={"air_temperature": "Q1"},
+        prefetch=True,
+    )
+    total_ranks = 6 * layout[0] * layout[1]
+    partitioner = fv3gfs.util.CubedSpherePartitioner(
+        fv3gfs.util.TilePartitioner(layout)
+    )
+    prescribers = [
+        TendencyPrescriber(
+            config,
+            MockDerivedState(xr.Dataset(), time),
+            fv3gfs.util.CubedSphereCommunicator(
+                DummyComm(rank, total_ranks, {}), partitioner
+            ),
+            timestep=900,
+        )
+        for rank in range(total_ranks)
+    ]
+
+    for step in range(2):
+        step_time = time + timedelta(seconds=900 * step)
+        subdomains = [
+            prescriber._open_tendencies_dataset(step_time).Q1
+            for prescriber in prescribers
+        ]
+        for rank, subdomain in enumerate(subdomains):
+            tile, tile_rank = divmod(rank, partitioner.tile.total_ranks)
+            expected = tendencies.Q1.isel(tile=tile, time=step)
+            subtile_slice = partitioner.tile.subtile_slice(
+                tile_rank, expected.dims, expected.shape, overlap=True
+            )
+            assert subdomain.dims == ("z", "y", "x")
+            assert subdomain.shape == (63, 2, 2)
+            np.testing.assert_array_equal(subdomain, expected[subtile_slice])